@@ -0,0 +1,74 @@
+"""Time browser fallback navigations with and without resource blocking.
+
+Run from the repository root after ``playwright install chromium``:
+
+    python benchmarks/browser_navigation.py https://www.zhihu.com/question/19550225
+
+Each mode uses a fresh temporary profile, loads every URL ``--repeats``
+times in headless Chromium, and prints the mean time per page together
+with the number of requests that blocking refused. Both modes must yield
+the same initial-state entity for the comparison to count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from zhihu_scraper.browser import BrowserFallback
+from zhihu_scraper.source import extract_entity_payload
+from zhihu_scraper.urls import route_zhihu_url
+
+_COLLECTIONS = {
+    "article": "articles",
+    "answer": "answers",
+    "question": "questions",
+    "column": "columns",
+    "video": "zvideos",
+}
+
+
+def measure(urls: list[str], *, block_resources: bool, repeats: int) -> dict[str, object]:
+    payloads: dict[str, object] = {}
+    with tempfile.TemporaryDirectory() as profile:
+        with BrowserFallback(
+            profile_dir=Path(profile),
+            headless=True,
+            block_resources=block_resources,
+        ) as browser:
+            for _ in range(repeats):
+                for url in urls:
+                    target = route_zhihu_url(url)
+                    payloads[url] = extract_entity_payload(
+                        browser.fetch_html(url),
+                        collection=_COLLECTIONS[target.kind.value],
+                        entity_id=target.content_id,
+                    ).get("id")
+            stats = browser.navigation_stats()
+    label = "blocked" if block_resources else "full"
+    print(
+        f"{label}: {stats.pages} pages | "
+        f"mean {(stats.mean_seconds or 0.0) * 1000:.0f} ms | "
+        f"{stats.blocked_requests} requests refused"
+    )
+    return payloads
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("urls", nargs="+", help="public Zhihu page URLs")
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args(argv)
+
+    full = measure(arguments.urls, block_resources=False, repeats=arguments.repeats)
+    blocked = measure(arguments.urls, block_resources=True, repeats=arguments.repeats)
+    if full != blocked:
+        print("payloads differ between modes", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Compare initial-state extraction paths on large Zhihu pages.
+
+Run from the repository root:
+
+    python benchmarks/initial_state.py
+    python benchmarks/initial_state.py saved-question.html saved-column.html
+
+Without arguments it builds a synthetic question page shaped like Zhihu's:
+several megabytes of markup around one ``js-initialData`` script that holds
+hundreds of answers. Saved pages are read as UTF-8 and searched for their
+first ``answers`` entity.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from zhihu_scraper import source
+from zhihu_scraper.source import extract_entity_payload
+
+
+def synthetic_page(answer_count: int = 400, filler_blocks: int = 20_000) -> str:
+    answers = {
+        str(index): {
+            "id": index,
+            "content": "<p>" + '知乎回答正文，含有 {括号} 与 "引号"。' * 60 + "</p>",
+            "author": {"id": f"author-{index}", "name": f"作者{index}"},
+            "voteupCount": index * 3,
+        }
+        for index in range(1, answer_count + 1)
+    }
+    state = {"initialState": {"entities": {"answers": answers, "questions": {}}}}
+    filler = '<div class="List-item"><span data-za="{&quot;a&quot;:1}">占位</span></div>'
+    return (
+        "<!doctype html><html><head><title>问题</title></head><body>"
+        + filler * filler_blocks
+        + '<script id="js-initialData" type="text/json">'
+        + json.dumps(state, ensure_ascii=False)
+        + "</script></body></html>"
+    )
+
+
+def first_answer_id(document: str) -> str:
+    states = source._fast_initial_states(document) or source._legacy_initial_states(document)
+    for state in states:
+        entities = state.get("initialState", {}).get("entities", {})  # type: ignore[union-attr]
+        answers = entities.get("answers") or {}
+        if answers:
+            return str(next(iter(answers)))
+    raise SystemExit("no answers entity found in the page")
+
+
+def best_of(repeats: int, call: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return min(timings) if repeats < 3 else statistics.median(timings)
+
+
+def measure(label: str, document: str, repeats: int) -> None:
+    answer_id = first_answer_id(document)
+    lookups = 5
+
+    def legacy() -> None:
+        # The previous extractor re-parsed the page for every lookup.
+        for _ in range(lookups):
+            for state in source._legacy_initial_states(document):
+                source._find_entity(state, "answers", answer_id)
+
+    def fast() -> None:
+        source.forget_initial_states()
+        for _ in range(lookups):
+            extract_entity_payload(document, collection="answers", entity_id=answer_id)
+
+    legacy_seconds = best_of(repeats, legacy)
+    fast_seconds = best_of(repeats, fast)
+    size = len(document.encode("utf-8")) / 1024 / 1024
+    print(
+        f"{label}: {size:.1f} MiB, {lookups} lookups | "
+        f"legacy {legacy_seconds * 1000:.1f} ms | "
+        f"fast {fast_seconds * 1000:.1f} ms | "
+        f"{legacy_seconds / fast_seconds:.1f}x"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path, help="saved Zhihu HTML pages")
+    parser.add_argument("--repeats", type=int, default=5)
+    arguments = parser.parse_args(argv)
+
+    if not arguments.pages:
+        measure("synthetic question page", synthetic_page(), arguments.repeats)
+    for page in arguments.pages:
+        measure(page.name, page.read_text(encoding="utf-8"), arguments.repeats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
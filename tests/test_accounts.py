@@ -0,0 +1,151 @@
+import unittest
+from concurrent.futures import Future
+
+from zhihu_scraper.accounts import AccountPool, NoAccountAvailableError
+from zhihu_scraper.http import (
+    AccessDeniedError,
+    AuthenticationError,
+    LoginStatus,
+    RateLimitError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeAccountClient:
+    def __init__(self, cookies):
+        self.cookies = dict(cookies)
+        self.calls: list[str] = []
+        self.failures: list[BaseException] = []
+        self.closed = 0
+
+    def get_json(self, url_or_path: str) -> object:
+        self.calls.append(url_or_path)
+        if self.failures:
+            raise self.failures.pop(0)
+        return {"account": self.cookies["z_c0"]}
+
+    def get_html(self, url_or_path: str) -> str:
+        self.calls.append(url_or_path)
+        return "<html></html>"
+
+    def check_login(self) -> LoginStatus:
+        return LoginStatus(authenticated=self.cookies["z_c0"] != "expired")
+
+    def update_cookies(self, cookies):
+        self.cookies.update(cookies)
+
+    def close(self):
+        self.closed += 1
+
+
+class FakeSubmittingClient(FakeAccountClient):
+    def submit_json(self, url_or_path: str) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(self.get_json(url_or_path))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+
+class AccountPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.clients: dict[str, FakeAccountClient] = {}
+
+    def _pool(self, *names: str, client_type=FakeAccountClient, **kwargs) -> AccountPool:
+        def factory(cookies):
+            client = client_type(cookies)
+            self.clients[cookies["z_c0"]] = client
+            return client
+
+        return AccountPool(
+            [(f"{name}.json", {"z_c0": name, "d_c0": "d"}) for name in names],
+            factory,
+            clock=self.clock,
+            **kwargs,
+        )
+
+    def test_requests_are_spread_across_accounts(self):
+        pool = self._pool("a", "b")
+
+        served = [pool.get_json(f"/api/v4/answers/{number}")["account"] for number in range(4)]
+
+        self.assertEqual(served, ["a", "b", "a", "b"])
+
+    def test_rejected_accounts_are_benched_and_the_request_moves_on(self):
+        pool = self._pool("a", "b", bench_seconds=60)
+        self.clients["a"].failures.append(AccessDeniedError(403, "denied"))
+
+        self.assertEqual(pool.get_json("/api/v4/answers/1"), {"account": "b"})
+        self.assertEqual(pool.get_json("/api/v4/answers/2"), {"account": "b"})
+        health = {account.name: account for account in pool.health()}
+        self.assertTrue(health["a.json"].benched)
+        self.assertEqual(health["a.json"].rejections, 1)
+
+        self.clock.now = 60
+        self.assertEqual(pool.get_json("/api/v4/answers/3"), {"account": "a"})
+
+    def test_last_rejection_is_raised_when_every_account_is_rejected(self):
+        pool = self._pool("a", "b")
+        self.clients["a"].failures.append(AuthenticationError(401, "expired"))
+        self.clients["b"].failures.append(RateLimitError(429, "throttled"))
+
+        with self.assertRaises(RateLimitError):
+            pool.get_json("/api/v4/answers/1")
+        with self.assertRaises(NoAccountAvailableError):
+            pool.get_json("/api/v4/answers/2")
+
+    def test_quota_limits_each_account_per_run(self):
+        pool = self._pool("a", "b", quota=1)
+
+        pool.get_json("/api/v4/answers/1")
+        pool.get_html("/question/1")
+
+        with self.assertRaises(NoAccountAvailableError):
+            pool.get_json("/api/v4/answers/2")
+        self.assertTrue(all(account.quota_exhausted for account in pool.health()))
+
+        pool.reset()
+        self.assertEqual(pool.get_json("/api/v4/answers/3"), {"account": "a"})
+
+    def test_submit_json_is_forwarded_only_when_the_clients_can_submit(self):
+        self.assertFalse(hasattr(self._pool("a"), "submit_json"))
+        pool = self._pool("a", "b", client_type=FakeSubmittingClient)
+        self.clients["a"].failures.append(AuthenticationError(401, "expired"))
+
+        served = [pool.submit_json(f"/api/v4/answers/{n}").result() for n in range(2)]
+
+        self.assertEqual(served, [{"account": "b"}, {"account": "b"}])
+        self.assertTrue({h.name: h for h in pool.health()}["a.json"].benched)
+
+    def test_browser_cookies_return_to_the_account_that_owns_them(self):
+        pool = self._pool("a", "b")
+
+        pool.update_cookies({"z_c0": "b", "__zse_ck": "challenge"})
+        pool.update_cookies({"d_c0": "browser-d"})
+
+        self.assertEqual(self.clients["b"].cookies["__zse_ck"], "challenge")
+        self.assertNotIn("__zse_ck", self.clients["a"].cookies)
+        self.assertEqual(self.clients["a"].cookies["d_c0"], "browser-d")
+
+    def test_health_and_login_never_expose_cookie_values(self):
+        pool = self._pool("expired", "valid-secret")
+
+        self.assertTrue(pool.check_login().authenticated)
+        self.assertNotIn("valid-secret", repr([h.cookie_diagnostic for h in pool.health()]))
+        pool.close()
+        pool.close()
+
+        self.assertEqual([client.closed for client in self.clients.values()], [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,13 @@ import unittest
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import patch
 
+from zhihu_scraper import normalize
 from zhihu_scraper.application import ArchiveWorkflow
 from zhihu_scraper.assets import MediaArchiveFailure, MediaArchiveRole
+from zhihu_scraper.browser import BrowserNavigationError, BrowserNavigationStats
+from zhihu_scraper.circuit import CircuitBreaker, RetryBudget
 from zhihu_scraper.domain import (
     Answer,
     Article,
@@ -15,6 +19,7 @@ from zhihu_scraper.domain import (
     Video,
 )
 from zhihu_scraper.http import InvalidResponseError
+from zhihu_scraper.proxies import current_affinity
 from zhihu_scraper.settings import ArchiveSettings, BrowserFallback
 from zhihu_scraper.source import InvalidZhihuPayloadError
 
@@ -145,6 +150,37 @@ class ArchiveWorkflowTests(unittest.TestCase):
         self.assertEqual((failure,), report.media_failures)
         self.assertIn("404", report.media_failures[0].display_message)
 
+    def test_report_carries_circuit_state_collected_after_the_run(self):
+        breaker = CircuitBreaker("api", budget=RetryBudget(0), failure_threshold=1)
+        workflow = ArchiveWorkflow(
+            source=FakeSource(),
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            circuit_reports=lambda: (breaker.report(),),
+            clock=lambda: NOW,
+        )
+        breaker.record_failure()
+
+        report = workflow.run("https://zhuanlan.zhihu.com/p/1")
+
+        self.assertEqual(report.circuits[0].times_opened, 1)
+        self.assertTrue(report.circuits[0].budget_exhausted)
+
+    def test_run_scoped_state_is_reset_at_the_start_of_every_run(self):
+        resets = []
+        workflow = ArchiveWorkflow(
+            source=FakeSource(),
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            run_reset=lambda: resets.append(len(resets)),
+            clock=lambda: NOW,
+        )
+
+        workflow.run("https://zhuanlan.zhihu.com/p/1")
+        workflow.run("https://zhuanlan.zhihu.com/p/1")
+
+        self.assertEqual([0, 1], resets)
+
     def test_routes_and_archives_every_supported_target_type(self):
         cases = (
             ("https://zhuanlan.zhihu.com/p/1", Article),
@@ -193,6 +229,35 @@ class ArchiveWorkflowTests(unittest.TestCase):
             tuple(column.token for column in report.target.articles[0].columns),
         )
 
+    def test_crawl_progress_is_forgotten_on_restart_and_after_a_written_archive(self):
+        class ProgressSource(FakeSource):
+            def __init__(self):
+                super().__init__()
+                self.forgotten = []
+
+            def forget_progress(self, target):
+                self.forgotten.append(target.canonical_url)
+
+        class FailingSink(FakeSink):
+            def archive(self, target):
+                raise OSError("disk full")
+
+        url = "https://www.zhihu.com/question/10"
+        settings = ArchiveSettings(media_download=False)
+
+        interrupted = ProgressSource()
+        with self.assertRaises(OSError):
+            ArchiveWorkflow(
+                source=interrupted, sink=FailingSink(), settings=settings, clock=lambda: NOW
+            ).run(url)
+        self.assertEqual([], interrupted.forgotten)
+
+        restarted = ProgressSource()
+        ArchiveWorkflow(
+            source=restarted, sink=FakeSink(), settings=settings, clock=lambda: NOW
+        ).run(url, restart=True)
+        self.assertEqual([url, url], restarted.forgotten)
+
     def test_comments_are_absent_by_default_and_fetched_only_when_enabled(self):
         disabled_client = FakeCommentClient()
         disabled = ArchiveWorkflow(
@@ -222,6 +287,33 @@ class ArchiveWorkflowTests(unittest.TestCase):
         self.assertIsNotNone(enabled.target.comments)
         self.assertEqual(1, len(enabled_client.calls))
 
+    def test_answer_comments_are_fetched_concurrently_and_skipped_when_count_is_zero(self):
+        source = FakeSource()
+        source.answers = [
+            {**_answer_payload("2", "10"), "comment_count": 0},
+            {**_answer_payload("3", "10"), "comment_count": 4},
+            _answer_payload("4", "10"),
+        ]
+        comment_client = FakeCommentClient()
+
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(comments=True, media_download=False, concurrency=2),
+            comment_client=comment_client,
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+
+        self.assertEqual(["2", "3", "4"], [answer.id for answer in report.target.answers])
+        self.assertTrue(all(answer.comments is not None for answer in report.target.answers))
+        self.assertEqual(
+            [
+                f"/api/v4/comment_v5/answers/{answer_id}/root_comment?limit=10&offset="
+                for answer_id in ("3", "4")
+            ],
+            sorted(comment_client.calls),
+        )
+
     def test_auto_browser_fallback_extracts_page_state_and_imports_cookies(self):
         source = FakeSource()
 
@@ -265,8 +357,40 @@ class ArchiveWorkflowTests(unittest.TestCase):
             [{"__zse_ck": "browser-session"}],
             browser_cookie_updates,
         )
+        self.assertFalse(browser.closed)
+        workflow.close()
         self.assertTrue(browser.closed)
 
+    def test_a_browser_that_failed_to_navigate_is_replaced_once(self):
+        source = FakeSource()
+        source.fetch_article_payload = lambda target: source.article | {"content": ""}
+        state = {"initialState": {"entities": {"articles": {"1": source.article}}}}
+
+        class CrashedBrowser(FakeBrowser):
+            def fetch_html(self, url):
+                raise BrowserNavigationError("crashed")
+
+        crashed = CrashedBrowser("")
+        fresh = FakeBrowser(
+            f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>'
+        )
+        browsers = iter((crashed, fresh))
+        workflow = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            browser_factory=lambda: next(browsers),
+            clock=lambda: NOW,
+        )
+        self.addCleanup(workflow.close)
+
+        report = workflow.run("https://zhuanlan.zhihu.com/p/1")
+
+        self.assertEqual("文章", report.target.title)
+        self.assertTrue(crashed.closed)
+        self.assertFalse(fresh.closed)
+        self.assertEqual(2, report.browser_launches)
+
     def test_auto_browser_fallback_replaces_a_truncated_success_payload(self):
         source = FakeSource()
         source.article = {
@@ -330,7 +454,7 @@ class ArchiveWorkflowTests(unittest.TestCase):
         report = ArchiveWorkflow(
             source=source,
             sink=FakeSink(),
-            settings=ArchiveSettings(media_download=False),
+            settings=ArchiveSettings(media_download=False, hydration_budget=0),
             browser_factory=lambda: browser,
             browser_cookie_sink=update_session,
             clock=lambda: NOW,
@@ -385,6 +509,561 @@ class ArchiveWorkflowTests(unittest.TestCase):
         self.assertEqual(1, len(report.target.answers))
         self.assertTrue(report.used_browser)
 
+    def test_truncated_answers_are_refetched_one_by_one_without_the_browser(self):
+        source = FakeSource()
+        source.answers = [
+            _answer_payload("2", "10"),
+            {"id": "3", "question": {"id": "10", "title": "问题"}},
+            _answer_payload("4", "10"),
+            {"id": "5", "question": {"id": "10", "title": "问题"}},
+        ]
+        fetched = []
+
+        def fetch_answer(target):
+            fetched.append((target.content_id, current_affinity()))
+            return _answer_payload(target.content_id, "10")
+
+        def no_browser():
+            raise AssertionError("the browser must not start")
+
+        source.fetch_answer_payload = fetch_answer
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False, concurrency=2),
+            browser_factory=no_browser,
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+
+        self.assertEqual(["2", "3", "4", "5"], [answer.id for answer in report.target.answers])
+        self.assertTrue(all(answer.blocks for answer in report.target.answers))
+        self.assertEqual(
+            [
+                ("3", "https://www.zhihu.com/question/10"),
+                ("5", "https://www.zhihu.com/question/10"),
+            ],
+            sorted(fetched),
+        )
+        self.assertFalse(report.used_browser)
+
+    def test_more_truncated_items_than_the_hydration_budget_use_the_fallback(self):
+        source = FakeSource()
+        source.answers = [
+            {"id": answer_id, "question": {"id": "10", "title": "问题"}} for answer_id in ("2", "3")
+        ]
+        source.fetch_answer_payload = lambda target: self.fail("hydrated past the budget")
+        answers = {answer_id: _answer_payload(answer_id, "10") for answer_id in ("2", "3")}
+        state = {"initialState": {"entities": {"answers": answers}}}
+
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False, hydration_budget=1),
+            browser_factory=lambda: FakeBrowser(
+                f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>'
+            ),
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+
+        self.assertEqual(["2", "3"], [answer.id for answer in report.target.answers])
+        self.assertTrue(report.used_browser)
+
+    def test_a_refetched_answer_still_truncated_is_loaded_from_its_own_page(self):
+        source = FakeSource()
+        source.answers = [
+            _answer_payload("2", "10"),
+            {"id": "3", "question": {"id": "10", "title": "问题"}},
+        ]
+        pages = []
+        source.iter_question_answer_payloads = lambda target, *, page_size: (
+            pages.append(target.content_id) or iter(source.answers)
+        )
+        source.fetch_answer_payload = lambda target: source.answers[1]
+        state = {"initialState": {"entities": {"answers": {"3": _answer_payload("3", "10")}}}}
+        browser = FakeBrowser(
+            f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>'
+        )
+
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            browser_factory=lambda: browser,
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+
+        self.assertEqual(["2", "3"], [answer.id for answer in report.target.answers])
+        self.assertTrue(all(answer.blocks for answer in report.target.answers))
+        self.assertEqual(["10"], pages)
+        self.assertEqual(["https://www.zhihu.com/answer/3"], browser.urls)
+
+    def test_hydration_budget_is_spent_once_per_run(self):
+        source = FakeSource()
+        source.answers = [{"id": "3", "question": {"id": "10", "title": "问题"}}]
+        fetched = []
+
+        def fetch_answer(target):
+            fetched.append(target.content_id)
+            return _answer_payload(target.content_id, "10")
+
+        source.fetch_answer_payload = fetch_answer
+        workflow = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False, hydration_budget=1),
+            browser_factory=lambda: self.fail("the budget covers one answer per run"),
+            clock=lambda: NOW,
+        )
+
+        workflow.run("https://www.zhihu.com/question/10")
+        workflow.run("https://www.zhihu.com/question/10")
+
+        self.assertEqual(["3", "3"], fetched)
+
+    def test_question_hydrates_truncated_answers_from_harvested_pages(self):
+        source = FakeSource()
+        source.answers = [
+            {
+                "id": answer_id,
+                "question": {"id": "10", "title": "问题"},
+                "author": {"id": "b", "name": "回答作者"},
+            }
+            for answer_id in ("2", "3", "4", "5")
+        ]
+
+        def page(*answer_ids):
+            answers = {answer_id: _answer_payload(answer_id, "10") for answer_id in answer_ids}
+            state = {"initialState": {"entities": {"answers": answers}}}
+            return f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>'
+
+        pages = {
+            "https://www.zhihu.com/question/10": page("2", "3"),
+            "https://www.zhihu.com/answer/4": page("4", "5"),
+        }
+        navigations = []
+
+        class PagedBrowser(FakeBrowser):
+            def fetch_html(self, url):
+                navigations.append(url)
+                return pages[url]
+
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False, hydration_budget=0),
+            browser_factory=lambda: PagedBrowser(""),
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+
+        self.assertEqual(["2", "3", "4", "5"], [answer.id for answer in report.target.answers])
+        self.assertTrue(all(answer.blocks for answer in report.target.answers))
+        self.assertEqual(
+            ["https://www.zhihu.com/question/10", "https://www.zhihu.com/answer/4"],
+            navigations,
+        )
+
+    def test_every_payload_is_parsed_once_including_hydrated_ones(self):
+        source = FakeSource()
+        source.answers = [
+            {**_answer_payload("2", "10"), "content": "<p>回答 2</p>"},
+            {"id": "3", "question": {"id": "10", "title": "问题"}},
+        ]
+        source.column_articles = [
+            {
+                **_article_payload(article_id, f"文章 {article_id}"),
+                "content": f"<p>{article_id}</p>",
+            }
+            for article_id in ("1", "4")
+        ]
+        hydrated = {**_answer_payload("3", "10"), "content": "<p>回答 3</p>"}
+        state = {"initialState": {"entities": {"answers": {"3": hydrated}}}}
+        page = f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>'
+        workflow = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False, hydration_budget=0),
+            browser_factory=lambda: FakeBrowser(page),
+            clock=lambda: NOW,
+        )
+
+        with patch(
+            "zhihu_scraper.normalize.parse_rich_text",
+            wraps=normalize.parse_rich_text,
+        ) as parse:
+            workflow.run("https://www.zhihu.com/question/10")
+            workflow.run("https://www.zhihu.com/column/machinelearningpku")
+        workflow.close()
+
+        parsed = [call.args[0] for call in parse.call_args_list]
+        for content in ("<p>回答 2</p>", "<p>回答 3</p>", "<p>1</p>", "<p>4</p>"):
+            self.assertEqual(1, parsed.count(content), content)
+
+    def test_streaming_hands_answers_to_the_sink_as_their_pages_arrive(self):
+        source = FakeSource()
+        fetched = []
+
+        def answers(target, *, page_size):
+            for answer_id in ("2", "3", "4"):
+                fetched.append(answer_id)
+                yield _answer_payload(answer_id, "10")
+
+        source.iter_question_answer_payloads = answers
+
+        class StreamingSink(FakeSink):
+            def __init__(self):
+                super().__init__()
+                self.seen = []
+
+            def archive_stream(self, target, items):
+                self.targets.append(target)
+                for item in items:
+                    self.seen.append((item.id, len(fetched)))
+                return "streamed"
+
+        sink = StreamingSink()
+        report = ArchiveWorkflow(
+            source=source,
+            sink=sink,
+            settings=ArchiveSettings(media_download=False, streaming=True),
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+
+        self.assertEqual([("2", 1), ("3", 2), ("4", 3)], sink.seen)
+        self.assertEqual("streamed", report.receipt)
+        self.assertEqual("问题", report.target.question.title)
+        self.assertEqual((), report.target.answers)
+
+        plain_sink = FakeSink()
+        ArchiveWorkflow(
+            source=FakeSource(),
+            sink=plain_sink,
+            settings=ArchiveSettings(media_download=False, streaming=True),
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+        self.assertEqual(1, len(plain_sink.targets[0].answers))
+
+    def test_streamed_pagination_resumes_after_cookie_refresh_without_repeats(self):
+        source = FakeSource()
+        source.session_ready = False
+
+        def answers(target, *, page_size):
+            yield _answer_payload("2", "10")
+            if not source.session_ready:
+                raise InvalidZhihuPayloadError("missing browser session")
+            yield _answer_payload("3", "10")
+
+        def update_session(_cookies):
+            source.session_ready = True
+
+        source.iter_question_answer_payloads = answers
+
+        class StreamingSink(FakeSink):
+            def archive_stream(self, target, items):
+                self.targets.extend(item.id for item in items)
+                return "streamed"
+
+        sink = StreamingSink()
+        report = ArchiveWorkflow(
+            source=source,
+            sink=sink,
+            settings=ArchiveSettings(media_download=False, streaming=True),
+            browser_factory=lambda: FakeBrowser(
+                "<html></html>",
+                exported_cookies={"__zse_ck": "browser-session"},
+            ),
+            browser_cookie_sink=update_session,
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+
+        self.assertEqual(["2", "3"], sink.targets)
+        self.assertTrue(report.used_browser)
+
+    def test_missing_answers_are_loaded_in_batches_the_size_of_the_page_pool(self):
+        source = FakeSource()
+        source.answers = [
+            {
+                "id": answer_id,
+                "question": {"id": "10", "title": "问题"},
+                "author": {"id": "b", "name": "回答作者"},
+            }
+            for answer_id in ("2", "3", "4", "5")
+        ]
+
+        def page(*answer_ids):
+            answers = {answer_id: _answer_payload(answer_id, "10") for answer_id in answer_ids}
+            state = {"initialState": {"entities": {"answers": answers}}}
+            return f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>'
+
+        pages = {
+            "https://www.zhihu.com/question/10": page(),
+            "https://www.zhihu.com/answer/2": page("2"),
+            "https://www.zhihu.com/answer/3": page("3", "4", "5"),
+        }
+        batches = []
+
+        class PooledBrowser(FakeBrowser):
+            max_pages = 2
+
+            def fetch_html(self, url):
+                return pages[url]
+
+            def fetch_many_html(self, urls):
+                batches.append(list(urls))
+                return [SimpleNamespace(url=url, html=pages[url]) for url in urls]
+
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False, hydration_budget=0),
+            browser_factory=lambda: PooledBrowser(""),
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/question/10")
+
+        self.assertEqual(["2", "3", "4", "5"], [answer.id for answer in report.target.answers])
+        self.assertEqual(
+            [["https://www.zhihu.com/answer/2", "https://www.zhihu.com/answer/3"]],
+            batches,
+        )
+        self.assertEqual(3, report.browser_pages)
+
+    def test_browser_fallback_prefers_the_in_page_initial_state(self):
+        source = FakeSource()
+
+        def fail_article(target):
+            raise InvalidZhihuPayloadError("blocked")
+
+        source.fetch_article_payload = fail_article
+        state = {"initialState": {"entities": {"articles": {"1": source.article}}}}
+
+        class StateBrowser(FakeBrowser):
+            def fetch_html(self, url):
+                raise AssertionError("the serialized DOM should not be needed")
+
+            def fetch_initial_state(self, url):
+                self.urls.append(url)
+                return f'<script id="js-initialData">{json.dumps(state)}</script>'
+
+        browser = StateBrowser("")
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            browser_factory=lambda: browser,
+            clock=lambda: NOW,
+        ).run("https://zhuanlan.zhihu.com/p/1")
+
+        self.assertEqual("文章", report.target.title)
+        self.assertEqual(["https://zhuanlan.zhihu.com/p/1"], browser.urls)
+
+    def test_column_fallback_uses_the_pages_the_browser_captured_while_scrolling(self):
+        source = FakeSource()
+        http_listings = []
+
+        def blocked_articles(target, *, page_size):
+            http_listings.append(target.content_id)
+            raise InvalidZhihuPayloadError("blocked")
+            yield
+
+        source.iter_column_article_payloads = blocked_articles
+        endpoint = "https://www.zhihu.com/api/v4/columns/machinelearningpku/items"
+        captures = []
+
+        class CapturingBrowser(FakeBrowser):
+            def capture_api_responses(self, url, api_path):
+                captures.append((url, api_path))
+                return SimpleNamespace(
+                    document="<html></html>",
+                    responses=(
+                        (
+                            f"{endpoint}?limit=10&offset=0",
+                            {"data": [source.article], "paging": {"is_end": True}},
+                        ),
+                    ),
+                )
+
+        class CrashedBrowser(FakeBrowser):
+            def capture_api_responses(self, url, api_path):
+                raise BrowserNavigationError("crashed")
+
+        browsers = iter((CrashedBrowser(""), CapturingBrowser("")))
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            browser_factory=lambda: next(browsers),
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/column/machinelearningpku")
+
+        self.assertEqual(["1"], [article.id for article in report.target.articles])
+        self.assertEqual(["machinelearningpku"], http_listings)
+        self.assertEqual((1, 2), (report.browser_pages, report.browser_launches))
+        self.assertEqual(
+            [
+                (
+                    "https://www.zhihu.com/column/machinelearningpku",
+                    r"^/api/v4/columns/machinelearningpku/items$",
+                )
+            ],
+            captures,
+        )
+
+    def test_captured_pages_start_after_the_first_screen_of_the_initial_state(self):
+        source = FakeSource()
+
+        def blocked_articles(target, *, page_size):
+            raise InvalidZhihuPayloadError("blocked")
+            yield
+
+        source.iter_column_article_payloads = blocked_articles
+        first, second = _article_payload("1", "第一篇"), _article_payload("2", "第二篇")
+        state = {"initialState": {"entities": {"articles": {"1": first}}}}
+        endpoint = "https://www.zhihu.com/api/v4/columns/machinelearningpku/items"
+
+        class CapturingBrowser(FakeBrowser):
+            def capture_api_responses(self, url, api_path):
+                return SimpleNamespace(
+                    document=(
+                        '<script id="js-initialData">'
+                        f"{json.dumps(state, ensure_ascii=False)}</script>"
+                    ),
+                    responses=(
+                        (
+                            f"{endpoint}?limit=10&offset=1",
+                            {"data": [second], "paging": {"is_end": True}},
+                        ),
+                    ),
+                )
+
+        report = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            browser_factory=lambda: CapturingBrowser(""),
+            clock=lambda: NOW,
+        ).run("https://www.zhihu.com/column/machinelearningpku")
+
+        self.assertEqual(["1", "2"], [article.id for article in report.target.articles])
+
+    def test_warm_up_starts_the_browser_before_http_and_reports_its_use(self):
+        events = []
+        source = FakeSource()
+
+        def fetch_article(target):
+            events.append("http")
+            if len(events) > 2:
+                raise InvalidZhihuPayloadError("blocked")
+            return source.article
+
+        source.fetch_article_payload = fetch_article
+        state = {"initialState": {"entities": {"articles": {"1": source.article}}}}
+
+        class WarmingBrowser(FakeBrowser):
+            def warm_up(self):
+                events.append("warm_up")
+
+        browser = WarmingBrowser(
+            f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>'
+        )
+        workflow = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False, warm_up=True),
+            browser_factory=lambda: browser,
+            clock=lambda: NOW,
+        )
+
+        unused = workflow.run("https://zhuanlan.zhihu.com/p/1")
+        used = workflow.run("https://zhuanlan.zhihu.com/p/1")
+        reused = workflow.run("https://zhuanlan.zhihu.com/p/1")
+        workflow.close()
+
+        self.assertEqual(["warm_up", "http", "http"], events[:3])
+        self.assertEqual(1, events.count("warm_up"))
+        self.assertEqual((False, 0), (unused.warm_browser_used, unused.browser_launches))
+        self.assertEqual((True, 1), (used.warm_browser_used, used.browser_launches))
+        self.assertEqual((None, 0), (reused.warm_browser_used, reused.browser_launches))
+        self.assertTrue(browser.closed)
+
+    def test_one_browser_serves_every_fallback_until_the_workflow_closes(self):
+        source = FakeSource()
+
+        def fail_article(target):
+            raise InvalidZhihuPayloadError("blocked")
+
+        source.fetch_article_payload = fail_article
+        state = {"initialState": {"entities": {"articles": {"1": source.article}}}}
+        browsers = []
+
+        class CookieRecordingBrowser(FakeBrowser):
+            def __init__(self):
+                super().__init__(
+                    f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>',
+                    exported_cookies={"__zse_ck": "browser-session"},
+                )
+                self.imports = []
+                browsers.append(self)
+
+            def set_cookie_dict(self, cookies):
+                self.imports.append(dict(cookies))
+
+        workflow = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            browser_factory=CookieRecordingBrowser,
+            browser_cookies={"z_c0": "secret"},
+            clock=lambda: NOW,
+        )
+
+        first = workflow.run("https://zhuanlan.zhihu.com/p/1")
+        second = workflow.run("https://zhuanlan.zhihu.com/p/1")
+        workflow.close()
+        workflow.close()
+
+        self.assertEqual(1, len(browsers))
+        self.assertEqual(2, len(browsers[0].urls))
+        self.assertEqual([{"z_c0": "secret"}], browsers[0].imports)
+        self.assertEqual((1, 1), (first.browser_pages, first.browser_launches))
+        self.assertEqual((1, 0), (second.browser_pages, second.browser_launches))
+        self.assertTrue(browsers[0].closed)
+
+    def test_reports_the_browser_page_loads_of_each_run(self):
+        source = FakeSource()
+
+        def fail_article(target):
+            raise InvalidZhihuPayloadError("blocked")
+
+        source.fetch_article_payload = fail_article
+        state = {"initialState": {"entities": {"articles": {"1": source.article}}}}
+
+        class MeasuredBrowser(FakeBrowser):
+            def navigation_stats(self):
+                loads = len(self.urls)
+                return BrowserNavigationStats(
+                    pages=loads, seconds=0.5 * loads, blocked_requests=3 * loads
+                )
+
+        workflow = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            browser_factory=lambda: MeasuredBrowser(
+                f'<script id="js-initialData">{json.dumps(state, ensure_ascii=False)}</script>'
+            ),
+            clock=lambda: NOW,
+        )
+        self.addCleanup(workflow.close)
+
+        first = workflow.run("https://zhuanlan.zhihu.com/p/1")
+        second = workflow.run("https://zhuanlan.zhihu.com/p/1")
+        source.fetch_article_payload = lambda target: source.article
+        third = workflow.run("https://zhuanlan.zhihu.com/p/1")
+
+        expected = BrowserNavigationStats(pages=1, seconds=0.5, blocked_requests=3)
+        self.assertEqual(expected, first.browser_navigation)
+        self.assertEqual(expected, second.browser_navigation)
+        self.assertIsNone(third.browser_navigation)
+
     def test_comments_retry_once_after_browser_cookie_backflow(self):
         source = FakeSource()
         state = {
@@ -506,6 +1185,48 @@ class ArchiveWorkflowTests(unittest.TestCase):
         with self.assertRaisesRegex(InvalidZhihuPayloadError, "blocked"):
             workflow.run("https://zhuanlan.zhihu.com/p/1")
 
+    def test_lean_payload_missing_a_field_is_refetched_with_the_full_shape(self):
+        full_source = FakeSource()
+        lean_source = FakeSource()
+        lean_source.answer = {"id": "2", "content": "<p>回答</p>"}
+        lean_source.full_shape = lambda: full_source
+        full_source.full_shape = lambda: full_source
+        browser_calls = []
+        workflow = ArchiveWorkflow(
+            source=lean_source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(media_download=False),
+            browser_factory=lambda: browser_calls.append("browser"),
+            clock=lambda: NOW,
+        )
+
+        answer_report = workflow.run("https://www.zhihu.com/question/10/answer/2")
+        article_report = workflow.run("https://zhuanlan.zhihu.com/p/1")
+
+        self.assertEqual(answer_report.target.question.title, "问题")
+        self.assertEqual(article_report.target.title, "文章")
+        self.assertFalse(answer_report.used_browser)
+        self.assertEqual(browser_calls, [])
+
+    def test_truncated_content_does_not_switch_to_the_full_shape(self):
+        source = FakeSource()
+        source.answer = {**_answer_payload("2", "10"), "content": ""}
+        widened = []
+        source.full_shape = lambda: widened.append("full") or FakeSource()
+        workflow = ArchiveWorkflow(
+            source=source,
+            sink=FakeSink(),
+            settings=ArchiveSettings(
+                media_download=False,
+                browser_fallback=BrowserFallback.NEVER,
+            ),
+            clock=lambda: NOW,
+        )
+
+        with self.assertRaisesRegex(normalize.NormalizationError, "full content"):
+            workflow.run("https://www.zhihu.com/question/10/answer/2")
+        self.assertEqual(widened, [])
+
 
 def _article_payload(article_id, title):
     return {
@@ -103,6 +103,8 @@ def test_cdp_connection_reuses_default_context_for_pages_and_cookies(
         cdp_url="http://127.0.0.1:9222",
         executor=executor,
         runtime_platform=runtime_for(tmp_path),
+        # The user's own session is never routed, so the fake needs no ``route``.
+        block_resources=True,
     )
 
     assert browser.fetch_html("https://www.zhihu.com/question/1") == (
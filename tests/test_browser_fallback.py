@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 import builtins
+import json
 import sys
+import threading
+from collections.abc import Callable
 from pathlib import Path, PurePosixPath
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 
 import pytest
 
 from zhihu_scraper.browser import (
+    BackgroundBrowser,
     BrowserCookieError,
     BrowserDependencyError,
     BrowserFallback,
+    BrowserFallbackError,
     BrowserLaunchError,
     BrowserNavigationError,
 )
 from zhihu_scraper.platform import OperatingSystem, RuntimePlatform
+from zhihu_scraper.source import extract_entity_payload
 
 
 class FakePage:
@@ -158,6 +164,43 @@ def test_explicit_profile_headless_mode_and_browser_context_are_reused(tmp_path:
     ]
 
 
+def test_a_context_that_reports_closed_is_launched_again(tmp_path: Path) -> None:
+    class ClosingContext(FakeContext):
+        def __init__(self) -> None:
+            super().__init__()
+            self.close_handlers: list[Callable[[object], object]] = []
+
+        def on(self, event: str, handler: Callable[[object], object]) -> None:
+            if event == "close":
+                self.close_handlers.append(handler)
+
+    executor = FakeExecutor(ClosingContext())
+    browser = BrowserFallback(executor=executor, runtime_platform=runtime_for(tmp_path))
+
+    browser.fetch_html("https://www.zhihu.com/question/1")
+    for handler in executor.context.close_handlers:
+        handler(executor.context)
+    browser.fetch_html("https://www.zhihu.com/question/2")
+
+    assert len(executor.launches) == 2
+
+
+def test_a_dead_context_is_replaced_once_when_no_page_can_be_opened(tmp_path: Path) -> None:
+    class DeadContext(FakeContext):
+        def new_page(self) -> FakePage:
+            raise RuntimeError("Target page, context or browser has been closed")
+
+    dead = DeadContext()
+    executor = FakeExecutor(dead)
+    browser = BrowserFallback(executor=executor, runtime_platform=runtime_for(tmp_path))
+    browser.warm_up()
+    executor.context = FakeContext(FakePage("<html>fresh</html>"))
+
+    assert browser.fetch_html("https://www.zhihu.com/question/1") == "<html>fresh</html>"
+    assert dead.closed is True
+    assert len(executor.launches) == 2
+
+
 def test_managed_chromium_is_retried_when_discovered_system_chrome_cannot_launch(
     tmp_path: Path,
 ) -> None:
@@ -232,6 +275,293 @@ def test_content_read_retries_when_zhihu_is_still_navigating(tmp_path: Path) ->
     assert sleeps == [0.25]
 
 
+def test_fetch_many_html_overlaps_navigations_within_the_page_limit(tmp_path: Path) -> None:
+    events: list[str] = []
+
+    class TrackingPage(FakePage):
+        def goto(self, url: str, *, wait_until: str, timeout: int) -> None:
+            super().goto(url, wait_until=wait_until, timeout=timeout)
+            self.html = url
+            events.append(f"start {url[-1]}")
+            if url.endswith("3"):
+                raise RuntimeError("navigation failed")
+
+        def content(self) -> str:
+            events.append(f"read {self.html[-1]}")
+            return self.html
+
+    class PagePerTabContext(FakeContext):
+        def __init__(self) -> None:
+            super().__init__()
+            self.pages: list[TrackingPage] = []
+
+        def new_page(self) -> TrackingPage:
+            self.pages.append(TrackingPage())
+            return self.pages[-1]
+
+    context = PagePerTabContext()
+    browser = BrowserFallback(
+        executor=FakeExecutor(context),
+        runtime_platform=runtime_for(tmp_path),
+        max_pages=2,
+    )
+    urls = [f"https://zhuanlan.zhihu.com/p/{number}" for number in (1, 2, 3, 4)]
+
+    results = list(browser.fetch_many_html(urls))
+
+    # The failed tab is reported at once instead of waiting behind page 2.
+    assert [result.url for result in results] == [urls[0], urls[2], urls[1], urls[3]]
+    by_url = {result.url: result for result in results}
+    assert [by_url[url].html for url in urls] == [urls[0], urls[1], None, urls[3]]
+    assert isinstance(by_url[urls[2]].error, BrowserNavigationError)
+    assert events == ["start 1", "start 2", "read 1", "start 3", "start 4", "read 2", "read 4"]
+    assert {page.goto_calls[0][1] for page in context.pages} == {"commit"}
+    assert all(page.closed for page in context.pages)
+    assert context.cleared_cookie_names == ["BEC", "__zse_ck"]
+
+
+def test_fetch_many_html_yields_the_tab_that_finished_loading_first(tmp_path: Path) -> None:
+    class LoadingPage(FakePage):
+        def goto(self, url: str, *, wait_until: str, timeout: int) -> None:
+            super().goto(url, wait_until=wait_until, timeout=timeout)
+            self.html = url
+
+        def evaluate(self, expression: str) -> str:
+            assert expression == "document.readyState"
+            return "loading" if self.html.endswith("1") else "interactive"
+
+    class PagePerTabContext(FakeContext):
+        def new_page(self) -> LoadingPage:
+            return LoadingPage()
+
+    browser = BrowserFallback(
+        executor=FakeExecutor(PagePerTabContext()),
+        runtime_platform=runtime_for(tmp_path),
+        max_pages=2,
+    )
+    urls = [f"https://zhuanlan.zhihu.com/p/{number}" for number in (1, 2, 3)]
+
+    results = list(browser.fetch_many_html(urls))
+
+    assert [result.url for result in results] == [urls[1], urls[2], urls[0]]
+    assert all(result.html == result.url for result in results)
+
+
+def test_managed_profile_blocks_heavy_resources_and_times_navigations(tmp_path: Path) -> None:
+    class FakeRoute:
+        def __init__(self, url: str, resource_type: str) -> None:
+            self.request = SimpleNamespace(url=url, resource_type=resource_type)
+            self.outcome = ""
+
+        def abort(self) -> None:
+            self.outcome = "abort"
+
+        def continue_(self) -> None:
+            self.outcome = "continue"
+
+    class RoutingContext(FakeContext):
+        def __init__(self) -> None:
+            super().__init__()
+            self.routes: list[tuple[str, Callable[[FakeRoute], None]]] = []
+
+        def route(self, url: str, handler: Callable[[FakeRoute], None]) -> None:
+            self.routes.append((url, handler))
+
+    ticks = iter([10.0, 10.4])
+    context = RoutingContext()
+    browser = BrowserFallback(
+        executor=FakeExecutor(context),
+        runtime_platform=runtime_for(tmp_path),
+        block_resources=True,
+        clock=lambda: next(ticks),
+    )
+
+    browser.fetch_html("https://www.zhihu.com/question/1")
+    [(pattern, handler)] = context.routes
+    requests = [
+        FakeRoute("https://www.zhihu.com/question/1", "document"),
+        FakeRoute("https://static.zhihu.com/heifetz/main.js", "script"),
+        FakeRoute("https://pic1.zhimg.com/v2-1.jpg", "image"),
+        FakeRoute("https://static.zhihu.com/fonts/a.woff2", "font"),
+        FakeRoute("https://hm.baidu.com/hm.js?abc", "script"),
+    ]
+    for request in requests:
+        handler(request)
+
+    assert pattern == "**/*"
+    assert [request.outcome for request in requests] == [
+        "continue",
+        "continue",
+        "abort",
+        "abort",
+        "abort",
+    ]
+    stats = browser.navigation_stats()
+    assert (stats.pages, stats.blocked_requests) == (1, 3)
+    assert stats.mean_seconds == pytest.approx(0.4)
+
+
+def test_fetch_initial_state_reads_the_state_in_page_and_falls_back_to_html(
+    tmp_path: Path,
+) -> None:
+    class EvaluatingPage(FakePage):
+        def __init__(self, state: object) -> None:
+            super().__init__("<html><body>full page</body></html>")
+            self.state = state
+            self.content_calls = 0
+
+        def evaluate(self, expression: str) -> object:
+            assert "js-initialData" in expression
+            return self.state
+
+        def content(self) -> str:
+            self.content_calls += 1
+            return self.html
+
+    state = json.dumps({"initialState": {"entities": {"answers": {"2": {"id": 2}}}}})
+    with_state = EvaluatingPage(state)
+    without_state = EvaluatingPage(None)
+
+    document = BrowserFallback(
+        executor=FakeExecutor(FakeContext(page=with_state)),
+        runtime_platform=runtime_for(tmp_path),
+    ).fetch_initial_state("https://www.zhihu.com/question/1")
+    fallback = BrowserFallback(
+        executor=FakeExecutor(FakeContext(page=without_state)),
+        runtime_platform=runtime_for(tmp_path),
+    ).fetch_initial_state("https://www.zhihu.com/question/1")
+
+    assert extract_entity_payload(document, collection="answers", entity_id="2") == {"id": 2}
+    assert with_state.content_calls == 0
+    assert fallback == "<html><body>full page</body></html>"
+    assert without_state.content_calls == 1
+
+
+def test_capture_scrolls_until_the_page_fetched_the_last_collection_page(
+    tmp_path: Path,
+) -> None:
+    endpoint = "https://www.zhihu.com/api/v4/columns/c/items"
+
+    class FakeResponse:
+        def __init__(self, url: str, payload: object) -> None:
+            self.url = url
+            self.payload = payload
+
+        def json(self) -> object:
+            if self.payload is None:
+                raise ValueError("not JSON")
+            return self.payload
+
+    class ScrollingPage(FakePage):
+        def __init__(self) -> None:
+            super().__init__()
+            self.handlers: list[Callable[[FakeResponse], object]] = []
+            self.scrolls = 0
+            self.pauses: list[float] = []
+
+        def on(self, event: str, handler: Callable[[FakeResponse], object]) -> None:
+            assert event == "response"
+            self.handlers.append(handler)
+
+        def goto(self, url: str, *, wait_until: str, timeout: int) -> None:
+            super().goto(url, wait_until=wait_until, timeout=timeout)
+            self.emit(FakeResponse("https://static.zhihu.com/main.js", None))
+            self.emit(FakeResponse(f"{endpoint}?offset=0", {"data": [], "paging": {}}))
+
+        def evaluate(self, expression: str) -> object:
+            if "scrollTo" not in expression:
+                return None
+            self.scrolls += 1
+            self.emit(FakeResponse(f"{endpoint}?offset={self.scrolls}", None))
+            is_end = self.scrolls == 2
+            self.emit(
+                FakeResponse(
+                    f"{endpoint}?offset={self.scrolls * 10}",
+                    {"data": [], "paging": {"is_end": is_end}},
+                )
+            )
+            return None
+
+        def wait_for_timeout(self, timeout: float) -> None:
+            self.pauses.append(timeout)
+
+        def emit(self, response: FakeResponse) -> None:
+            for handler in self.handlers:
+                handler(response)
+
+    page = ScrollingPage()
+    browser = BrowserFallback(
+        executor=FakeExecutor(FakeContext(page=page)),
+        runtime_platform=runtime_for(tmp_path),
+    )
+
+    capture = browser.capture_api_responses(
+        "https://www.zhihu.com/column/c",
+        r"^/api/v4/columns/c/items$",
+    )
+
+    assert [url for url, _payload in capture.responses] == [
+        f"{endpoint}?offset=0",
+        f"{endpoint}?offset=10",
+        f"{endpoint}?offset=20",
+    ]
+    assert page.scrolls == 2
+    assert capture.document == "<html><body>ready</body></html>"
+    assert page.closed is True
+
+
+def test_background_browser_keeps_every_call_on_its_own_thread(tmp_path: Path) -> None:
+    threads: list[str] = []
+
+    class ThreadRecordingExecutor(FakeExecutor):
+        def launch_persistent_context(
+            self,
+            profile_dir: Path,
+            *,
+            headless: bool,
+            executable_path: Path | None,
+            proxy: str | None,
+        ) -> FakeContext:
+            threads.append(threading.current_thread().name)
+            return super().launch_persistent_context(
+                profile_dir,
+                headless=headless,
+                executable_path=executable_path,
+                proxy=proxy,
+            )
+
+    class ThreadRecordingPage(FakePage):
+        def content(self) -> str:
+            threads.append(threading.current_thread().name)
+            return super().content()
+
+    executor = ThreadRecordingExecutor(FakeContext(page=ThreadRecordingPage()))
+    with BackgroundBrowser(
+        BrowserFallback(executor=executor, runtime_platform=runtime_for(tmp_path))
+    ) as browser:
+        browser.warm_up()
+        html = browser.fetch_html("https://www.zhihu.com/question/1")
+
+    assert html == "<html><body>ready</body></html>"
+    assert len(executor.launches) == 1
+    assert len(set(threads)) == 1
+    assert threads[0] != threading.current_thread().name
+    assert executor.context.closed is True
+    with pytest.raises(BrowserFallbackError):
+        browser.fetch_html("https://www.zhihu.com/question/1")
+
+
+def test_background_browser_that_was_never_used_starts_nothing(tmp_path: Path) -> None:
+    executor = FakeExecutor()
+
+    BackgroundBrowser(
+        BrowserFallback(executor=executor, runtime_platform=runtime_for(tmp_path))
+    ).close()
+
+    assert executor.launches == []
+    assert executor.close_count == 1
+
+
 def test_playwright_adapter_applies_authenticated_proxy_to_managed_browser(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
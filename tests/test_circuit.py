@@ -0,0 +1,167 @@
+import json
+import unittest
+
+from zhihu_scraper.circuit import CircuitBreaker, CircuitState, RetryBudget
+from zhihu_scraper.http import CircuitOpenError, ServerError, ZhihuHttpClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, *, status_code: int = 200, payload: object = None):
+        self.status_code = status_code
+        self.text = "" if payload is None else json.dumps(payload)
+        self.headers: dict[str, str] = {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSession:
+    def __init__(self, responses: list[FakeResponse]):
+        self._responses = list(responses)
+        self.calls: list[str] = []
+
+    def get(self, url: str, **kwargs):
+        self.calls.append(url)
+        return self._responses.pop(0)
+
+    def close(self):
+        pass
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def _breaker(self, *, budget: int = 10, threshold: int = 3) -> CircuitBreaker:
+        return CircuitBreaker(
+            "api",
+            budget=RetryBudget(budget),
+            failure_threshold=threshold,
+            reset_timeout=30,
+            clock=self.clock,
+        )
+
+    def test_opens_after_consecutive_failures_and_fails_fast(self):
+        breaker = self._breaker()
+
+        breaker.record_failure()
+        breaker.record_success()
+        for _ in range(3):
+            self.assertTrue(breaker.allow_request())
+            breaker.record_failure()
+
+        self.assertFalse(breaker.allow_request())
+        self.assertFalse(breaker.allow_retry())
+        report = breaker.report()
+        self.assertIs(report.state, CircuitState.OPEN)
+        self.assertEqual((report.times_opened, report.rejected), (1, 1))
+
+    def test_half_open_lets_one_probe_through_and_closes_on_success(self):
+        breaker = self._breaker(threshold=1)
+        breaker.record_failure()
+        self.clock.now = 30
+
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        breaker.record_success()
+
+        self.assertIs(breaker.report().state, CircuitState.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_probe_reopens_the_circuit(self):
+        breaker = self._breaker(threshold=2)
+        breaker.record_failure()
+        breaker.record_failure()
+        self.clock.now = 30
+
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(breaker.report().times_opened, 2)
+
+    def test_breakers_share_one_retry_budget(self):
+        budget = RetryBudget(2)
+        api = CircuitBreaker("api", budget=budget)
+        media = CircuitBreaker("media", budget=budget)
+
+        self.assertTrue(api.allow_retry())
+        self.assertTrue(media.allow_retry())
+        self.assertFalse(api.allow_retry())
+        self.assertTrue(media.report().budget_exhausted)
+
+    def test_reset_closes_the_circuit_and_refills_the_budget(self):
+        breaker = self._breaker(budget=1, threshold=1)
+        self.assertTrue(breaker.allow_retry())
+        breaker.record_failure()
+
+        breaker.reset()
+
+        report = breaker.report()
+        self.assertIs(report.state, CircuitState.CLOSED)
+        self.assertEqual((report.times_opened, report.rejected), (0, 0))
+        self.assertTrue(breaker.allow_request())
+        self.assertTrue(breaker.allow_retry())
+
+
+class CircuitHttpClientTests(unittest.TestCase):
+    def test_retries_stop_when_the_run_budget_is_spent(self):
+        session = FakeSession([FakeResponse(status_code=503) for _ in range(3)])
+        breaker = CircuitBreaker("api", budget=RetryBudget(1), failure_threshold=10)
+        client = ZhihuHttpClient(
+            session=session,
+            max_retries=2,
+            sleep=lambda _delay: None,
+            circuit=breaker,
+        )
+
+        with self.assertRaises(ServerError):
+            client.get_json("/api/v4/answers/1")
+
+        self.assertEqual(len(session.calls), 2)
+        self.assertEqual(breaker.report().retries_used, 1)
+
+    def test_open_circuit_refuses_requests_without_reaching_zhihu(self):
+        session = FakeSession(
+            [
+                FakeResponse(status_code=502),
+                FakeResponse(status_code=502),
+                FakeResponse(payload={"id": 1}),
+            ]
+        )
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "api",
+            budget=RetryBudget(10),
+            failure_threshold=2,
+            reset_timeout=30,
+            clock=clock,
+        )
+        client = ZhihuHttpClient(
+            session=session,
+            max_retries=5,
+            sleep=lambda _delay: None,
+            circuit=breaker,
+        )
+
+        with self.assertRaises(ServerError):
+            client.get_json("/api/v4/answers/1")
+        with self.assertRaises(CircuitOpenError):
+            client.get_json("/api/v4/answers/2")
+        self.assertEqual(len(session.calls), 2)
+
+        clock.now = 30
+        self.assertEqual(client.get_json("/api/v4/answers/2"), {"id": 1})
+        self.assertIs(breaker.report().state, CircuitState.CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
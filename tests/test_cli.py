@@ -1,4 +1,5 @@
 import io
+import os
 import sys
 import tempfile
 import unittest
@@ -12,6 +13,16 @@ from zhihu_scraper.http import CookieDiagnostic, LoginStatus
 
 
 class NewCommandLineTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        environment = patch.dict(
+            os.environ,
+            {"ZHIHU_DAEMON_SOCKET": str(Path(directory.name) / "absent.sock")},
+        )
+        environment.start()
+        self.addCleanup(environment.stop)
+
     def test_chinese_output_survives_windows_legacy_redirect_encoding(self):
         stdout_bytes = io.BytesIO()
         stderr_bytes = io.BytesIO()
@@ -56,6 +67,7 @@ class NewCommandLineTests(unittest.TestCase):
         self.assertIn("fetch", rendered)
         self.assertIn("check", rendered)
         self.assertIn("init", rendered)
+        self.assertIn("daemon", rendered)
         self.assertNotIn("tui", rendered.casefold())
         self.assertNotIn("translate", rendered.casefold())
 
@@ -94,6 +106,7 @@ class NewCommandLineTests(unittest.TestCase):
         self.assertTrue(settings.comments)
         self.assertFalse(settings.media_download)
         self.assertEqual("never", settings.browser_fallback.value)
+        self.assertFalse(archive.call_args.kwargs["restart"])
         self.assertIn("归档完成：文章", output.getvalue())
         self.assertIn("HTTP/API", output.getvalue())
 
@@ -118,6 +131,43 @@ class NewCommandLineTests(unittest.TestCase):
         self.assertNotIn("private-member-id", rendered)
         self.assertNotIn("private-name", rendered)
 
+    def test_check_reports_each_account_and_fails_when_one_is_invalid(self):
+        report = SimpleNamespace(
+            cookie_diagnostic=CookieDiagnostic(missing=()),
+            login_status=LoginStatus(authenticated=True),
+            accounts=(
+                SimpleNamespace(
+                    name="first.json",
+                    cookie_diagnostic=CookieDiagnostic(missing=()),
+                    login_status=LoginStatus(authenticated=True),
+                ),
+                SimpleNamespace(
+                    name="second.json",
+                    cookie_diagnostic=CookieDiagnostic(missing=("d_c0",)),
+                    login_status=LoginStatus(authenticated=False),
+                ),
+                SimpleNamespace(
+                    name="third.json",
+                    cookie_diagnostic=CookieDiagnostic(missing=("z_c0", "d_c0")),
+                    login_status=None,
+                ),
+            ),
+        )
+        output = io.StringIO()
+
+        with patch("zhihu_scraper.cli.check_session", return_value=report):
+            with redirect_stdout(output):
+                exit_code = run_cli(["check"])
+
+        rendered = output.getvalue()
+        self.assertEqual(1, exit_code)
+        self.assertIn("账号 first.json：Cookie 字段齐全，登录状态有效。", rendered)
+        self.assertIn("账号 second.json：Cookie 缺少 d_c0", rendered)
+        self.assertIn(
+            "账号 third.json：Cookie 缺少 z_c0, d_c0，Cookie 文件为空，未请求登录状态。", rendered
+        )
+        self.assertIn("1/3 个账号可用", rendered)
+
     def test_fetch_reports_nonfatal_media_failures_without_marking_archive_failed(self):
         receipt = SimpleNamespace(
             entry_directory=Path("/archive/文章"),
@@ -142,6 +192,115 @@ class NewCommandLineTests(unittest.TestCase):
         self.assertIn("媒体警告：1 个", output.getvalue())
         self.assertIn("image-1", output.getvalue())
 
+    def test_fetch_warns_when_a_circuit_opened_or_the_retry_budget_ran_out(self):
+        receipt = SimpleNamespace(
+            entry_directory=Path("/archive/文章"),
+            markdown_path=None,
+            html_path=None,
+            database_path=None,
+        )
+        circuit = SimpleNamespace(
+            name="media",
+            times_opened=1,
+            rejected=4,
+            budget_exhausted=True,
+        )
+        report = SimpleNamespace(
+            target=SimpleNamespace(title="文章"),
+            receipt=receipt,
+            used_browser=False,
+            media_failures=(),
+            circuits=(circuit,),
+        )
+        output = io.StringIO()
+
+        with patch("zhihu_scraper.cli.archive_url", return_value=report):
+            with redirect_stdout(output):
+                exit_code = run_cli(["fetch", "https://zhuanlan.zhihu.com/p/1"])
+
+        self.assertEqual(0, exit_code)
+        self.assertIn("熔断警告：media", output.getvalue())
+        self.assertIn("4 个请求", output.getvalue())
+        self.assertIn("network.retry_budget", output.getvalue())
+
+    def test_fetch_lists_proxy_account_and_coalescing_stats_without_credentials(self):
+        receipt = SimpleNamespace(
+            entry_directory=Path("/archive/专栏"),
+            markdown_path=None,
+            html_path=None,
+            database_path=None,
+        )
+        report = SimpleNamespace(
+            target=SimpleNamespace(title="专栏"),
+            receipt=receipt,
+            used_browser=False,
+            media_failures=(),
+            proxies=(
+                SimpleNamespace(
+                    label="http://first.example:7890",
+                    requests=12,
+                    failures=1,
+                    mean_latency=0.4,
+                    ejected=False,
+                ),
+                SimpleNamespace(
+                    label="http://second.example:7891",
+                    requests=3,
+                    failures=3,
+                    mean_latency=None,
+                    ejected=True,
+                ),
+            ),
+            coalescing=SimpleNamespace(hits=5, coalesced=2, misses=9),
+            accounts=(
+                SimpleNamespace(
+                    name="second.json",
+                    requests=2,
+                    rejections=1,
+                    benched=True,
+                    quota_exhausted=False,
+                ),
+            ),
+        )
+        output = io.StringIO()
+
+        with patch("zhihu_scraper.cli.archive_url", return_value=report):
+            with redirect_stdout(output):
+                run_cli(["fetch", "https://www.zhihu.com/column/c"])
+
+        rendered = output.getvalue()
+        self.assertIn(
+            "代理 http://first.example:7890：请求 12 次，失败 1 次，平均延迟 0.40 秒", rendered
+        )
+        self.assertIn("平均延迟 无，当前已暂停", rendered)
+        self.assertIn("账号 second.json：请求 2 次，被拒绝 1 次，冷却中", rendered)
+        self.assertIn("复用最近结果 5 次，合并同时请求 2 次，实际请求 9 次", rendered)
+
+    def test_fetch_reports_browser_pages_and_launches(self):
+        receipt = SimpleNamespace(
+            entry_directory=Path("/archive/专栏"),
+            markdown_path=None,
+            html_path=None,
+            database_path=None,
+        )
+        report = SimpleNamespace(
+            target=SimpleNamespace(title="专栏"),
+            receipt=receipt,
+            used_browser=True,
+            media_failures=(),
+            browser_pages=4,
+            browser_launches=1,
+            browser_navigation=SimpleNamespace(pages=4, mean_seconds=1.25, blocked_requests=7),
+        )
+        output = io.StringIO()
+
+        with patch("zhihu_scraper.cli.archive_url", return_value=report):
+            with redirect_stdout(output):
+                run_cli(["fetch", "https://www.zhihu.com/column/c"])
+
+        self.assertIn("浏览器回退：加载 4 个页面，本次启动浏览器 1 次。", output.getvalue())
+        self.assertIn("浏览器页面：加载 4 个，平均 1.25 秒，拦截 7 个资源请求。", output.getvalue())
+
     def test_init_never_overwrites_existing_settings(self):
         with tempfile.TemporaryDirectory() as temporary_directory:
             path = Path(temporary_directory) / "settings.toml"
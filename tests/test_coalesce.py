@@ -0,0 +1,162 @@
+import threading
+import time
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from zhihu_scraper.coalesce import CoalescingZhihuClient
+from zhihu_scraper.http import LoginStatus, TransportError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingClient:
+    def __init__(self, *, gate: threading.Event | None = None):
+        self.gate = gate
+        self.calls: list[str] = []
+        self.failures: list[BaseException] = []
+        self.cookies: dict[str, str] = {}
+        self.login_checks = 0
+        self.closed = False
+
+    def get_json(self, url_or_path: str) -> object:
+        self.calls.append(url_or_path)
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if self.failures:
+            raise self.failures.pop(0)
+        return {"url": url_or_path, "call": len(self.calls)}
+
+    def get_html(self, url_or_path: str) -> str:
+        self.calls.append(url_or_path)
+        return "<html></html>"
+
+    def check_login(self) -> LoginStatus:
+        self.login_checks += 1
+        return LoginStatus(authenticated=True, member_id="member")
+
+    def update_cookies(self, cookies):
+        self.cookies.update(cookies)
+
+    def close(self):
+        self.closed = True
+
+
+class SubmittingClient(RecordingClient):
+    def __init__(self):
+        super().__init__()
+        self.pending: list[tuple[str, Future[object]]] = []
+
+    def submit_json(self, url: str) -> Future[object]:
+        self.calls.append(url)
+        future: Future[object] = Future()
+        self.pending.append((url, future))
+        return future
+
+
+class CoalescingClientTests(unittest.TestCase):
+    def test_memoizes_successful_json_for_the_configured_ttl(self):
+        clock = FakeClock()
+        inner = RecordingClient()
+        client = CoalescingZhihuClient(inner, memo_ttl=30, clock=clock)
+
+        first = client.get_json("/api/v4/questions/1")
+        second = client.get_json("https://www.zhihu.com/api/v4/questions/1")
+        clock.now = 31
+        third = client.get_json("/api/v4/questions/1")
+
+        self.assertEqual(first, second)
+        self.assertEqual(third["call"], 2)
+        stats = client.stats()
+        self.assertEqual((stats.hits, stats.coalesced, stats.misses), (1, 0, 2))
+        client.reset_stats()
+        self.assertEqual(client.stats().misses, 0)
+
+    def test_every_caller_gets_its_own_copy_of_a_shared_result(self):
+        client = CoalescingZhihuClient(RecordingClient(), memo_ttl=30, clock=FakeClock())
+
+        first = client.get_json("/api/v4/questions/1")
+        first["call"] = "edited"
+        second = client.get_json("/api/v4/questions/1")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second["call"], 1)
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        gate = threading.Event()
+        inner = RecordingClient(gate=gate)
+        client = CoalescingZhihuClient(inner, memo_ttl=0)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(client.get_json, "/api/v4/me/x") for _ in range(4)]
+            while client.stats().coalesced + client.stats().misses < 4:
+                time.sleep(0.01)
+            gate.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(len(inner.calls), 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(len({id(result) for result in results}), 4)
+        self.assertEqual(client.stats().coalesced, 3)
+
+    def test_failures_reach_every_waiter_and_are_not_memoized(self):
+        inner = RecordingClient()
+        inner.failures.append(TransportError("temporary failure"))
+        client = CoalescingZhihuClient(inner)
+
+        with self.assertRaises(TransportError):
+            client.get_json("/api/v4/answers/1")
+        self.assertEqual(client.get_json("/api/v4/answers/1")["call"], 2)
+
+    def test_submit_json_is_offered_only_when_the_wrapped_client_has_it(self):
+        self.assertFalse(hasattr(CoalescingZhihuClient(RecordingClient()), "submit_json"))
+        self.assertTrue(callable(CoalescingZhihuClient(SubmittingClient()).submit_json))
+
+    def test_submitted_requests_are_shared_without_waiting(self):
+        inner = SubmittingClient()
+        client = CoalescingZhihuClient(inner)
+
+        first = client.submit_json("/api/v4/columns/c/items?offset=20")
+        second = client.submit_json("/api/v4/columns/c/items?offset=20")
+        self.assertEqual(len(inner.pending), 1)
+        self.assertFalse(first.done())
+
+        inner.pending[0][1].set_result({"data": []})
+
+        self.assertEqual(first.result(), {"data": []})
+        self.assertEqual(second.result(), {"data": []})
+        self.assertFalse(first.cancel())
+
+    def test_cookie_updates_drop_memoized_results(self):
+        inner = RecordingClient()
+        client = CoalescingZhihuClient(inner)
+
+        client.get_json("/api/v4/answers/1")
+        client.update_cookies({"z_c0": "new"})
+        client.get_json("/api/v4/answers/1")
+
+        self.assertEqual(len(inner.calls), 2)
+        self.assertEqual(inner.cookies, {"z_c0": "new"})
+
+    def test_login_checks_are_memoized_and_html_passes_through(self):
+        inner = RecordingClient()
+        client = CoalescingZhihuClient(inner)
+
+        self.assertTrue(client.check_login().authenticated)
+        self.assertTrue(client.check_login().authenticated)
+        client.get_html("/question/1")
+        client.get_html("/question/1")
+        client.close()
+
+        self.assertEqual(inner.login_checks, 1)
+        self.assertEqual(inner.calls, ["/question/1", "/question/1"])
+        self.assertTrue(inner.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from concurrent.futures import Future
 from datetime import UTC, datetime
 
 from zhihu_scraper.comments import InvalidCommentPayloadError, fetch_comment_thread
@@ -235,6 +236,66 @@ class CommentFetchingTests(unittest.TestCase):
         self.assertEqual(thread.comments[0].replies, ())
         self.assertTrue(thread.comments[0].replies_complete)
 
+    def test_zero_comment_count_returns_an_empty_thread_without_requests(self):
+        client = FakeClient({})
+
+        thread = fetch_comment_thread(
+            client,
+            target_kind="answer",
+            target_id="654",
+            comment_count=0,
+        )
+
+        self.assertEqual(client.calls, [])
+        self.assertEqual(thread.comments, ())
+        self.assertEqual(thread.order, "api_returned")
+        self.assertTrue(thread.roots_complete)
+
+    def test_first_reply_pages_are_submitted_together_and_kept_in_api_order(self):
+        root_url = "/api/v4/comment_v5/answers/77/root_comment?limit=10&offset="
+
+        def reply_url(root_id):
+            return f"/api/v4/comment_v5/comment/{root_id}/child_comment?limit=10&offset="
+
+        class SubmittingClient(FakeClient):
+            def __init__(self, responses):
+                super().__init__(responses)
+                self.submitted = []
+
+            def submit_json(self, url):
+                self.submitted.append((url, len(self.calls)))
+                future = Future()
+                future.set_result(self.responses[url])
+                return future
+
+        client = SubmittingClient(
+            {
+                root_url: {
+                    "data": [_comment_payload(root_id, f"评论 {root_id}") for root_id in (3, 1, 2)],
+                    "paging": {"is_end": True, "next": ""},
+                },
+                **{
+                    reply_url(root_id): {
+                        "data": [_comment_payload(root_id * 10, f"回复 {root_id}")],
+                        "paging": {"is_end": True, "next": ""},
+                    }
+                    for root_id in (3, 1, 2)
+                },
+            }
+        )
+
+        thread = fetch_comment_thread(client, target_kind="answer", target_id="77")
+
+        self.assertEqual(client.calls, [root_url])
+        self.assertEqual(
+            client.submitted,
+            [(reply_url(root_id), 1) for root_id in (3, 1, 2)],
+        )
+        self.assertEqual(
+            [(comment.id, comment.replies[0].id) for comment in thread.comments],
+            [("3", "30"), ("1", "10"), ("2", "20")],
+        )
+
     def test_anonymous_and_deleted_authors_are_normalized_without_fake_identity(self):
         root_url = "/api/v4/comment_v5/answers/654/root_comment?limit=10&offset="
         anonymous = _comment_payload(40, "匿名评论")
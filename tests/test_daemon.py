@@ -0,0 +1,162 @@
+import io
+import os
+import socket
+import stat
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from zhihu_scraper.cli import _run_daemon_job, run_cli
+from zhihu_scraper.daemon import ArchiveDaemon, DaemonError, WarmWorkflows, send_job
+from zhihu_scraper.settings import ArchiveSettings
+
+
+class FakeWorkflow:
+    def __init__(self, settings):
+        self.settings = settings
+        self.urls = []
+        self.restarts = []
+        self.closed = False
+
+    def run(self, url, *, restart=False):
+        self.urls.append(url)
+        self.restarts.append(restart)
+        return SimpleNamespace(
+            target=SimpleNamespace(title="守护进程文章"),
+            receipt=SimpleNamespace(
+                entry_directory=self.settings.output_dir / "守护进程文章",
+                markdown_path=None,
+                html_path=None,
+                database_path=None,
+            ),
+            used_browser=False,
+        )
+
+    def close(self):
+        self.closed = True
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are unavailable")
+class ArchiveDaemonTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.socket_path = self.directory / "daemon.sock"
+        self.built = []
+
+    def build(self, settings):
+        workflow = FakeWorkflow(settings)
+        self.built.append(workflow)
+        return workflow
+
+    def start(self, handle):
+        daemon = ArchiveDaemon(handle, socket_path=self.socket_path)
+        thread = threading.Thread(target=daemon.serve_forever)
+        thread.start()
+
+        def stop():
+            daemon.shutdown()
+            thread.join()
+            daemon.close()
+
+        self.addCleanup(stop)
+        return daemon
+
+    def test_fetch_is_forwarded_to_one_warm_workflow(self):
+        workflows = WarmWorkflows(self.build)
+        self.addCleanup(workflows.close)
+        self.start(partial(_run_daemon_job, workflows))
+        output = io.StringIO()
+
+        with (
+            patch.dict(os.environ, {"ZHIHU_DAEMON_SOCKET": str(self.socket_path)}),
+            patch("zhihu_scraper.cli.archive_url", side_effect=AssertionError("ran locally")),
+            redirect_stdout(output),
+        ):
+            first = run_cli(["fetch", "https://www.zhihu.com/answer/1", "-o", str(self.directory)])
+            second = run_cli(
+                ["fetch", "https://www.zhihu.com/answer/2", "-o", str(self.directory), "--restart"]
+            )
+
+        self.assertEqual((0, 0), (first, second))
+        self.assertEqual(1, len(self.built))
+        self.assertEqual(
+            ["https://www.zhihu.com/answer/1", "https://www.zhihu.com/answer/2"],
+            self.built[0].urls,
+        )
+        self.assertEqual([False, True], self.built[0].restarts)
+        self.assertEqual(2, output.getvalue().count("归档完成：守护进程文章"))
+
+    def test_job_errors_come_back_as_client_exit_codes(self):
+        workflows = WarmWorkflows(self.build)
+        self.addCleanup(workflows.close)
+        self.start(partial(_run_daemon_job, workflows))
+
+        reply = send_job(
+            {
+                "argv": ["fetch", "https://www.zhihu.com/answer/1", "-s", "missing.toml"],
+                "cwd": str(self.directory),
+            },
+            socket_path=self.socket_path,
+        )
+
+        self.assertIsNotNone(reply)
+        self.assertEqual(1, reply["exit_code"])
+        self.assertIn("错误：找不到设置文件：missing.toml", reply["stderr"])
+        self.assertEqual([], self.built)
+
+    def test_no_listener_means_the_client_runs_locally(self):
+        self.socket_path.write_text("", encoding="utf-8")
+
+        self.assertIsNone(send_job({"argv": []}, socket_path=self.socket_path))
+
+    def test_stale_socket_is_replaced_and_a_live_one_refused(self):
+        self.socket_path.write_text("", encoding="utf-8")
+        self.start(lambda job: {"echo": job})
+
+        self.assertEqual(0o600, stat.S_IMODE(self.socket_path.stat().st_mode))
+        with self.assertRaises(DaemonError):
+            ArchiveDaemon(lambda job: job, socket_path=self.socket_path)
+        self.assertEqual(
+            {"echo": {"argv": []}},
+            send_job({"argv": []}, socket_path=self.socket_path),
+        )
+
+    def test_least_recently_used_workflow_is_closed_past_the_limit(self):
+        workflows = WarmWorkflows(self.build, limit=1)
+        settings_a = ArchiveSettings(output_dir=Path("/a"))
+        settings_b = ArchiveSettings(output_dir=Path("/b"))
+
+        first = workflows.get(settings_a, directory="/a")
+        self.assertIs(first, workflows.get(settings_a, directory="/a"))
+        second = workflows.get(settings_b, directory="/a")
+
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+        self.assertEqual(2, len(self.built))
+
+    def test_workflow_is_rebuilt_after_its_cookie_file_changes(self):
+        cookie_file = self.directory / "cookies.json"
+        cookie_file.write_text('{"z_c0": "old"}', encoding="utf-8")
+        settings = ArchiveSettings(cookie_file=Path("cookies.json"))
+        workflows = WarmWorkflows(self.build)
+        self.addCleanup(workflows.close)
+
+        first = workflows.get(settings, directory=str(self.directory))
+        self.assertIs(first, workflows.get(settings, directory=str(self.directory)))
+        cookie_file.write_text('{"z_c0": "renewed"}', encoding="utf-8")
+        second = workflows.get(settings, directory=str(self.directory))
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
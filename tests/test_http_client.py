@@ -1,13 +1,20 @@
+import asyncio
 import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
+from zhihu_scraper.cache import ResponseCache
+from zhihu_scraper.comments import fetch_comment_thread
 from zhihu_scraper.http import (
     AccessDeniedError,
+    AsyncZhihuHttpClient,
     AuthenticationError,
+    ConcurrentZhihuHttpClient,
     CookieFileError,
     InvalidResponseError,
+    PooledZhihuHttpClient,
     RateLimitError,
     ServerError,
     TransportError,
@@ -52,6 +59,29 @@ class FakeSession:
         self.close_count += 1
 
 
+class FakeAsyncSession:
+    def __init__(self, responses: dict[str, FakeResponse], *, delay: float = 0.0):
+        self._responses = dict(responses)
+        self._delay = delay
+        self.calls: list[tuple[str, dict[str, object]]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.close_count = 0
+
+    async def get(self, url: str, **kwargs):
+        self.calls.append((url, kwargs))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self.in_flight -= 1
+        return self._responses[url]
+
+    async def close(self):
+        self.close_count += 1
+
+
 class ExplodingSession:
     def __init__(self, message: str):
         self._message = message
@@ -404,5 +434,187 @@ class ZhihuHttpClientTests(unittest.TestCase):
         self.assertNotIn(secret_value, str(raised.exception))
 
 
+class AsyncZhihuHttpClientTests(unittest.TestCase):
+    def test_in_flight_requests_never_exceed_the_configured_limit(self):
+        urls = [f"https://www.zhihu.com/api/v4/answers/{number}" for number in range(6)]
+        session = FakeAsyncSession(
+            {url: FakeResponse(json_data={"id": url}) for url in urls},
+            delay=0.01,
+        )
+        client = AsyncZhihuHttpClient(session=session, max_in_flight=2)
+
+        async def fetch_all():
+            async with client:
+                return await asyncio.gather(*(client.get_json(url) for url in urls))
+
+        payloads = asyncio.run(fetch_all())
+
+        self.assertEqual([{"id": url} for url in urls], payloads)
+        self.assertEqual(2, session.peak_in_flight)
+        self.assertEqual(1, session.close_count)
+
+    def test_async_client_keeps_redirect_refusal_origin_checks_and_sanitized_errors(self):
+        secret_value = "async-secret-cookie"
+        session = FakeAsyncSession(
+            {
+                "https://www.zhihu.com/api/v4/articles/1": FakeResponse(
+                    status_code=302,
+                    headers={"Location": "https://attacker.example/cookie-sink"},
+                ),
+                "https://www.zhihu.com/api/v4/me": FakeResponse(status_code=401),
+            }
+        )
+        client = AsyncZhihuHttpClient(cookies={"z_c0": secret_value}, session=session)
+
+        with self.assertRaisesRegex(InvalidResponseError, "unexpected redirect"):
+            asyncio.run(client.get_json("/api/v4/articles/1"))
+        with self.assertRaises(UnsafeZhihuUrlError):
+            asyncio.run(client.get_html("https://attacker.example/collect"))
+        with self.assertRaises(AuthenticationError) as raised:
+            asyncio.run(client.get_json("/api/v4/me"))
+
+        self.assertNotIn(secret_value, str(raised.exception))
+        self.assertEqual(2, len(session.calls))
+        self.assertIs(False, session.calls[0][1]["allow_redirects"])
+
+    def test_async_server_errors_retry_with_awaited_backoff(self):
+        responses = [FakeResponse(status_code=503), FakeResponse(json_data={"id": "member"})]
+        delays: list[float] = []
+
+        class SequencedSession:
+            async def get(self, requested_url, **kwargs):
+                return responses.pop(0)
+
+        async def record_delay(delay):
+            delays.append(delay)
+
+        client = AsyncZhihuHttpClient(session=SequencedSession(), sleep=record_delay)
+
+        status = asyncio.run(client.check_login())
+
+        self.assertTrue(status.authenticated)
+        self.assertEqual([1.0], delays)
+        self.assertEqual([], responses)
+
+
+class ConcurrentZhihuHttpClientTests(unittest.TestCase):
+    def test_comment_threads_work_unchanged_through_the_blocking_bridge(self):
+        root_url = "https://www.zhihu.com/api/v4/comment_v5/answers/2/root_comment?limit=10&offset="
+        session = FakeAsyncSession(
+            {
+                root_url: FakeResponse(
+                    json_data={
+                        "data": [
+                            {
+                                "id": "c1",
+                                "content": "<p>评论</p>",
+                                "child_comment_count": 0,
+                            }
+                        ],
+                        "paging": {"is_end": True, "next": ""},
+                    }
+                )
+            }
+        )
+
+        with ConcurrentZhihuHttpClient(AsyncZhihuHttpClient(session=session)) as client:
+            thread = fetch_comment_thread(client, target_kind="answer", target_id="2")
+
+        self.assertEqual(("c1",), tuple(comment.id for comment in thread.comments))
+        self.assertEqual(1, session.close_count)
+
+    def test_submitted_requests_overlap_and_close_is_idempotent(self):
+        urls = [f"https://www.zhihu.com/api/v4/articles/{number}" for number in range(4)]
+        session = FakeAsyncSession(
+            {url: FakeResponse(json_data={"id": url}) for url in urls},
+            delay=0.01,
+        )
+        client = ConcurrentZhihuHttpClient(AsyncZhihuHttpClient(session=session, max_in_flight=4))
+
+        futures = [client.submit_json(url) for url in urls]
+        payloads = [future.result() for future in futures]
+        client.close()
+        client.close()
+
+        self.assertEqual([{"id": url} for url in urls], payloads)
+        self.assertGreater(session.peak_in_flight, 1)
+        self.assertEqual(1, session.close_count)
+        with self.assertRaises(TransportError):
+            client.get_json(urls[0])
+
+    def test_get_json_accepts_use_cache_like_the_other_clients(self):
+        url = "https://www.zhihu.com/api/v4/articles/1"
+        session = FakeAsyncSession({url: FakeResponse(json_data={"id": 1}, text='{"id": 1}')})
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(Path(directory) / "cache.db", ttl=60)
+            with ConcurrentZhihuHttpClient(
+                AsyncZhihuHttpClient(session=session, cache=cache)
+            ) as client:
+                client.get_json(url)
+                client.get_json(url)
+                client.get_json(url, use_cache=False)
+
+        self.assertEqual(2, len(session.calls))
+
+
+class PooledHttpClientTests(unittest.TestCase):
+    def _pool(self, **kwargs):
+        sessions: list[FakeSession] = []
+
+        def session_factory():
+            session = FakeSession([FakeResponse(json_data={"ok": True}) for _ in range(4)])
+            sessions.append(session)
+            return session
+
+        return PooledZhihuHttpClient(session_factory=session_factory, **kwargs), sessions
+
+    def test_each_thread_reuses_its_own_session(self):
+        client, sessions = self._pool()
+        barrier = threading.Barrier(3)
+
+        def fetch_twice():
+            barrier.wait(timeout=5)
+            client.get_json("/api/v4/answers/1")
+            client.get_json("/api/v4/answers/2")
+
+        threads = [threading.Thread(target=fetch_twice) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(3, client.session_count)
+        self.assertEqual([2, 2, 2], [len(session.calls) for session in sessions])
+
+    def test_cookie_updates_reach_existing_and_future_sessions(self):
+        client, sessions = self._pool(cookies={"z_c0": "initial-z"})
+        client.get_json("/api/v4/me")
+
+        client.update_cookies({"d_c0": "browser-d", "": "ignored"})
+        client.get_json("/api/v4/me")
+        worker = threading.Thread(target=client.get_json, args=("/api/v4/me",))
+        worker.start()
+        worker.join()
+
+        expected = {"z_c0": "initial-z", "d_c0": "browser-d"}
+        self.assertEqual(expected, sessions[0].calls[1][1]["cookies"])
+        self.assertEqual(expected, sessions[1].calls[0][1]["cookies"])
+
+    def test_close_releases_every_session_exactly_once(self):
+        client, sessions = self._pool()
+        client.get_json("/api/v4/me")
+        worker = threading.Thread(target=client.get_json, args=("/api/v4/me",))
+        worker.start()
+        worker.join()
+
+        with client:
+            pass
+        client.close()
+
+        self.assertEqual([1, 1], [session.close_count for session in sessions])
+        with self.assertRaises(TransportError):
+            client.get_json("/api/v4/me")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import sqlite3
 import tempfile
 import unittest
 from contextlib import closing
+from dataclasses import replace
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -227,6 +228,9 @@ class LocalArchiveLayoutTests(unittest.TestCase):
             proxy=None,
             timeout=30.0,
             max_retries=0,
+            rate_limiter=None,
+            circuit=None,
+            proxy_pool=None,
         ):
             destination.parent.mkdir(parents=True, exist_ok=True)
             destination.write_bytes(b"media")
@@ -249,6 +253,9 @@ class LocalArchiveLayoutTests(unittest.TestCase):
                 "proxy": proxy,
                 "timeout": 30.0,
                 "max_retries": 3,
+                "rate_limiter": None,
+                "circuit": None,
+                "proxy_pool": None,
             },
         )
 
@@ -399,6 +406,140 @@ class LocalArchiveLayoutTests(unittest.TestCase):
                 question_receipt.markdown_path.read_text(encoding="utf-8"),
             )
 
+    def test_streamed_question_and_column_match_the_collected_archive(self):
+        question_url = "https://www.zhihu.com/question/10"
+        answers = tuple(
+            Answer(
+                id=str(answer_id),
+                question=QuestionRef(id="10", title="问题", url=question_url),
+                source_url=f"{question_url}/answer/{answer_id}",
+                author=Author(id=f"author-{answer_id}", name=f"作者{answer_id}"),
+                published_at=NOW,
+                blocks=(
+                    Paragraph((Text(f"回答 {answer_id}"),)),
+                    _image_block(f"https://pic.example/{answer_id}.png"),
+                ),
+            )
+            for answer_id in (2, 3)
+        )
+        question = QuestionArchive(
+            question=Question(
+                id="10",
+                title="问题",
+                source_url=question_url,
+                detail=(Paragraph((Text("问题详情"),)),),
+                answer_count=2,
+            ),
+            answers=answers,
+            archived_at=NOW,
+        )
+        column_ref = ColumnRef(
+            token="machinelearningpku",
+            title="机器学习",
+            url="https://www.zhihu.com/column/machinelearningpku",
+        )
+        articles = tuple(
+            Article(
+                id=str(article_id),
+                title="同名文章" if article_id < 3 else f"文章 {article_id}",
+                source_url=f"https://zhuanlan.zhihu.com/p/{article_id}",
+                author=AUTHOR,
+                published_at=datetime(2020 + article_id, 1, 1, tzinfo=UTC),
+                blocks=(_image_block(f"https://pic.example/p{article_id}.png"),),
+                columns=(column_ref,),
+            )
+            for article_id in (1, 2, 3)
+        )
+        column = ColumnArchive(
+            column=Column(
+                token=column_ref.token,
+                title=column_ref.title,
+                source_url=column_ref.url,
+                description="",
+                author=AUTHOR,
+                item_count=3,
+            ),
+            articles=articles,
+            archived_at=NOW,
+        )
+
+        with (
+            tempfile.TemporaryDirectory() as collected_directory,
+            tempfile.TemporaryDirectory() as streamed_directory,
+        ):
+            collected_root = Path(collected_directory)
+            streamed_root = Path(streamed_directory)
+            collected = LocalArchive(collected_root, downloader=FakeDownloader())
+            streamed = LocalArchive(streamed_root, downloader=FakeDownloader())
+            for target, items in ((question, answers), (column, articles)):
+                collected.archive(target)
+                if isinstance(target, QuestionArchive):
+                    receipt = streamed.archive_stream(replace(target, answers=()), iter(items))
+                else:
+                    receipt = streamed.archive_stream(replace(target, articles=()), iter(items))
+                self.assertEqual(2 if target is question else 3, len(receipt.media_downloads))
+
+            collected_files = _archive_files(collected_root)
+            self.assertEqual(collected_files, _archive_files(streamed_root))
+            self.assertFalse(any(".part" in name for name in collected_files))
+            self.assertEqual(_content_rows(collected_root), _content_rows(streamed_root))
+
+    def test_interrupted_stream_keeps_the_answers_already_written(self):
+        question_url = "https://www.zhihu.com/question/10"
+        question = QuestionArchive(
+            question=Question(id="10", title="问题", source_url=question_url),
+            answers=(),
+            archived_at=NOW,
+        )
+
+        def answers():
+            yield Answer(
+                id="2",
+                question=QuestionRef(id="10", title="问题", url=question_url),
+                source_url=f"{question_url}/answer/2",
+                author=AUTHOR,
+                published_at=NOW,
+                blocks=(Paragraph((Text("已保存的回答"),)),),
+            )
+            raise RuntimeError("network lost")
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            with self.assertRaisesRegex(RuntimeError, "network lost"):
+                LocalArchive(root, media_download=False).archive_stream(question, answers())
+
+            self.assertEqual({"question:10", "answer:2"}, set(_content_rows(root)))
+            self.assertEqual({"zhihu.db"}, _archive_files(root).keys())
+
+
+def _image_block(source_url):
+    return MediaBlock(
+        MediaAsset(
+            id=source_url.rsplit("/", 1)[-1],
+            kind=MediaKind.IMAGE,
+            renditions=(MediaRendition(source_url),),
+            alt_text="图片",
+        )
+    )
+
+
+def _archive_files(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and path.name != "zhihu.db"
+    } | ({"zhihu.db": b""} if (root / "zhihu.db").exists() else {})
+
+
+def _content_rows(root):
+    with closing(sqlite3.connect(root / "zhihu.db")) as connection:
+        return {
+            key: (title, body)
+            for key, title, body in connection.execute(
+                "SELECT content_key, title, body_text FROM contents"
+            )
+        }
+
 
 if __name__ == "__main__":
     unittest.main()
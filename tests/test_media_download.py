@@ -13,6 +13,8 @@ from zhihu_scraper.media import (
     download_media,
     select_highest_resolution,
 )
+from zhihu_scraper.proxies import ProxyPool
+from zhihu_scraper.ratelimit import HostClass, RateLimiter
 
 
 class FakeHttpResponse:
@@ -86,6 +88,11 @@ class SequencedTransport:
         return self.responses.pop(0)
 
 
+class _FailingOpener:
+    def open(self, request: Request, *, timeout: float | None = None):
+        raise ConnectionError("proxy unreachable")
+
+
 class MediaQualitySelectionTests(unittest.TestCase):
     def test_selects_highest_resolution_and_keeps_the_first_exact_tie(self):
         first_full_hd = MediaCandidate(
@@ -354,6 +361,39 @@ class ResumableMediaDownloadTests(unittest.TestCase):
         self.assertEqual(opener.timeouts, [12.5])
         self.assertEqual(receipt.bytes_total, 7)
 
+    def test_proxy_pool_picks_a_proxy_per_attempt_and_scores_it(self):
+        first = "http://127.0.0.1:7890"
+        second = "http://127.0.0.1:7891"
+        pool = ProxyPool([first, second], failure_threshold=1)
+        opener = RecordingOpener(
+            FakeHttpResponse(status=200, body=b"pooled", headers={"Content-Length": "6"})
+        )
+
+        with (
+            tempfile.TemporaryDirectory() as temporary_directory,
+            patch("zhihu_scraper.media.ProxyHandler") as handler,
+            patch(
+                "zhihu_scraper.media.build_opener",
+                side_effect=[_FailingOpener(), opener],
+            ),
+        ):
+            receipt = download_media(
+                "https://pic.example/image.jpg",
+                Path(temporary_directory) / "image.jpg",
+                max_retries=1,
+                sleep=lambda _delay: None,
+                proxy_pool=pool,
+            )
+
+        self.assertEqual(receipt.bytes_total, 6)
+        self.assertEqual(
+            [call.args[0]["https"] for call in handler.call_args_list],
+            [first, second],
+        )
+        stats = pool.stats()
+        self.assertTrue(stats[0].ejected)
+        self.assertEqual((stats[1].requests, stats[1].failures), (1, 0))
+
     def test_retries_temporary_server_failure_with_bounded_backoff(self):
         transport = SequencedTransport(
             FakeHttpResponse(status=503, body=b"", headers={}),
@@ -379,6 +419,41 @@ class ResumableMediaDownloadTests(unittest.TestCase):
         self.assertEqual(len(transport.requests), 2)
         self.assertEqual(sleeps, [1.0])
 
+    def test_shared_rate_limiter_paces_media_and_honours_retry_after(self):
+        transport = SequencedTransport(
+            FakeHttpResponse(status=429, body=b"", headers={"Retry-After": "5"}),
+            FakeHttpResponse(status=200, body=b"ok", headers={"Content-Length": "2"}),
+        )
+        now = [0.0]
+        limiter_sleeps: list[float] = []
+
+        def limiter_sleep(seconds: float) -> None:
+            limiter_sleeps.append(seconds)
+            now[0] += seconds
+
+        limiter = RateLimiter(
+            clock=lambda: now[0],
+            wall_clock=lambda: now[0],
+            sleep=limiter_sleep,
+        )
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            download_media(
+                "https://pic1.zhimg.com/v2-image.jpg",
+                Path(temporary_directory) / "image.jpg",
+                transport=transport,
+                max_retries=1,
+                sleep=lambda _delay: None,
+                rate_limiter=limiter,
+            )
+
+        media_stats = next(
+            stats for stats in limiter.stats() if stats.host_class is HostClass.MEDIA
+        )
+        self.assertEqual(media_stats.requests, 2)
+        self.assertEqual(media_stats.throttled, 1)
+        self.assertEqual(limiter_sleeps, [5.0])
+
     def test_does_not_retry_permanent_client_failure(self):
         transport = SequencedTransport(
             FakeHttpResponse(status=404, body=b"", headers={}),
@@ -113,6 +113,7 @@ class ZhihuPayloadNormalizationTests(unittest.TestCase):
         )
 
         self.assertEqual(251, article.voteup_count)
+        self.assertIsNone(article.comment_count)
         self.assertEqual("https://pic.example/browser-cover.jpg", article.cover_url)
         self.assertEqual("https://www.zhihu.com/people/yong-yu", article.author.url)
         self.assertEqual(
@@ -132,6 +133,7 @@ class ZhihuPayloadNormalizationTests(unittest.TestCase):
                 "created_time": 1672502400,
                 "updated_time": 1672588800,
                 "voteup_count": 42,
+                "comment_count": 0,
                 "author": {"id": "author-id", "name": "回答者"},
                 "question": {"id": 28696373, "title": "如何理解机器学习？"},
             }
@@ -145,6 +147,7 @@ class ZhihuPayloadNormalizationTests(unittest.TestCase):
             answer.source_url,
         )
         self.assertEqual(42, answer.voteup_count)
+        self.assertEqual(0, answer.comment_count)
         self.assertIsNone(answer.comments)
 
     def test_question_payload_keeps_detail_and_counts(self):
@@ -0,0 +1,133 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from zhihu_scraper.database import ArchiveDatabase
+from zhihu_scraper.paging import AdaptivePageSize
+
+
+class AdaptivePageSizeTests(unittest.TestCase):
+    def test_starts_large_and_grows_back_after_failures_while_pages_are_fast(self):
+        page_sizes = AdaptivePageSize(minimum=5, maximum=100)
+
+        self.assertEqual(page_sizes.initial("question_answers"), 100)
+        self.assertEqual(page_sizes.failed("question_answers", requested=100), 50)
+        self.assertEqual(page_sizes.failed("question_answers", requested=50), 25)
+        self.assertEqual(
+            page_sizes.succeeded(
+                "question_answers",
+                requested=25,
+                returned=25,
+                is_end=False,
+                latency=0.2,
+            ),
+            38,
+        )
+
+    def test_slow_pages_shrink_and_the_floor_stops_retrying(self):
+        page_sizes = AdaptivePageSize(minimum=5, maximum=100, latency_target=1.0)
+
+        self.assertEqual(
+            page_sizes.succeeded(
+                "column_items",
+                requested=100,
+                returned=100,
+                is_end=False,
+                latency=3.0,
+            ),
+            75,
+        )
+        self.assertIsNone(page_sizes.failed("column_items", requested=5))
+
+    def test_repeated_short_non_final_pages_cap_later_growth(self):
+        page_sizes = AdaptivePageSize()
+
+        for _ in range(2):
+            page_sizes.succeeded(
+                "question_answers",
+                requested=100,
+                returned=20,
+                is_end=False,
+                latency=0.1,
+            )
+        next_size = page_sizes.succeeded(
+            "question_answers",
+            requested=20,
+            returned=20,
+            is_end=False,
+            latency=0.1,
+        )
+
+        self.assertEqual(next_size, 20)
+
+    def test_a_single_short_page_does_not_cap_and_caps_stay_within_bounds(self):
+        page_sizes = AdaptivePageSize(minimum=5, maximum=100)
+
+        self.assertEqual(
+            page_sizes.succeeded(
+                "question_answers",
+                requested=100,
+                returned=2,
+                is_end=False,
+                latency=0.1,
+            ),
+            100,
+        )
+        self.assertEqual(
+            page_sizes.succeeded(
+                "question_answers",
+                requested=100,
+                returned=2,
+                is_end=False,
+                latency=0.1,
+            ),
+            5,
+        )
+
+    def test_learned_caps_are_probed_again_after_many_full_pages(self):
+        page_sizes = AdaptivePageSize()
+        for _ in range(2):
+            page_sizes.succeeded(
+                "column_items",
+                requested=100,
+                returned=20,
+                is_end=False,
+                latency=0.1,
+            )
+
+        sizes = [
+            page_sizes.succeeded(
+                "column_items",
+                requested=20,
+                returned=20,
+                is_end=False,
+                latency=0.1,
+            )
+            for _ in range(20)
+        ]
+
+        self.assertEqual(sizes[:-1], [20] * 19)
+        self.assertEqual(sizes[-1], 30)
+
+    def test_learned_sizes_survive_between_runs_in_the_archive_database(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            database = ArchiveDatabase(Path(temporary_directory) / "zhihu.db")
+            first_run = AdaptivePageSize(database)
+            for _ in range(2):
+                first_run.succeeded(
+                    "question_answers",
+                    requested=100,
+                    returned=20,
+                    is_end=False,
+                    latency=0.1,
+                )
+
+            second_run = AdaptivePageSize(ArchiveDatabase(database.path))
+
+            self.assertEqual(second_run.initial("question_answers"), 20)
+            self.assertEqual(second_run.initial("column_items"), 100)
+            self.assertEqual(database.load_page_sizes(), {"question_answers": (20, 20)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -67,6 +67,42 @@ class PublicApiTests(unittest.TestCase):
         self.assertEqual(["/api/v4/articles/1"], client.calls)
         self.assertEqual([report.target], sink.saved)
 
+    def test_each_account_is_paced_on_its_own_and_reported_per_run(self):
+        def account_client(**kwargs):
+            client = Mock(spec=["get_json", "get_html", "check_login", "update_cookies", "close"])
+            client.get_json.side_effect = FakeClient().get_json
+            return client
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            directory = Path(temporary_directory)
+            first = directory / "first.json"
+            second = directory / "second.json"
+            first.write_text('{"z_c0": "first-secret", "d_c0": "d"}', encoding="utf-8")
+            second.write_text('{"z_c0": "second-secret", "d_c0": "d"}', encoding="utf-8")
+            with patch(
+                "zhihu_scraper.facade.PooledZhihuHttpClient",
+                side_effect=account_client,
+            ) as client_type:
+                workflow = build_workflow(
+                    ArchiveSettings(
+                        output_dir=directory,
+                        cookie_file=first,
+                        cookie_files=(second,),
+                        browser_fallback=BrowserFallback.NEVER,
+                    ),
+                    sink=FakeSink(),
+                )
+                report = workflow.run("https://zhuanlan.zhihu.com/p/1")
+                workflow.close()
+
+        first_limiter, second_limiter = (
+            call.kwargs["rate_limiter"] for call in client_type.call_args_list
+        )
+        self.assertIsNot(first_limiter, second_limiter)
+        self.assertEqual(["first.json", "second.json"], [a.name for a in report.accounts])
+        self.assertEqual([1, 0], [account.requests for account in report.accounts])
+        self.assertEqual(1, report.coalescing.misses)
+
     def test_session_check_without_cookie_file_is_local_and_reports_both_names(self):
         report = check_session(ArchiveSettings())
 
@@ -98,6 +134,53 @@ class PublicApiTests(unittest.TestCase):
         self.assertNotIn(secret, repr(report))
         fake_client.close.assert_called_once_with()
 
+    def test_session_check_reports_each_account_by_file_name(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            directory = Path(temporary_directory)
+            first = directory / "first.json"
+            second = directory / "second.json"
+            first.write_text('{"z_c0": "first-secret", "d_c0": "d"}', encoding="utf-8")
+            second.write_text('{"z_c0": "second-secret"}', encoding="utf-8")
+            fake_client = Mock()
+            fake_client.check_login.side_effect = [
+                LoginStatus(authenticated=True, member_id="member"),
+                LoginStatus(authenticated=False, reason="authentication_rejected"),
+            ]
+            with patch(
+                "zhihu_scraper.facade.ZhihuHttpClient",
+                return_value=fake_client,
+            ):
+                report = check_session(
+                    ArchiveSettings(cookie_file=first, cookie_files=(second, first))
+                )
+
+        self.assertEqual(["first.json", "second.json"], [a.name for a in report.accounts])
+        self.assertEqual(("d_c0",), report.accounts[1].cookie_diagnostic.missing)
+        self.assertFalse(report.accounts[1].login_status.authenticated)
+        self.assertTrue(report.login_status.authenticated)
+        self.assertNotIn("secret", repr(report))
+        self.assertEqual(2, fake_client.close.call_count)
+
+    def test_session_check_reports_each_account_when_the_first_file_is_empty(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            directory = Path(temporary_directory)
+            first = directory / "first.json"
+            second = directory / "second.json"
+            first.write_text("{}", encoding="utf-8")
+            second.write_text('{"z_c0": "second-secret", "d_c0": "d"}', encoding="utf-8")
+            fake_client = Mock()
+            fake_client.check_login.return_value = LoginStatus(authenticated=True)
+            with patch(
+                "zhihu_scraper.facade.ZhihuHttpClient",
+                return_value=fake_client,
+            ):
+                report = check_session(ArchiveSettings(cookie_files=(first, second)))
+
+        self.assertEqual(["first.json", "second.json"], [a.name for a in report.accounts])
+        self.assertIsNone(report.accounts[0].login_status)
+        self.assertTrue(report.accounts[1].login_status.authenticated)
+        self.assertEqual(1, fake_client.check_login.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,205 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from zhihu_scraper.http import ZhihuHttpClient
+from zhihu_scraper.ratelimit import (
+    HostClass,
+    RateLimiter,
+    host_class_for,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, *, status_code: int = 200, headers: dict[str, str] | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+
+    def json(self):
+        return {"ok": True}
+
+
+class FakeSession:
+    def __init__(self, responses: list[FakeResponse]):
+        self._responses = list(responses)
+
+    def get(self, url: str, **kwargs):
+        return self._responses.pop(0)
+
+    def close(self):
+        pass
+
+
+def _limiter(clock: FakeClock, **kwargs) -> RateLimiter:
+    return RateLimiter(clock=clock, wall_clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_token_bucket_spaces_requests_after_the_initial_burst(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, api_rate=2.0, max_concurrency=8)
+
+        for _ in range(3):
+            limiter.acquire(HostClass.API)
+            limiter.release(HostClass.API, status=200, latency=0.1)
+
+        self.assertEqual(clock.sleeps, [0.5])
+
+    def test_host_classes_are_paced_independently(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, api_rate=1.0, media_rate=1.0)
+
+        self.assertEqual(limiter.try_acquire(HostClass.API), 0.0)
+        self.assertEqual(limiter.try_acquire(HostClass.MEDIA), 0.0)
+        self.assertGreater(limiter.try_acquire(HostClass.API), 0.0)
+
+    def test_throttling_halves_the_window_and_fast_successes_grow_it_back(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, api_rate=50.0, max_concurrency=8)
+
+        limiter.acquire(HostClass.API)
+        limiter.release(HostClass.API, status=429, latency=0.1)
+        limiter.acquire(HostClass.API)
+        limiter.release(HostClass.API, status=503, latency=0.1)
+        api_stats = limiter.stats()[0]
+        self.assertEqual(api_stats.concurrency_limit, 2)
+        self.assertEqual(api_stats.throttled, 1)
+
+        for _ in range(4):
+            limiter.acquire(HostClass.API)
+            limiter.release(HostClass.API, status=200, latency=0.1)
+
+        self.assertEqual(limiter.stats()[0].concurrency_limit, 3)
+
+    def test_slow_responses_shrink_the_window(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, max_concurrency=8, latency_target=1.0)
+
+        limiter.acquire(HostClass.API)
+        limiter.release(HostClass.API, status=200, latency=3.0)
+
+        self.assertEqual(limiter.stats()[0].concurrency_limit, 6)
+
+    def test_window_blocks_new_requests_until_a_slot_is_released(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, max_concurrency=1)
+
+        self.assertEqual(limiter.try_acquire(HostClass.API), 0.0)
+        self.assertGreater(limiter.try_acquire(HostClass.API), 0.0)
+        clock.now += 1.0
+        limiter.release(HostClass.API, status=200, latency=0.1)
+        self.assertEqual(limiter.try_acquire(HostClass.API), 0.0)
+
+    def test_retry_after_pauses_every_host_class(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+
+        limiter.acquire(HostClass.API)
+        limiter.release(HostClass.API, status=429, latency=0.1, retry_after=3.0)
+
+        self.assertEqual(limiter.try_acquire(HostClass.MEDIA), 3.0)
+        limiter.acquire(HostClass.MEDIA)
+        self.assertEqual(clock.sleeps, [3.0])
+        self.assertEqual(limiter.stats()[1].paused_seconds, 3.0)
+
+    def test_shared_state_propagates_a_pause_to_another_limiter(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            state = Path(temporary_directory) / ".zhihu-rate-limit.json"
+            first = _limiter(clock, shared_state=state)
+            second = _limiter(clock, shared_state=state)
+
+            first.acquire(HostClass.API)
+            first.release(HostClass.API, status=429, latency=0.1, retry_after=2.0)
+
+            self.assertEqual(second.try_acquire(HostClass.API), 2.0)
+
+    def test_corrupt_shared_state_is_ignored(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            state = Path(temporary_directory) / ".zhihu-rate-limit.json"
+            state.write_text("{not json", encoding="utf-8")
+            limiter = _limiter(clock, shared_state=state)
+
+            self.assertEqual(limiter.try_acquire(HostClass.API), 0.0)
+
+    def test_rejects_non_positive_rates(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(api_rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(max_concurrency=0)
+
+
+class RateLimitHelperTests(unittest.TestCase):
+    def test_media_cdns_are_classified_separately(self):
+        self.assertIs(host_class_for("https://pic1.zhimg.com/v2-a.jpg"), HostClass.MEDIA)
+        self.assertIs(host_class_for("https://vdn.vzuu.com/video.mp4"), HostClass.MEDIA)
+        self.assertIs(host_class_for("https://www.zhihu.com/api/v4/x"), HostClass.API)
+        self.assertIs(host_class_for("https://evilzhimg.com/a.jpg"), HostClass.API)
+
+    def test_retry_after_is_case_insensitive_and_ignores_dates(self):
+        self.assertEqual(retry_after_seconds({"retry-after": "4"}), 4.0)
+        self.assertIsNone(retry_after_seconds({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+        self.assertIsNone(retry_after_seconds({}))
+
+
+class RateLimitedClientTests(unittest.TestCase):
+    def test_http_client_reports_throttling_and_waits_out_the_pause(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, max_concurrency=4)
+        client = ZhihuHttpClient(
+            session=FakeSession(
+                [
+                    FakeResponse(status_code=429, headers={"Retry-After": "2"}),
+                    FakeResponse(),
+                ]
+            ),
+            sleep=lambda _delay: None,
+            rate_limiter=limiter,
+        )
+
+        self.assertEqual(client.get_json("/api/v4/items"), {"ok": True})
+
+        api_stats = limiter.stats()[0]
+        self.assertEqual(api_stats.requests, 2)
+        self.assertEqual(api_stats.throttled, 1)
+        self.assertEqual(api_stats.concurrency_limit, 2)
+        self.assertEqual(clock.sleeps, [2.0])
+
+    def test_an_interrupted_request_still_releases_its_slot(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, max_concurrency=1)
+
+        class InterruptedSession(FakeSession):
+            def get(self, url: str, **kwargs):
+                raise KeyboardInterrupt
+
+        client = ZhihuHttpClient(
+            session=InterruptedSession([]),
+            sleep=lambda _delay: None,
+            rate_limiter=limiter,
+        )
+
+        with self.assertRaises(KeyboardInterrupt):
+            client.get_json("/api/v4/items")
+        clock.now += 1.0
+        self.assertEqual(limiter.try_acquire(HostClass.API), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,291 @@
+import asyncio
+import json
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+from zhihu_scraper.cache import ResponseCache, _cache_key
+from zhihu_scraper.http import AsyncZhihuHttpClient, InvalidResponseError, ZhihuHttpClient
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    def __init__(
+        self,
+        *,
+        status_code: int = 200,
+        payload: object = None,
+        headers: dict[str, str] | None = None,
+    ):
+        self.status_code = status_code
+        self.text = "" if payload is None else json.dumps(payload)
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSession:
+    def __init__(self, responses: list[FakeResponse]):
+        self._responses = list(responses)
+        self.calls: list[tuple[str, dict[str, object]]] = []
+
+    def get(self, url: str, **kwargs):
+        self.calls.append((url, kwargs))
+        return self._responses.pop(0)
+
+    def close(self):
+        pass
+
+
+class FakeAsyncSession(FakeSession):
+    async def get(self, url: str, **kwargs):
+        return super().get(url, **kwargs)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.root = Path(temporary_directory.name)
+        self.clock = FakeClock()
+
+    def _cache(self, **kwargs) -> ResponseCache:
+        return ResponseCache(self.root / ".zhihu-http-cache.db", clock=self.clock, **kwargs)
+
+    def _accessed_at(self, url: str) -> float:
+        with closing(sqlite3.connect(self.root / ".zhihu-http-cache.db")) as connection:
+            (accessed_at,) = connection.execute(
+                "SELECT accessed_at FROM responses WHERE cache_key = ?",
+                (_cache_key("anonymous", "json", url),),
+            ).fetchone()
+        return accessed_at
+
+    def test_fresh_entries_are_served_without_a_request(self):
+        cache = self._cache(ttl=60)
+        session = FakeSession([FakeResponse(payload={"id": 1})])
+        client = ZhihuHttpClient(session=session, cache=cache)
+
+        first = client.get_json("/api/v4/answers/1")
+        second = client.get_json("/api/v4/answers/1")
+
+        self.assertEqual(first, {"id": 1})
+        self.assertEqual(second, {"id": 1})
+        self.assertEqual(len(session.calls), 1)
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual(cache.stats().misses, 1)
+
+    def test_stale_entries_are_revalidated_with_conditional_headers(self):
+        cache = self._cache(ttl=60)
+        session = FakeSession(
+            [
+                FakeResponse(
+                    payload={"id": 1},
+                    headers={"etag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+                ),
+                FakeResponse(status_code=304),
+            ]
+        )
+        client = ZhihuHttpClient(session=session, cache=cache)
+
+        client.get_json("/api/v4/answers/1")
+        self.clock.now += 120
+        payload = client.get_json("/api/v4/answers/1")
+
+        self.assertEqual(payload, {"id": 1})
+        headers = session.calls[1][1]["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertEqual(cache.stats().revalidated, 1)
+
+        # A 304 restarts the TTL.
+        client.get_json("/api/v4/answers/1")
+        self.assertEqual(len(session.calls), 2)
+
+    def test_changed_content_replaces_the_stale_entry(self):
+        cache = self._cache(ttl=0)
+        session = FakeSession(
+            [
+                FakeResponse(payload={"version": 1}, headers={"ETag": '"v1"'}),
+                FakeResponse(payload={"version": 2}, headers={"ETag": '"v2"'}),
+                FakeResponse(status_code=304),
+            ]
+        )
+        client = ZhihuHttpClient(session=session, cache=cache)
+
+        client.get_json("/api/v4/articles/1")
+        self.assertEqual(client.get_json("/api/v4/articles/1"), {"version": 2})
+        self.assertEqual(client.get_json("/api/v4/articles/1"), {"version": 2})
+        self.assertEqual(session.calls[2][1]["headers"]["If-None-Match"], '"v2"')
+
+    def test_entries_are_separated_per_session_and_never_store_cookie_values(self):
+        cache = self._cache(ttl=60)
+        session = FakeSession(
+            [
+                FakeResponse(payload={"viewer": "a"}),
+                FakeResponse(payload={"viewer": "b"}),
+            ]
+        )
+        first = ZhihuHttpClient(session=session, cookies={"z_c0": "secret-token-a"}, cache=cache)
+        second = ZhihuHttpClient(session=session, cookies={"z_c0": "secret-token-b"}, cache=cache)
+
+        self.assertEqual(first.get_json("/api/v4/questions/1"), {"viewer": "a"})
+        self.assertEqual(second.get_json("/api/v4/questions/1"), {"viewer": "b"})
+        self.assertEqual(len(session.calls), 2)
+        self.assertNotIn(b"secret-token", cache.path.read_bytes())
+
+    def test_login_checks_bypass_the_cache(self):
+        cache = self._cache(ttl=60)
+        session = FakeSession(
+            [
+                FakeResponse(payload={"id": "member", "name": "Reader"}),
+                FakeResponse(payload={"id": "member", "name": "Reader"}),
+            ]
+        )
+        client = ZhihuHttpClient(session=session, cache=cache)
+
+        client.check_login()
+        client.check_login()
+
+        self.assertEqual(len(session.calls), 2)
+
+    def test_errors_are_not_cached(self):
+        cache = self._cache(ttl=60)
+        session = FakeSession(
+            [
+                FakeResponse(status_code=404),
+                FakeResponse(payload={"id": 1}),
+            ]
+        )
+        client = ZhihuHttpClient(session=session, cache=cache)
+
+        with self.assertRaises(InvalidResponseError):
+            client.get_json("/api/v4/answers/1")
+        self.assertEqual(client.get_json("/api/v4/answers/1"), {"id": 1})
+
+    def test_error_payloads_and_invalid_json_with_status_200_are_not_cached(self):
+        cache = self._cache(ttl=60)
+        invalid = FakeResponse()
+        invalid.text = "<html>verify</html>"
+        session = FakeSession(
+            [
+                FakeResponse(payload={"error": {"code": 10003, "message": "请求参数异常"}}),
+                invalid,
+                FakeResponse(payload={"id": 1}),
+            ]
+        )
+        client = ZhihuHttpClient(session=session, cache=cache)
+
+        self.assertIn("error", client.get_json("/api/v4/answers/1"))
+        with self.assertRaises(InvalidResponseError):
+            client.get_json("/api/v4/answers/1")
+        self.assertEqual(client.get_json("/api/v4/answers/1"), {"id": 1})
+        self.assertEqual(client.get_json("/api/v4/answers/1"), {"id": 1})
+        self.assertEqual(len(session.calls), 3)
+
+    def test_cookie_updates_keep_the_cache_and_follow_the_new_session(self):
+        cache = self._cache(ttl=60)
+        session = FakeSession(
+            [
+                FakeResponse(payload={"version": 1}),
+                FakeResponse(payload={"version": 2}),
+            ]
+        )
+        client = ZhihuHttpClient(session=session, cookies={"z_c0": "token"}, cache=cache)
+
+        client.get_json("/api/v4/answers/1")
+        client.update_cookies({"__zse_ck": "browser-session"})
+        self.assertEqual(client.get_json("/api/v4/answers/1"), {"version": 1})
+        client.update_cookies({"z_c0": "renewed"})
+
+        self.assertEqual(client.get_json("/api/v4/answers/1"), {"version": 2})
+        self.assertEqual(client.get_json("/api/v4/answers/1"), {"version": 2})
+        self.assertEqual(len(session.calls), 2)
+
+    def test_hits_do_not_write_until_the_next_store(self):
+        cache = self._cache(ttl=60)
+        cache.store(
+            "anonymous",
+            "json",
+            "https://www.zhihu.com/a",
+            body="a",
+            etag=None,
+            last_modified=None,
+        )
+        self.clock.now += 5
+        cache.lookup("anonymous", "json", "https://www.zhihu.com/a")
+
+        self.assertEqual(self._accessed_at("https://www.zhihu.com/a"), 1_000.0)
+        cache.store(
+            "anonymous",
+            "json",
+            "https://www.zhihu.com/b",
+            body="b",
+            etag=None,
+            last_modified=None,
+        )
+        self.assertEqual(self._accessed_at("https://www.zhihu.com/a"), 1_005.0)
+
+    def test_least_recently_used_entries_are_evicted_beyond_the_size_bound(self):
+        cache = self._cache(ttl=60, max_bytes=20)
+
+        cache.store(
+            "anonymous",
+            "json",
+            "https://www.zhihu.com/a",
+            body="a" * 8,
+            etag=None,
+            last_modified=None,
+        )
+        self.clock.now += 1
+        cache.store(
+            "anonymous",
+            "json",
+            "https://www.zhihu.com/b",
+            body="b" * 8,
+            etag=None,
+            last_modified=None,
+        )
+        self.clock.now += 1
+        self.assertIsNotNone(cache.lookup("anonymous", "json", "https://www.zhihu.com/a"))
+        self.clock.now += 1
+        cache.store(
+            "anonymous",
+            "json",
+            "https://www.zhihu.com/c",
+            body="c" * 8,
+            etag=None,
+            last_modified=None,
+        )
+
+        self.assertIsNotNone(cache.lookup("anonymous", "json", "https://www.zhihu.com/a"))
+        self.assertIsNone(cache.lookup("anonymous", "json", "https://www.zhihu.com/b"))
+        self.assertIsNotNone(cache.lookup("anonymous", "json", "https://www.zhihu.com/c"))
+
+    def test_async_client_shares_the_same_cache_behavior(self):
+        cache = self._cache(ttl=60)
+        session = FakeAsyncSession([FakeResponse(payload={"id": 1})])
+
+        async def fetch_twice():
+            client = AsyncZhihuHttpClient(session=session, cache=cache)
+            async with client:
+                return [
+                    await client.get_json("/api/v4/answers/1"),
+                    await client.get_json("/api/v4/answers/1"),
+                ]
+
+        self.assertEqual(asyncio.run(fetch_twice()), [{"id": 1}, {"id": 1}])
+        self.assertEqual(len(session.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,25 @@
 import json
+import tempfile
 import unittest
-
+from concurrent.futures import Future
+from datetime import UTC, datetime, timedelta
+from html import escape
+from pathlib import Path
+from unittest.mock import patch
+
+from zhihu_scraper.database import ArchiveDatabase
+from zhihu_scraper.http import ServerError, TransportError
+from zhihu_scraper.paging import AdaptivePageSize
 from zhihu_scraper.source import (
+    CapturedCollectionSource,
+    FieldProjection,
     InvalidZhihuPayloadError,
     PaginationLoopError,
     ZhihuSource,
     extract_article_payload,
     extract_entity_payload,
+    forget_initial_states,
+    harvest_entities,
 )
 from zhihu_scraper.urls import route_zhihu_url
 
@@ -32,6 +45,50 @@ class FakeClient:
         return self._html_responses.pop(0)
 
 
+class FakeConcurrentClient:
+    """Serve column pages by offset and record when each one was requested."""
+
+    def __init__(self, pages: dict[int, object]) -> None:
+        self._pages = dict(pages)
+        self.submitted: list[str] = []
+        self.json_calls: list[str] = []
+        self.cancelled: list[str] = []
+
+    def get_json(self, url_or_path: str) -> object:
+        self.json_calls.append(url_or_path)
+        return self._page(url_or_path)
+
+    def get_html(self, url_or_path: str) -> str:
+        raise AssertionError("HTML should not be requested")
+
+    def submit_json(self, url_or_path: str) -> Future:
+        self.submitted.append(url_or_path)
+        future: Future = _RecordingFuture(self.cancelled, url_or_path)
+        future.set_result(self._page(url_or_path))
+        return future
+
+    def _page(self, url_or_path: str) -> object:
+        return self._pages[int(url_or_path.rsplit("offset=", 1)[1])]
+
+
+class _RecordingFuture(Future):
+    def __init__(self, cancelled: list[str], url: str) -> None:
+        super().__init__()
+        self._cancelled = cancelled
+        self._url = url
+
+    def cancel(self) -> bool:
+        self._cancelled.append(self._url)
+        return super().cancel()
+
+
+def _column_page(ids, *, total: int, is_end: bool = False) -> dict[str, object]:
+    return {
+        "data": [{"id": item_id} for item_id in ids],
+        "paging": {"is_end": is_end, "totals": total},
+    }
+
+
 class ArticleSourceTests(unittest.TestCase):
     def test_returns_a_valid_direct_article_api_payload_without_loading_html(self):
         payload = {
@@ -182,6 +239,151 @@ class ArticleSourceTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             extract_entity_payload(page, collection="pins", entity_id="missing")
 
+    def test_harvesting_several_collections_decodes_the_initial_state_once(self):
+        state = {
+            "initialState": {
+                "entities": {
+                    "answers": {"200": {"id": 200, "content": "<p>{不平衡</p></script>"}},
+                    "questions": {"100": {"id": 100, "title": "问题"}},
+                }
+            }
+        }
+        page = (
+            "<html><head><script>var unrelated = {a: 1};</script></head><body>"
+            + "<div class='filler'>{}</div>" * 2000
+            + '<script id="js-initialData" type="text/json">'
+            + json.dumps(state, ensure_ascii=False)
+            + "</script></body></html>"
+        )
+
+        with patch.object(
+            json.JSONDecoder,
+            "raw_decode",
+            autospec=True,
+            side_effect=json.JSONDecoder.raw_decode,
+        ) as raw_decode:
+            harvested = harvest_entities(page, ("answers", "questions"))
+
+        self.assertEqual("<p>{不平衡</p></script>", harvested["answers"]["200"]["content"])
+        self.assertEqual("问题", harvested["questions"]["100"]["title"])
+        self.assertEqual(1, raw_decode.call_count)
+
+    def test_repeated_lookups_reuse_a_bounded_set_of_decoded_pages_until_forgotten(self):
+        forget_initial_states()
+        self.addCleanup(forget_initial_states)
+
+        def page(number):
+            state = {"initialState": {"entities": {"answers": {"1": {"id": 1, "n": number}}}}}
+            return f'<script id="js-initialData">{json.dumps(state)}</script>'
+
+        pages = [page(number) for number in range(6)]
+        with patch.object(
+            json.JSONDecoder,
+            "raw_decode",
+            autospec=True,
+            side_effect=json.JSONDecoder.raw_decode,
+        ) as raw_decode:
+            for _ in range(2):
+                extract_entity_payload(pages[0], collection="answers", entity_id="1")
+            self.assertEqual(1, raw_decode.call_count)
+            for document in pages[1:]:
+                extract_entity_payload(document, collection="answers", entity_id="1")
+            extract_entity_payload(pages[-1], collection="answers", entity_id="1")
+            self.assertEqual(6, raw_decode.call_count)
+            extract_entity_payload(pages[0], collection="answers", entity_id="1")
+            self.assertEqual(7, raw_decode.call_count)
+            forget_initial_states()
+            extract_entity_payload(pages[-1], collection="answers", entity_id="1")
+            self.assertEqual(8, raw_decode.call_count)
+
+    def test_entity_escaped_initial_state_still_uses_the_tolerant_fallback(self):
+        state = {"initialState": {"entities": {"articles": {"42": {"id": 42, "title": "转义"}}}}}
+        page = (
+            '<script id="js-initialData" type="text/json">'
+            f"{escape(json.dumps(state, ensure_ascii=False))}"
+            "</script>"
+        )
+
+        self.assertEqual("转义", extract_article_payload(page, "42")["title"])
+
+    def test_captured_pages_replay_a_complete_collection_in_offset_order(self):
+        endpoint = "https://www.zhihu.com/api/v4/questions/10/answers"
+        pages = [
+            (f"{endpoint}?offset=2&limit=2", {"data": [{"id": 3}], "paging": {"is_end": True}}),
+            ("https://www.zhihu.com/api/v4/questions/99/answers?offset=0", {"data": [{"id": 9}]}),
+            (f"{endpoint}?limit=2&offset=0", {"data": [{"id": 1}, {"id": 2}], "paging": {}}),
+            (f"{endpoint}?limit=2&offset=1", {"data": [{"id": 2}, {"id": 3}], "paging": {}}),
+        ]
+
+        answers = CapturedCollectionSource(pages).iter_question_answer_payloads("10")
+
+        self.assertEqual([1, 2, 3], [answer["id"] for answer in answers])
+
+    def test_captured_pages_with_a_gap_or_no_end_are_rejected(self):
+        endpoint = "https://www.zhihu.com/api/v4/columns/c/items"
+        gapped = [
+            (f"{endpoint}?offset=0", {"data": [{"id": 1}], "paging": {}}),
+            (f"{endpoint}?offset=5", {"data": [{"id": 6}], "paging": {"is_end": True}}),
+        ]
+        unfinished = gapped[:1]
+
+        for pages in (gapped, unfinished, []):
+            with self.subTest(pages=len(pages)):
+                with self.assertRaises(InvalidZhihuPayloadError):
+                    list(CapturedCollectionSource(pages).iter_column_article_payloads("c"))
+
+    def test_the_initial_state_first_screen_covers_the_offsets_before_the_capture(self):
+        endpoint = "https://www.zhihu.com/api/v4/columns/c/items"
+        pages = [
+            (f"{endpoint}?offset=2", {"data": [{"id": 2}, {"id": 3}], "paging": {"is_end": True}})
+        ]
+        first_screen = [{"id": 1}, {"id": 2}]
+
+        articles = CapturedCollectionSource(
+            pages,
+            first_screen=first_screen,
+        ).iter_column_article_payloads("c")
+
+        self.assertEqual([1, 2, 3], [article["id"] for article in articles])
+        with self.assertRaises(InvalidZhihuPayloadError):
+            list(
+                CapturedCollectionSource(
+                    pages,
+                    first_screen=first_screen[:1],
+                ).iter_column_article_payloads("c")
+            )
+
+    def test_harvest_collects_every_entity_of_the_requested_collections(self):
+        state = {
+            "initialState": {
+                "entities": {
+                    "answers": {
+                        "200": {"id": 200, "content": "<p>一</p>"},
+                        "201": {"id": 201, "content": "<p>二</p>"},
+                    },
+                    "questions": {"100": {"id": 100, "title": "问题"}},
+                },
+                "feed": {"answers": [{"id": 202, "content": "<p>三</p>"}, "skip"]},
+            }
+        }
+        page = (
+            '<script id="js-initialData" type="text/json">'
+            f"{json.dumps(state, ensure_ascii=False)}"
+            "</script>"
+        )
+
+        harvested = harvest_entities(page, ("answers", "articles"))
+
+        self.assertEqual(["200", "201", "202"], list(harvested["answers"]))
+        self.assertEqual({}, harvested["articles"])
+        self.assertNotIn("questions", harvested)
+        harvested["answers"]["200"]["content"] = "changed"  # type: ignore[index]
+        self.assertEqual(
+            "<p>一</p>", harvest_entities(page, ("answers",))["answers"]["200"]["content"]
+        )
+        with self.assertRaises(ValueError):
+            harvest_entities(page, ("pins",))
+
 
 class SinglePayloadSourceTests(unittest.TestCase):
     def test_fetches_answer_question_column_and_video_from_real_api_routes(self):
@@ -222,6 +424,40 @@ class SinglePayloadSourceTests(unittest.TestCase):
                 self.assertEqual(payload, result)
                 self.assertEqual([expected_path], client.json_calls)
 
+    def test_lean_projection_requests_only_consumed_answer_fields(self):
+        client = FakeClient(
+            json_responses=[
+                {"id": 200},
+                {"data": [], "paging": {"is_end": True}},
+                {"id": 200},
+            ]
+        )
+        source = ZhihuSource(client, projection=FieldProjection.lean(comments=False))
+
+        source.fetch_answer_payload("https://www.zhihu.com/question/100/answer/200")
+        list(source.iter_question_answer_payloads("https://www.zhihu.com/question/100"))
+        source.full_shape().fetch_answer_payload("https://www.zhihu.com/question/100/answer/200")
+
+        self.assertEqual(
+            client.json_calls[0],
+            "/api/v4/answers/200?include=content,voteup_count,question,author",
+        )
+        self.assertIn(
+            "include=data%5B%2A%5D.content%2Cvoteup_count%2Cquestion%2Cauthor",
+            client.json_calls[1],
+        )
+        self.assertNotIn("comment_count", client.json_calls[1])
+        self.assertEqual(
+            client.json_calls[2],
+            "/api/v4/answers/200?include=content,voteup_count,question,author",
+        )
+        self.assertIn(
+            "comment_count",
+            FieldProjection.lean(comments=True).question_answer_fields,
+        )
+        full_source = ZhihuSource(client)
+        self.assertIs(full_source.full_shape(), full_source)
+
     def test_accepts_a_preparsed_target_and_rejects_the_wrong_target_kind(self):
         article_target = route_zhihu_url("https://zhuanlan.zhihu.com/p/42")
         client = FakeClient(json_responses=[{"id": 42}])
@@ -438,6 +674,120 @@ class PaginationSourceTests(unittest.TestCase):
         with self.assertRaises(PaginationLoopError):
             list(source.iter_column_article_payloads("machinelearningpku"))
 
+    def test_read_ahead_requests_following_offsets_and_yields_in_page_order(self):
+        client = FakeConcurrentClient(
+            {
+                0: _column_page([1, 2], total=7),
+                2: _column_page([3, 4], total=7),
+                4: _column_page([4, 5], total=7),
+                6: _column_page([6], total=7, is_end=True),
+            }
+        )
+        source = ZhihuSource(client, read_ahead=3)
+
+        articles = list(source.iter_column_article_payloads("machinelearningpku", page_size=2))
+
+        self.assertEqual([1, 2, 3, 4, 5, 6], [article["id"] for article in articles])
+        self.assertEqual(
+            ["/api/v4/columns/machinelearningpku/items?limit=2&offset=0"], client.json_calls
+        )
+        self.assertEqual(
+            [
+                f"/api/v4/columns/machinelearningpku/items?limit=2&offset={offset}"
+                for offset in (2, 4, 6)
+            ],
+            client.submitted,
+        )
+
+    def test_read_ahead_stops_at_is_end_and_cancels_unused_pages(self):
+        client = FakeConcurrentClient(
+            {
+                0: _column_page([1, 2], total=20),
+                2: _column_page([3, 4], total=20, is_end=True),
+                4: _column_page([5, 6], total=20),
+                6: _column_page([7, 8], total=20),
+            }
+        )
+        source = ZhihuSource(client, read_ahead=3)
+
+        articles = list(source.iter_column_article_payloads("machinelearningpku", page_size=2))
+
+        self.assertEqual([1, 2, 3, 4], [article["id"] for article in articles])
+        self.assertEqual(
+            [
+                "/api/v4/columns/machinelearningpku/items?limit=2&offset=4",
+                "/api/v4/columns/machinelearningpku/items?limit=2&offset=6",
+            ],
+            client.cancelled,
+        )
+
+    def test_short_page_falls_back_to_sequential_paging_from_the_real_offset(self):
+        client = FakeConcurrentClient(
+            {
+                0: _column_page([1, 2], total=5),
+                2: _column_page([3], total=5),
+                3: _column_page([4, 5], total=5, is_end=True),
+                4: _column_page([99], total=5),
+            }
+        )
+        source = ZhihuSource(client, read_ahead=2)
+
+        articles = list(source.iter_column_article_payloads("machinelearningpku", page_size=2))
+
+        self.assertEqual([1, 2, 3, 4, 5], [article["id"] for article in articles])
+        self.assertEqual(
+            "/api/v4/columns/machinelearningpku/items?limit=2&offset=3",
+            client.json_calls[-1],
+        )
+
+    def test_read_ahead_without_concurrent_client_or_totals_stays_sequential(self):
+        client = FakeClient(
+            json_responses=[
+                {"data": [{"id": 1}, {"id": 2}], "paging": {"is_end": False}},
+                {"data": [{"id": 3}], "paging": {"is_end": True}},
+            ]
+        )
+        source = ZhihuSource(client, read_ahead=4)
+
+        articles = list(source.iter_column_article_payloads("machinelearningpku", page_size=2))
+
+        self.assertEqual([1, 2, 3], [article["id"] for article in articles])
+        self.assertEqual(2, len(client.json_calls))
+
+    def test_adaptive_page_size_shrinks_on_server_errors_and_learns_the_server_cap(self):
+        class FlakyClient(FakeClient):
+            def get_json(self, url_or_path: str) -> object:
+                response = super().get_json(url_or_path)
+                if isinstance(response, BaseException):
+                    raise response
+                return response
+
+        client = FlakyClient(
+            json_responses=[
+                ServerError(504, "timeout"),
+                _column_page(range(20), total=45),
+                _column_page(range(20, 40), total=45),
+                _column_page(range(40, 45), total=45, is_end=True),
+            ]
+        )
+        page_sizes = AdaptivePageSize()
+        source = ZhihuSource(client, page_sizes=page_sizes)
+
+        items = list(source.iter_column_article_payloads("https://www.zhihu.com/column/c"))
+
+        self.assertEqual([item["id"] for item in items], list(range(45)))
+        self.assertEqual(
+            client.json_calls,
+            [
+                "/api/v4/columns/c/items?limit=100&offset=0",
+                "/api/v4/columns/c/items?limit=50&offset=0",
+                "/api/v4/columns/c/items?limit=50&offset=20",
+                "/api/v4/columns/c/items?limit=20&offset=40",
+            ],
+        )
+        self.assertEqual(page_sizes.initial("column_items"), 20)
+        self.assertEqual(page_sizes.initial("question_answers"), 100)
+
     def test_page_size_is_bounded(self):
         source = ZhihuSource(FakeClient())
 
@@ -452,5 +802,110 @@ class PaginationSourceTests(unittest.TestCase):
                     )
 
 
+class CheckpointedPaginationTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.database = ArchiveDatabase(Path(directory.name) / "zhihu.db")
+
+    def test_interrupted_crawl_resumes_after_the_last_committed_page(self):
+        class DroppingClient(FakeClient):
+            def get_json(self, url_or_path: str) -> object:
+                if url_or_path.endswith("offset=4"):
+                    raise TransportError("connection dropped")
+                return super().get_json(url_or_path)
+
+        first = DroppingClient(
+            json_responses=[
+                {"data": [{"id": 1}, {"id": 2}], "paging": {"is_end": False}},
+                {"data": [{"id": 3}, {"id": 4}], "paging": {"is_end": False}},
+            ]
+        )
+        yielded = []
+        with self.assertRaises(TransportError):
+            for item in ZhihuSource(first, checkpoints=self.database).iter_column_article_payloads(
+                "c", page_size=2
+            ):
+                yielded.append(item["id"])
+        self.assertEqual([1, 2, 3, 4], yielded)
+
+        second = FakeClient(
+            json_responses=[{"data": [{"id": 4}, {"id": 5}], "paging": {"is_end": True}}]
+        )
+        items = list(
+            ZhihuSource(second, checkpoints=self.database).iter_column_article_payloads(
+                "c", page_size=2
+            )
+        )
+
+        self.assertEqual([1, 2, 3, 4, 5], [item["id"] for item in items])
+        self.assertEqual(["/api/v4/columns/c/items?limit=2&offset=4"], second.json_calls)
+
+    def _interrupted_crawl(self, **source_kwargs) -> None:
+        class DroppingClient(FakeClient):
+            def get_json(self, url_or_path: str) -> object:
+                if "&offset=1&" in url_or_path:
+                    raise TransportError("connection dropped")
+                return super().get_json(url_or_path)
+
+        client = DroppingClient(json_responses=[{"data": [{"id": 1}], "paging": {"is_end": False}}])
+        source = ZhihuSource(client, checkpoints=self.database, **source_kwargs)
+        with self.assertRaises(TransportError):
+            list(source.iter_question_answer_payloads("100", page_size=1))
+
+    def test_finished_crawl_leaves_no_checkpoint_behind(self):
+        def page():
+            return {"data": [{"id": 1, "content": "正文"}], "paging": {"is_end": True}}
+
+        crawled = FakeClient(json_responses=[page()])
+        list(ZhihuSource(crawled, checkpoints=self.database).iter_question_answer_payloads("100"))
+
+        self.assertIsNone(self.database.load_checkpoint("/api/v4/questions/100/answers", "full"))
+        recrawled = FakeClient(json_responses=[page()])
+        answers = list(
+            ZhihuSource(recrawled, checkpoints=self.database).iter_question_answer_payloads("100")
+        )
+        self.assertEqual([{"id": 1, "content": "正文"}], answers)
+        self.assertEqual(1, len(recrawled.json_calls))
+
+    def test_stale_checkpoints_are_discarded_instead_of_resumed(self):
+        saved = datetime(2026, 1, 1, tzinfo=UTC)
+        self._interrupted_crawl(clock=lambda: saved)
+
+        restarted = FakeClient(json_responses=[{"data": [{"id": 2}], "paging": {"is_end": True}}])
+        items = list(
+            ZhihuSource(
+                restarted,
+                checkpoints=self.database,
+                clock=lambda: saved + timedelta(days=2),
+            ).iter_question_answer_payloads("100", page_size=1)
+        )
+
+        self.assertEqual([{"id": 2}], items)
+        self.assertIn("offset=0", restarted.json_calls[0])
+
+    def test_crawls_without_resume_discard_earlier_progress_and_commit_nothing(self):
+        self._interrupted_crawl()
+
+        self._interrupted_crawl(resume=False)
+
+        self.assertIsNone(self.database.load_checkpoint("/api/v4/questions/100/answers", "full"))
+
+    def test_lean_and_full_shapes_keep_separate_checkpoints(self):
+        self._interrupted_crawl(projection=FieldProjection.lean(comments=False))
+
+        full = FakeClient(
+            json_responses=[{"data": [{"id": 1, "comment_count": 0}], "paging": {"is_end": True}}]
+        )
+        answers = list(
+            ZhihuSource(full, checkpoints=self.database).iter_question_answer_payloads(
+                "100", page_size=1
+            )
+        )
+
+        self.assertEqual([{"id": 1, "comment_count": 0}], answers)
+        self.assertEqual(1, len(full.json_calls))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,14 @@
 """Local-first Zhihu archiving with one stable public interface."""
 
-from .application import ArchiveReport
-from .facade import SessionReport, archive_url, build_workflow, check_session
-from .settings import ArchiveSettings, BrowserFallback, load_settings
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .application import ArchiveReport
+    from .facade import SessionReport, archive_url, build_workflow, check_session
+    from .settings import ArchiveSettings, BrowserFallback, load_settings
 
 __all__ = [
     "ArchiveReport",
@@ -14,3 +20,25 @@ __all__ = [
     "check_session",
     "load_settings",
 ]
+
+# Resolved on first access so that ``zhihu fetch`` handing a job to a running
+# daemon does not import the HTML, HTTP and browser stacks first.
+_EXPORT_MODULES = {
+    "ArchiveReport": ".application",
+    "ArchiveSettings": ".settings",
+    "BrowserFallback": ".settings",
+    "SessionReport": ".facade",
+    "archive_url": ".facade",
+    "build_workflow": ".facade",
+    "check_session": ".facade",
+    "load_settings": ".settings",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
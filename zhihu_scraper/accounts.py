@@ -0,0 +1,269 @@
+"""Spread Zhihu requests across several logged-in accounts."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Protocol, TypeVar, cast
+
+from .http import (
+    AccessDeniedError,
+    AuthenticationError,
+    CookieDiagnostic,
+    LoginStatus,
+    RateLimitError,
+    TransportError,
+    ZhihuHttpError,
+    diagnose_cookies,
+)
+
+_T = TypeVar("_T")
+
+# Rejections that take an account out of rotation for its cooldown.
+_BENCHING_ERRORS = (AuthenticationError, AccessDeniedError, RateLimitError)
+
+
+class _AccountClient(Protocol):
+    def get_json(self, url_or_path: str) -> object: ...
+
+    def get_html(self, url_or_path: str) -> str: ...
+
+    def check_login(self) -> LoginStatus: ...
+
+    def update_cookies(self, cookies: Mapping[str, str]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class NoAccountAvailableError(TransportError):
+    """Every account in the pool is benched or has used its quota."""
+
+
+@dataclass(frozen=True, slots=True)
+class AccountHealth:
+    """Per-account state that never includes Cookie values."""
+
+    name: str
+    cookie_diagnostic: CookieDiagnostic
+    requests: int
+    rejections: int
+    benched: bool
+    quota_exhausted: bool
+
+
+class _Account:
+    def __init__(self, name: str, cookies: Mapping[str, str], client: _AccountClient) -> None:
+        self.name = name
+        self.session_cookie = cookies.get("z_c0")
+        self.cookie_diagnostic = diagnose_cookies(dict(cookies))
+        self.client = client
+        self.requests = 0
+        self.rejections = 0
+        self.benched_until = 0.0
+
+
+class AccountPool:
+    """Schedule requests over several Cookie files behind one client interface.
+
+    Each request goes to the available account that has sent the fewest
+    requests so far. ``quota`` caps the requests of one account per run, and
+    0 means no cap. An account whose session is rejected with
+    ``AuthenticationError`` or ``AccessDeniedError``, or that is still
+    throttled with HTTP 429 after its client's retries, is benched for
+    ``bench_seconds`` and the request moves on to the next account. Browser
+    Cookie exports are merged into the account whose ``z_c0`` they carry, or
+    into the first account, whose Cookie values seed the browser.
+
+    ``submit_json`` is offered only when the account clients have it; the
+    request then runs on the selected account's client without blocking,
+    and a rejection moves it on to the next account in the same way.
+    """
+
+    def __init__(
+        self,
+        accounts: Sequence[tuple[str, Mapping[str, str]]],
+        client_factory: Callable[[Mapping[str, str]], _AccountClient],
+        *,
+        quota: int = 0,
+        bench_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not accounts:
+            raise ValueError("an account pool needs at least one account")
+        if quota < 0:
+            raise ValueError("quota must not be negative")
+        self._accounts = [
+            _Account(name, cookies, client_factory(cookies)) for name, cookies in accounts
+        ]
+        self._quota = quota
+        self._bench_seconds = bench_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def get_json(self, url_or_path: str) -> object:
+        return self._call(lambda client: client.get_json(url_or_path))
+
+    def get_html(self, url_or_path: str) -> str:
+        return self._call(lambda client: client.get_html(url_or_path))
+
+    def __getattr__(self, name: str) -> Callable[[str], Future[object]]:
+        accounts = self.__dict__.get("_accounts")
+        if (
+            name == "submit_json"
+            and accounts
+            and callable(getattr(accounts[0].client, "submit_json", None))
+        ):
+            return self._submit_json
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def check_login(self) -> LoginStatus:
+        """Report whether at least one account in the pool is logged in."""
+
+        statuses = [account.client.check_login() for account in self._accounts]
+        for status in statuses:
+            if status.authenticated:
+                return status
+        return statuses[0]
+
+    def update_cookies(self, cookies: Mapping[str, str]) -> None:
+        """Merge browser-exported Cookie values into the account they belong to."""
+
+        session_cookie = cookies.get("z_c0")
+        owner = next(
+            (
+                account
+                for account in self._accounts
+                if session_cookie is not None and account.session_cookie == session_cookie
+            ),
+            self._accounts[0],
+        )
+        owner.client.update_cookies(cookies)
+        if session_cookie:
+            owner.session_cookie = session_cookie
+
+    def health(self) -> tuple[AccountHealth, ...]:
+        with self._lock:
+            now = self._clock()
+            return tuple(
+                AccountHealth(
+                    name=account.name,
+                    cookie_diagnostic=account.cookie_diagnostic,
+                    requests=account.requests,
+                    rejections=account.rejections,
+                    benched=account.benched_until > now,
+                    quota_exhausted=self._quota > 0 and account.requests >= self._quota,
+                )
+                for account in self._accounts
+            )
+
+    def reset(self) -> None:
+        """Start a new run: request counts and quotas begin again at zero.
+
+        Benched accounts stay benched until their cooldown ends.
+        """
+
+        with self._lock:
+            for account in self._accounts:
+                account.requests = 0
+                account.rejections = 0
+
+    def close(self) -> None:
+        """Close every account's client exactly once."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        failed = False
+        for account in self._accounts:
+            try:
+                account.client.close()
+            except TransportError:
+                failed = True
+        if failed:
+            raise TransportError("Zhihu HTTP resources could not be closed cleanly.")
+
+    def _call(self, request: Callable[[_AccountClient], _T]) -> _T:
+        tried: set[int] = set()
+        rejection: ZhihuHttpError | None = None
+        while (account := self._reserve(tried)) is not None:
+            tried.add(id(account))
+            try:
+                return request(account.client)
+            except _BENCHING_ERRORS as error:
+                self._bench(account)
+                rejection = error
+        raise _unavailable(rejection)
+
+    def _submit_json(self, url_or_path: str) -> Future[object]:
+        result: Future[object] = Future()
+        self._submit_to_next(url_or_path, result, set(), None)
+        return result
+
+    def _submit_to_next(
+        self,
+        url_or_path: str,
+        result: Future[object],
+        tried: set[int],
+        rejection: ZhihuHttpError | None,
+    ) -> None:
+        try:
+            account = self._reserve(tried)
+        except TransportError as error:
+            result.set_exception(error)
+            return
+        if account is None:
+            result.set_exception(_unavailable(rejection))
+            return
+        tried.add(id(account))
+
+        def settle(attempt: Future[object]) -> None:
+            if attempt.cancelled():
+                result.cancel()
+                return
+            error = attempt.exception()
+            if isinstance(error, _BENCHING_ERRORS):
+                self._bench(account)
+                self._submit_to_next(url_or_path, result, tried, error)
+            elif error is not None:
+                result.set_exception(error)
+            else:
+                result.set_result(attempt.result())
+
+        submit = cast(Callable[[str], Future[object]], getattr(account.client, "submit_json"))
+        submit(url_or_path).add_done_callback(settle)
+
+    def _reserve(self, tried: set[int]) -> _Account | None:
+        with self._lock:
+            if self._closed:
+                raise TransportError("Zhihu HTTP client is closed.")
+            now = self._clock()
+            available = [
+                account
+                for account in self._accounts
+                if id(account) not in tried
+                and account.benched_until <= now
+                and (self._quota == 0 or account.requests < self._quota)
+            ]
+            if not available:
+                return None
+            account = min(available, key=lambda candidate: candidate.requests)
+            account.requests += 1
+            return account
+
+    def _bench(self, account: _Account) -> None:
+        with self._lock:
+            account.rejections += 1
+            account.benched_until = self._clock() + self._bench_seconds
+
+
+def _unavailable(rejection: ZhihuHttpError | None) -> ZhihuHttpError | TransportError:
+    if rejection is not None:
+        return rejection
+    return NoAccountAvailableError(
+        "Every Zhihu account in the pool is benched or has used its request quota."
+    )
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator, Mapping
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from types import TracebackType
-from typing import Protocol, Self
+from typing import Protocol, Self, TypeVar, cast
 
+from .accounts import AccountHealth
 from .assets import MediaArchiveFailure
+from .browser import BrowserDependencyError, BrowserFallbackError, BrowserNavigationStats
+from .circuit import CircuitReport
+from .coalesce import CoalescingStats
 from .comments import CommentClient, InvalidCommentPayloadError, fetch_comment_thread
 from .domain import (
     Answer,
@@ -16,10 +23,12 @@ from .domain import (
     Article,
     ColumnArchive,
     ColumnRef,
+    CommentThread,
     QuestionArchive,
 )
 from .http import InvalidResponseError, TransportError, ZhihuHttpError
 from .normalize import (
+    MissingProjectedFieldError,
     NormalizationError,
     normalize_answer,
     normalize_article,
@@ -27,23 +36,28 @@ from .normalize import (
     normalize_question,
     normalize_video,
 )
+from .proxies import ProxyStats, proxy_affinity
 from .settings import ArchiveSettings
 from .settings import BrowserFallback as BrowserFallbackMode
-from .source import InvalidZhihuPayloadError, extract_entity_payload
+from .source import (
+    CapturedCollectionSource,
+    InvalidZhihuPayloadError,
+    extract_entity_payload,
+    forget_initial_states,
+    harvest_entities,
+)
 from .urls import TargetKind, ZhihuTarget, route_zhihu_url
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+_Commented = TypeVar("_Commented", Answer, Article)
+
 
 class ArchiveSink(Protocol):
     def archive(self, target: ArchiveTarget) -> object: ...
 
 
-class PayloadSource(Protocol):
-    def fetch_article_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
-
-    def fetch_answer_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
-
-    def fetch_question_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
-
+class CollectionSource(Protocol):
     def iter_question_answer_payloads(
         self,
         target: ZhihuTarget,
@@ -51,8 +65,6 @@ class PayloadSource(Protocol):
         page_size: int,
     ) -> Iterator[Mapping[str, object]]: ...
 
-    def fetch_column_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
-
     def iter_column_article_payloads(
         self,
         target: ZhihuTarget,
@@ -60,6 +72,16 @@ class PayloadSource(Protocol):
         page_size: int,
     ) -> Iterator[Mapping[str, object]]: ...
 
+
+class PayloadSource(CollectionSource, Protocol):
+    def fetch_article_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
+
+    def fetch_answer_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
+
+    def fetch_question_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
+
+    def fetch_column_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
+
     def fetch_video_payload(self, target: ZhihuTarget) -> Mapping[str, object]: ...
 
 
@@ -80,6 +102,14 @@ class BrowserReader(Protocol):
     ) -> object: ...
 
 
+class _PageCapture(Protocol):
+    @property
+    def document(self) -> str: ...
+
+    @property
+    def responses(self) -> tuple[tuple[str, object], ...]: ...
+
+
 class BrowserFallbackUnavailableError(RuntimeError):
     """HTTP failed and no configured browser fallback can continue."""
 
@@ -90,10 +120,25 @@ class ArchiveReport:
     receipt: object
     used_browser: bool
     media_failures: tuple[MediaArchiveFailure, ...] = ()
+    circuits: tuple[CircuitReport, ...] = ()
+    proxies: tuple[ProxyStats, ...] = ()
+    accounts: tuple[AccountHealth, ...] = ()
+    coalescing: CoalescingStats | None = None
+    browser_pages: int = 0
+    browser_launches: int = 0
+    warm_browser_used: bool | None = None
+    browser_navigation: BrowserNavigationStats | None = None
 
 
 class ArchiveWorkflow:
-    """One testable use case behind the project's public archive behavior."""
+    """One testable use case behind the project's public archive behavior.
+
+    The browser fallback is started on first use and kept open for every
+    later fallback of the workflow; ``close`` shuts it down together with
+    the other run resources. ``run_reset`` is called at the start of every
+    ``run`` so that retry budgets, circuit breakers, account quotas and
+    statistics shared by the workflow's clients count one run at a time.
+    """
 
     def __init__(
         self,
@@ -106,6 +151,11 @@ class ArchiveWorkflow:
         browser_cookies: Mapping[str, str] | None = None,
         browser_cookie_sink: Callable[[Mapping[str, str]], None] | None = None,
         resource_closer: Callable[[], object] | None = None,
+        circuit_reports: Callable[[], tuple[CircuitReport, ...]] | None = None,
+        proxy_stats: Callable[[], tuple[ProxyStats, ...]] | None = None,
+        account_health: Callable[[], tuple[AccountHealth, ...]] | None = None,
+        coalescing_stats: Callable[[], CoalescingStats] | None = None,
+        run_reset: Callable[[], None] | None = None,
         clock: Callable[[], datetime] = lambda: datetime.now(UTC),
     ) -> None:
         self._source = source
@@ -116,30 +166,89 @@ class ArchiveWorkflow:
         self._browser_cookies = dict(browser_cookies or {})
         self._browser_cookie_sink = browser_cookie_sink
         self._resource_closer = resource_closer
+        self._circuit_reports = circuit_reports
+        self._proxy_stats = proxy_stats
+        self._account_health = account_health
+        self._coalescing_stats = coalescing_stats
+        self._run_reset = run_reset
         self._clock = clock
         self._used_browser = False
+        self._browser: BrowserReader | None = None
+        self._browser_imported: dict[str, str] = {}
+        self._browser_pages = 0
+        self._browser_launches = 0
+        self._browser_warmed = False
+        self._warm_browser_unclaimed = False
+        self._navigation = _NO_NAVIGATION
+        self._navigation_mark = _NO_NAVIGATION
+        self._hydration_remaining = settings.hydration_budget
+        self._refetched: dict[str, Mapping[str, object]] = {}
         self._closed = False
 
-    def run(self, raw_url: str) -> ArchiveReport:
+    def run(self, raw_url: str, *, restart: bool = False) -> ArchiveReport:
+        """Archive ``raw_url``, resuming an interrupted collection crawl.
+
+        ``restart`` discards the target's crawl checkpoints first. They are
+        discarded as well once the archive has been written.
+        """
+
         if self._closed:
             raise RuntimeError("Archive workflow is closed.")
+        if self._run_reset is not None:
+            self._run_reset()
         self._used_browser = False
+        self._browser_pages = 0
+        self._browser_launches = 0
+        # A browser warmed up by an earlier run and not used since still
+        # counts as this run's warm browser.
+        self._browser_warmed = self._warm_browser_unclaimed
+        self._navigation = _NO_NAVIGATION
+        self._navigation_mark = _navigation_stats(self._browser)
+        self._hydration_remaining = self._settings.hydration_budget
+        self._refetched = {}
+        # Decoded browser pages are reused within a run, never across runs.
+        forget_initial_states()
+        self._warm_up_browser()
         routed = route_zhihu_url(raw_url)
-        target = self._collect(routed)
-        receipt = self._sink.archive(target)
+        if restart:
+            self._forget_progress(routed)
+        # Pagination and media of one target share one egress proxy.
+        with proxy_affinity(routed.canonical_url):
+            streamed = self._stream(routed)
+            if streamed is not None:
+                target, receipt = streamed
+            else:
+                target = self._collect(routed)
+                receipt = self._sink.archive(target)
+        self._forget_progress(routed)
+        forget_initial_states()
+        self._count_navigation()
         return ArchiveReport(
             target=target,
             receipt=receipt,
             used_browser=self._used_browser,
             media_failures=_receipt_media_failures(receipt),
+            circuits=self._circuit_reports() if self._circuit_reports is not None else (),
+            proxies=self._proxy_stats() if self._proxy_stats is not None else (),
+            accounts=self._account_health() if self._account_health is not None else (),
+            coalescing=self._coalescing_stats() if self._coalescing_stats is not None else None,
+            browser_pages=self._browser_pages,
+            browser_launches=self._browser_launches,
+            warm_browser_used=self._used_browser if self._browser_warmed else None,
+            browser_navigation=self._navigation if self._navigation.pages else None,
         )
 
     def close(self) -> None:
         if self._closed:
             return
         self._closed = True
-        if self._resource_closer is not None:
-            self._resource_closer()
+        browser, self._browser = self._browser, None
+        try:
+            if browser is not None:
+                browser.__exit__(None, None, None)
+        finally:
+            if self._resource_closer is not None:
+                self._resource_closer()
 
     def __enter__(self) -> Self:
         if self._closed:
@@ -156,119 +265,100 @@ class ArchiveWorkflow:
 
     def _collect(self, target: ZhihuTarget) -> ArchiveTarget:
         if target.kind is TargetKind.ARTICLE:
-            payload = self._single_payload(
+            article = self._single_entity(
                 target,
                 direct=lambda: self._source.fetch_article_payload(target),
                 collection="articles",
-                validate=lambda candidate: _validate_article_payload(
+                normalize=lambda candidate: _complete_article(
                     candidate,
                     source_url=target.canonical_url,
                 ),
             )
-            article = normalize_article(payload, source_url=target.canonical_url)
             return self._with_article_comments(article)
 
         if target.kind is TargetKind.ANSWER:
-            payload = self._single_payload(
+            answer = self._single_entity(
                 target,
                 direct=lambda: self._source.fetch_answer_payload(target),
                 collection="answers",
-                validate=lambda candidate: _validate_answer_payload(
+                normalize=lambda candidate: _complete_answer(
                     candidate,
                     source_url=target.canonical_url,
                 ),
             )
-            answer = normalize_answer(payload, source_url=target.canonical_url)
             return self._with_answer_comments(answer)
 
         if target.kind is TargetKind.QUESTION:
-            question_payload = self._single_payload(
+            question = self._single_entity(
                 target,
                 direct=lambda: self._source.fetch_question_payload(target),
                 collection="questions",
-                validate=lambda candidate: normalize_question(
+                normalize=lambda candidate: normalize_question(
                     candidate,
                     source_url=target.canonical_url,
                 ),
             )
-            question = normalize_question(
-                question_payload,
-                source_url=target.canonical_url,
-            )
-            answer_payloads = self._collection_payloads(
+            answers = self._collection_items(
                 target,
                 collection="questions",
-                direct=lambda: self._source.iter_question_answer_payloads(
+                direct=lambda source: source.iter_question_answer_payloads(
                     target,
                     page_size=self._settings.page_size,
                 ),
-                validate=_validate_answer_payload,
-            )
-            answers = tuple(
-                self._with_answer_comments(normalize_answer(payload)) for payload in answer_payloads
+                normalize=_complete_answer,
             )
             return QuestionArchive(
                 question=question,
-                answers=answers,
+                answers=self._with_collection_comments(answers, "answer"),
                 archived_at=self._clock(),
             )
 
         if target.kind is TargetKind.COLUMN:
-            column_payload = self._single_payload(
+            column = self._single_entity(
                 target,
                 direct=lambda: self._source.fetch_column_payload(target),
                 collection="columns",
-                validate=lambda candidate: normalize_column(
+                normalize=lambda candidate: normalize_column(
                     candidate,
                     source_url=target.canonical_url,
                 ),
             )
-            column = normalize_column(
-                column_payload,
-                source_url=target.canonical_url,
-            )
             origin = ColumnRef(
                 token=column.token,
                 title=column.title,
                 url=column.source_url,
             )
-            articles: list[Article] = []
-            article_payloads = self._collection_payloads(
+            column_articles = self._collection_items(
                 target,
                 collection="columns",
-                direct=lambda: self._source.iter_column_article_payloads(
+                direct=lambda source: source.iter_column_article_payloads(
                     target,
                     page_size=self._settings.page_size,
                 ),
-                validate=_validate_article_payload,
+                normalize=_complete_article,
+            )
+            articles = self._with_collection_comments(
+                [_with_column_origin(article, origin) for article in column_articles],
+                "article",
             )
-            for payload in article_payloads:
-                article = normalize_article(payload)
-                if all(item.token != origin.token for item in article.columns):
-                    article = replace(
-                        article,
-                        columns=(*article.columns, origin),
-                    )
-                articles.append(self._with_article_comments(article))
             if column.item_count == 0 and articles:
                 column = replace(column, item_count=len(articles))
             return ColumnArchive(
                 column=column,
-                articles=tuple(articles),
+                articles=articles,
                 archived_at=self._clock(),
             )
 
         if target.kind is TargetKind.VIDEO:
-            payload = self._single_payload(
+            video = self._single_entity(
                 target,
                 direct=lambda: self._source.fetch_video_payload(target),
                 collection="zvideos",
-                validate=lambda candidate: normalize_video(
+                normalize=lambda candidate: normalize_video(
                     candidate,
                     source_url=target.canonical_url,
                 ),
             )
-            video = normalize_video(payload, source_url=target.canonical_url)
             if not self._settings.comments:
                 return video
             thread = self._comments("zvideo", video.id, video.source_url)
@@ -276,23 +366,102 @@ class ArchiveWorkflow:
 
         raise AssertionError(f"unhandled target kind: {target.kind}")
 
-    def _single_payload(
+    def _stream(self, target: ZhihuTarget) -> tuple[ArchiveTarget, object] | None:
+        """Hand a question's answers or a column's articles to the sink one by one.
+
+        Used when ``archive.streaming`` is on and the sink has
+        ``archive_stream``. The returned target is the question or column
+        without its items, which are never all held at once.
+        """
+
+        archive_stream = getattr(self._sink, "archive_stream", None)
+        if not self._settings.streaming or not callable(archive_stream):
+            return None
+
+        if target.kind is TargetKind.QUESTION:
+            question = QuestionArchive(
+                question=self._single_entity(
+                    target,
+                    direct=lambda: self._source.fetch_question_payload(target),
+                    collection="questions",
+                    normalize=lambda candidate: normalize_question(
+                        candidate,
+                        source_url=target.canonical_url,
+                    ),
+                ),
+                answers=(),
+                archived_at=self._clock(),
+            )
+            answers = self._streamed_items(
+                target,
+                collection="questions",
+                direct=lambda source: source.iter_question_answer_payloads(
+                    target,
+                    page_size=self._settings.page_size,
+                ),
+                normalize=_complete_answer,
+            )
+            return question, archive_stream(
+                question,
+                (self._with_answer_comments(answer) for answer in answers),
+            )
+
+        if target.kind is TargetKind.COLUMN:
+            column = ColumnArchive(
+                column=self._single_entity(
+                    target,
+                    direct=lambda: self._source.fetch_column_payload(target),
+                    collection="columns",
+                    normalize=lambda candidate: normalize_column(
+                        candidate,
+                        source_url=target.canonical_url,
+                    ),
+                ),
+                articles=(),
+                archived_at=self._clock(),
+            )
+            origin = ColumnRef(
+                token=column.column.token,
+                title=column.column.title,
+                url=column.column.source_url,
+            )
+            articles = self._streamed_items(
+                target,
+                collection="columns",
+                direct=lambda source: source.iter_column_article_payloads(
+                    target,
+                    page_size=self._settings.page_size,
+                ),
+                normalize=_complete_article,
+            )
+            return column, archive_stream(
+                column,
+                (
+                    self._with_article_comments(_with_column_origin(article, origin))
+                    for article in articles
+                ),
+            )
+        return None
+
+    def _single_entity(
         self,
         target: ZhihuTarget,
         *,
         direct: Callable[[], Mapping[str, object]],
         collection: str,
-        validate: Callable[[Mapping[str, object]], object],
-    ) -> Mapping[str, object]:
-        def validated(payload: Mapping[str, object]) -> Mapping[str, object]:
-            validate(payload)
-            return payload
+        normalize: Callable[[Mapping[str, object]], _T],
+    ) -> _T:
+        """Fetch and normalize one entity, parsing each payload only once.
+
+        A payload that fails to normalize, including one whose rich text is
+        empty, sends the target to the browser fallback.
+        """
 
         mode = self._settings.browser_fallback
         if mode is BrowserFallbackMode.ALWAYS:
-            return validated(self._browser_payload(target, collection=collection))
+            return normalize(self._browser_payload(target, collection=collection))
         try:
-            return validated(direct())
+            return self._with_full_shape_retry(lambda: normalize(direct()))
         except (
             InvalidZhihuPayloadError,
             InvalidResponseError,
@@ -302,7 +471,7 @@ class ArchiveWorkflow:
         ):
             if mode is BrowserFallbackMode.NEVER:
                 raise
-            return validated(self._browser_payload(target, collection=collection))
+            return normalize(self._browser_payload(target, collection=collection))
 
     def _browser_payload(
         self,
@@ -310,40 +479,189 @@ class ArchiveWorkflow:
         *,
         collection: str,
     ) -> Mapping[str, object]:
-        if self._browser_factory is None:
-            raise BrowserFallbackUnavailableError("HTTP 抓取失败，但当前没有配置浏览器回退。")
-        with self._browser_factory() as browser:
-            if self._browser_cookies:
-                browser.set_cookie_dict(self._browser_cookies)
-            document = browser.fetch_html(target.canonical_url)
-            exported_cookies = browser.cookie_dict()
-            if exported_cookies:
-                self._browser_cookies.update(exported_cookies)
-                if self._browser_cookie_sink is not None:
-                    self._browser_cookie_sink(exported_cookies)
-        self._used_browser = True
         return extract_entity_payload(
-            document,
+            self._browser_documents((target.canonical_url,))[0],
             collection=collection,
             entity_id=target.content_id,
         )
 
-    def _collection_payloads(
+    def _browser_documents(self, urls: Sequence[str]) -> list[str]:
+        """Load pages in the browser and hand its Cookie values back to HTTP.
+
+        A browser with ``fetch_initial_state`` returns just each page's state
+        rather than its serialized DOM. A browser with ``fetch_many_html``
+        loads several pages at once; pages it could not load are left out
+        rather than failing the batch.
+        """
+
+        def load(browser: BrowserReader) -> list[str]:
+            fetch_initial_state = getattr(browser, "fetch_initial_state", None)
+            fetch_many_html = getattr(browser, "fetch_many_html", None)
+            if len(urls) > 1 and callable(fetch_many_html):
+                options = {"initial_state": True} if callable(fetch_initial_state) else {}
+                # Tabs finish in any order; keep the documents in URL order.
+                loaded = {
+                    result.url: result.html
+                    for result in fetch_many_html(urls, **options)
+                    if result.html is not None
+                }
+                return [loaded[url] for url in urls if url in loaded]
+            fetch = fetch_initial_state if callable(fetch_initial_state) else browser.fetch_html
+            return [fetch(url) for url in urls]
+
+        return self._with_browser(load, pages=len(urls))
+
+    def _browser_capture(self, target: ZhihuTarget, collection: str) -> _PageCapture | None:
+        """Scroll the target page and keep its own collection API responses."""
+
+        if not self._settings.capture_api:
+            return None
+        api_path = _CAPTURED_API_PATHS[collection].format(re.escape(target.content_id))
+
+        def capture(browser: BrowserReader) -> _PageCapture | None:
+            capture_api_responses = getattr(browser, "capture_api_responses", None)
+            if not callable(capture_api_responses):
+                return None
+            captured = cast(_PageCapture, capture_api_responses(target.canonical_url, api_path))
+            self._browser_pages += 1
+            return captured
+
+        # The page is only counted once the browser could actually capture it.
+        return self._with_browser(capture, pages=0)
+
+    def _with_browser(self, load: Callable[[BrowserReader], _T], *, pages: int) -> _T:
+        """Run ``load`` in the browser, replacing a broken browser once.
+
+        A browser that failed to launch or navigate, or whose context was
+        closed underneath it, stays broken; it is closed and discarded, and
+        ``load`` is retried with a newly started one.
+        """
+
+        try:
+            return self._load_in_browser(load, pages=pages)
+        except BrowserDependencyError:
+            raise
+        except BrowserFallbackError:
+            self._discard_browser()
+            return self._load_in_browser(load, pages=pages)
+
+    def _load_in_browser(self, load: Callable[[BrowserReader], _T], *, pages: int) -> _T:
+        browser = self._open_browser()
+        if self._warm_browser_unclaimed:
+            # A warmed-up browser counts as launched once a fallback uses it.
+            self._warm_browser_unclaimed = False
+            self._browser_launches += 1
+        changed_cookies = {
+            name: value
+            for name, value in self._browser_cookies.items()
+            if self._browser_imported.get(name) != value
+        }
+        if changed_cookies:
+            browser.set_cookie_dict(changed_cookies)
+            self._browser_imported.update(changed_cookies)
+        loaded = load(browser)
+        self._browser_pages += pages
+        exported_cookies = browser.cookie_dict()
+        if exported_cookies:
+            self._browser_imported.update(exported_cookies)
+            self._browser_cookies.update(exported_cookies)
+            if self._browser_cookie_sink is not None:
+                self._browser_cookie_sink(exported_cookies)
+        self._used_browser = True
+        return loaded
+
+    def _warm_up_browser(self) -> None:
+        """Start the browser in the background while HTTP is still being tried."""
+
+        if (
+            not self._settings.warm_up
+            or self._settings.browser_fallback is BrowserFallbackMode.NEVER
+            or self._browser_factory is None
+            or self._browser is not None
+        ):
+            return
+        warm_up = getattr(self._open_browser(warm=True), "warm_up", None)
+        if callable(warm_up):
+            warm_up()
+            self._browser_warmed = True
+
+    def _open_browser(self, *, warm: bool = False) -> BrowserReader:
+        if self._browser is not None:
+            return self._browser
+        if self._browser_factory is None:
+            raise BrowserFallbackUnavailableError("HTTP 抓取失败，但当前没有配置浏览器回退。")
+        self._browser = self._browser_factory().__enter__()
+        self._browser_imported = {}
+        if warm:
+            self._warm_browser_unclaimed = True
+        else:
+            self._browser_launches += 1
+        return self._browser
+
+    def _count_navigation(self) -> None:
+        """Add the current browser's page loads since the last count to this run."""
+
+        current = _navigation_stats(self._browser)
+        mark = self._navigation_mark
+        self._navigation = BrowserNavigationStats(
+            pages=self._navigation.pages + current.pages - mark.pages,
+            seconds=self._navigation.seconds + current.seconds - mark.seconds,
+            blocked_requests=(
+                self._navigation.blocked_requests + current.blocked_requests - mark.blocked_requests
+            ),
+        )
+        self._navigation_mark = current
+
+    def _discard_browser(self) -> None:
+        self._count_navigation()
+        # The replacement browser counts its page loads from zero.
+        self._navigation_mark = _NO_NAVIGATION
+        self._warm_browser_unclaimed = False
+        browser, self._browser = self._browser, None
+        if browser is None:
+            return
+        try:
+            browser.__exit__(None, None, None)
+        except BrowserFallbackError:
+            # The browser is already broken; a replacement is started next.
+            pass
+
+    def _collection_items(
         self,
         target: ZhihuTarget,
         *,
         collection: str,
-        direct: Callable[[], Iterator[Mapping[str, object]]],
-        validate: Callable[[Mapping[str, object]], object],
-    ) -> tuple[Mapping[str, object], ...]:
-        def collect_validated() -> tuple[Mapping[str, object], ...]:
-            payloads = tuple(direct())
-            for payload in payloads:
-                validate(payload)
-            return payloads
+        direct: Callable[[CollectionSource], Iterator[Mapping[str, object]]],
+        normalize: Callable[[Mapping[str, object]], _T],
+    ) -> tuple[_T, ...]:
+        """Fetch and normalize a collection, parsing each payload only once.
+
+        Truncated items are first refetched one by one (``_hydrated``); the
+        full-shape retry and the browser fallback below only run when that
+        is not enough. Items normalized before a failure are kept by id;
+        when the fallback fetches an identical payload again, the earlier
+        result is reused instead of parsing its rich text a second time.
+        """
+
+        normalized: dict[str, tuple[Mapping[str, object], _T]] = {}
+
+        def normalize_once(payload: Mapping[str, object]) -> _T:
+            entity_id = str(payload.get("id", ""))
+            known = normalized.get(entity_id)
+            if known is not None and known[0] == payload:
+                return known[1]
+            item = normalize(payload)
+            normalized[entity_id] = (payload, item)
+            return item
 
         try:
-            return collect_validated()
+            return self._with_full_shape_retry(
+                lambda: self._hydrated(
+                    direct(self._source),
+                    collection=collection,
+                    normalize=normalize_once,
+                )
+            )
         except (
             InvalidZhihuPayloadError,
             InvalidResponseError,
@@ -353,15 +671,289 @@ class ArchiveWorkflow:
         ):
             if self._settings.browser_fallback is BrowserFallbackMode.NEVER:
                 raise
-            self._browser_payload(target, collection=collection)
-            return collect_validated()
+
+        # One navigation refreshes the Cookie values and usually carries the
+        # first screen of items in full. While scrolling, the page also pages
+        # through the collection API itself; when those responses cover the
+        # whole collection they replace the HTTP pagination. Items still
+        # missing afterwards are loaded from their own pages, as many at a
+        # time as the browser keeps tabs, and each of those pages harvests
+        # its neighbours as well.
+        item_collection = _ITEM_COLLECTIONS[collection]
+        capture = self._browser_capture(target, collection)
+        if capture is None:
+            harvested = self._harvest((target.canonical_url,), item_collection)
+            payloads = tuple(direct(self._source))
+        else:
+            harvested = harvest_entities(capture.document, (item_collection,))[item_collection]
+            try:
+                payloads = tuple(
+                    direct(
+                        CapturedCollectionSource(
+                            capture.responses,
+                            first_screen=harvested.values(),
+                        )
+                    )
+                )
+            except InvalidZhihuPayloadError:
+                payloads = tuple(direct(self._source))
+        items: list[_T | None] = []
+        incomplete: dict[int, str] = {}
+        for index, payload in enumerate(payloads):
+            try:
+                items.append(normalize_once(payload))
+            except NormalizationError:
+                items.append(None)
+                incomplete[index] = str(payload.get("id", ""))
+
+        self._harvest_items(item_collection, incomplete.values(), harvested)
+        for index, entity_id in incomplete.items():
+            items[index] = normalize_once(harvested.get(entity_id, payloads[index]))
+        return tuple(cast(list[_T], items))
+
+    def _hydrated(
+        self,
+        payloads: Iterable[Mapping[str, object]],
+        *,
+        collection: str,
+        normalize: Callable[[Mapping[str, object]], _T],
+    ) -> tuple[_T, ...]:
+        """Normalize a collection, refetching only the items that fail.
+
+        Up to ``network.hydration_budget`` items per run are loaded from their
+        own API endpoint, ``network.concurrency`` at a time, and an item is
+        never loaded twice in a run. With more deficient items the
+        ``NormalizationError`` is raised for the whole collection; a refetched
+        item that is still incomplete is loaded from its own page by the
+        browser. A missing projected field is raised at once, since only the
+        full shape has it.
+        """
+
+        items: list[_T | None] = []
+        deficient: dict[int, str] = {}
+        errors: list[NormalizationError] = []
+        for index, payload in enumerate(payloads):
+            try:
+                items.append(normalize(payload))
+            except NormalizationError as error:
+                entity_id = str(payload.get("id", ""))
+                if isinstance(error, MissingProjectedFieldError) or not entity_id.isdigit():
+                    raise
+                items.append(None)
+                deficient[index] = entity_id
+                errors.append(error)
+        if not deficient:
+            return tuple(cast(list[_T], items))
+        item_collection = _ITEM_COLLECTIONS[collection]
+        pending = [
+            entity_id
+            for entity_id in dict.fromkeys(deficient.values())
+            if entity_id not in self._refetched
+        ]
+        if len(pending) > self._hydration_remaining:
+            raise errors[0]
+        self._refetch(item_collection, pending)
+        truncated: dict[int, str] = {}
+        for index, entity_id in deficient.items():
+            try:
+                items[index] = normalize(self._refetched[entity_id])
+            except NormalizationError:
+                if self._settings.browser_fallback is BrowserFallbackMode.NEVER:
+                    raise
+                truncated[index] = entity_id
+        if truncated:
+            harvested = self._harvest_items(item_collection, truncated.values(), {})
+            for index, entity_id in truncated.items():
+                items[index] = normalize(harvested.get(entity_id, self._refetched[entity_id]))
+        return tuple(cast(list[_T], items))
+
+    def _refetch(self, item_collection: str, entity_ids: Sequence[str]) -> None:
+        """Load items the run has not refetched yet, spending the run budget."""
+
+        pending = [entity_id for entity_id in entity_ids if entity_id not in self._refetched]
+        self._hydration_remaining -= len(pending)
+        self._refetched.update(self._fetch_items(item_collection, pending))
+
+    def _harvest_items(
+        self,
+        item_collection: str,
+        entity_ids: Iterable[str],
+        harvested: dict[str, Mapping[str, object]],
+    ) -> dict[str, Mapping[str, object]]:
+        """Add the items missing from ``harvested`` from their own pages.
+
+        As many pages are opened at a time as the browser keeps tabs, and each
+        page harvests its neighbours as well.
+        """
+
+        batch_size = max(1, getattr(self._browser, "max_pages", 1))
+        missing = [
+            entity_id
+            for entity_id in dict.fromkeys(entity_ids)
+            if entity_id.isdigit() and entity_id not in harvested
+        ]
+        while missing:
+            batch, missing = missing[:batch_size], missing[batch_size:]
+            item_urls = [_ITEM_URLS[item_collection].format(entity_id) for entity_id in batch]
+            for found_id, entity in self._harvest(item_urls, item_collection).items():
+                harvested.setdefault(found_id, entity)
+            missing = [entity_id for entity_id in missing if entity_id not in harvested]
+        return harvested
+
+    def _fetch_items(
+        self,
+        item_collection: str,
+        entity_ids: Iterable[str],
+    ) -> dict[str, Mapping[str, object]]:
+        """Load answers or articles from their own API endpoints."""
+
+        if item_collection == "answers":
+            kind, fetch = TargetKind.ANSWER, self._source.fetch_answer_payload
+        else:
+            kind, fetch = TargetKind.ARTICLE, self._source.fetch_article_payload
+
+        def load(entity_id: str) -> Mapping[str, object]:
+            return fetch(
+                ZhihuTarget(
+                    kind=kind,
+                    content_id=entity_id,
+                    canonical_url=_ITEM_URLS[item_collection].format(entity_id),
+                )
+            )
+
+        pending = list(dict.fromkeys(entity_ids))
+        return dict(
+            zip(
+                pending,
+                _map_concurrently(load, pending, workers=self._settings.concurrency),
+                strict=True,
+            )
+        )
+
+    def _streamed_items(
+        self,
+        target: ZhihuTarget,
+        *,
+        collection: str,
+        direct: Callable[[CollectionSource], Iterator[Mapping[str, object]]],
+        normalize: Callable[[Mapping[str, object]], _T],
+    ) -> Iterator[_T]:
+        """Yield a collection's items as their pages arrive.
+
+        A lean payload missing a projected field switches to the full shape,
+        as in ``_collection_items``. A truncated item is refetched from its
+        own API endpoint while the run's hydration budget lasts. An item that
+        is still truncated is completed from the entities the browser
+        harvested from the target page, or from the item's own page.
+
+        When a page request fails, one navigation refreshes the Cookie values
+        and pagination starts over, skipping the items already yielded.
+        Captured API responses are not used here, since they would hold the
+        whole collection at once.
+        """
+
+        item_collection = _ITEM_COLLECTIONS[collection]
+        harvested: dict[str, Mapping[str, object]] | None = None
+        yielded: set[str] = set()
+        refreshed = False
+        while True:
+            widened = False
+            try:
+                for payload in direct(self._source):
+                    entity_id = str(payload.get("id", ""))
+                    if entity_id and entity_id in yielded:
+                        continue
+                    try:
+                        item = normalize(payload)
+                    except NormalizationError as error:
+                        if isinstance(error, MissingProjectedFieldError) and self._widen_source():
+                            widened = True
+                            break
+                        if entity_id.isdigit() and (
+                            entity_id in self._refetched or self._hydration_remaining > 0
+                        ):
+                            self._refetch(item_collection, (entity_id,))
+                            payload = self._refetched[entity_id]
+                            try:
+                                item = normalize(payload)
+                            except NormalizationError:
+                                pass
+                            else:
+                                yielded.add(entity_id)
+                                yield item
+                                continue
+                        if self._settings.browser_fallback is BrowserFallbackMode.NEVER:
+                            raise
+                        if harvested is None:
+                            harvested = self._harvest((target.canonical_url,), item_collection)
+                        if entity_id.isdigit() and entity_id not in harvested:
+                            item_url = _ITEM_URLS[item_collection].format(entity_id)
+                            for found_id, entity in self._harvest(
+                                (item_url,), item_collection
+                            ).items():
+                                harvested.setdefault(found_id, entity)
+                        item = normalize(harvested.get(entity_id, payload))
+                    yielded.add(entity_id)
+                    yield item
+            except (
+                InvalidZhihuPayloadError,
+                InvalidResponseError,
+                ZhihuHttpError,
+                TransportError,
+            ):
+                if refreshed or self._settings.browser_fallback is BrowserFallbackMode.NEVER:
+                    raise
+                refreshed = True
+                page = self._harvest((target.canonical_url,), item_collection)
+                harvested = page if harvested is None else {**page, **harvested}
+                continue
+            if not widened:
+                return
+
+    def _harvest(self, urls: Sequence[str], collection: str) -> dict[str, Mapping[str, object]]:
+        harvested: dict[str, Mapping[str, object]] = {}
+        for document in self._browser_documents(urls):
+            for entity_id, entity in harvest_entities(document, (collection,))[collection].items():
+                harvested.setdefault(entity_id, entity)
+        return harvested
+
+    def _with_full_shape_retry(self, fetch: Callable[[], _T]) -> _T:
+        """Retry once with the full API shape when a lean payload lacks a field.
+
+        ``fetch`` must read ``self._source`` when called, so the retry and the
+        rest of the run use the wider source.
+        """
+
+        try:
+            return fetch()
+        except MissingProjectedFieldError:
+            if not self._widen_source():
+                raise
+            return fetch()
+
+    def _forget_progress(self, target: ZhihuTarget) -> None:
+        forget_progress = getattr(self._source, "forget_progress", None)
+        if callable(forget_progress):
+            forget_progress(target)
+
+    def _widen_source(self) -> bool:
+        """Switch to the full API shape; ``False`` when already using it."""
+
+        full_shape = getattr(self._source, "full_shape", None)
+        wider = full_shape() if callable(full_shape) else self._source
+        if wider is self._source:
+            return False
+        self._source = wider
+        return True
 
     def _with_article_comments(self, article: Article) -> Article:
         if not self._settings.comments:
             return article
         return replace(
             article,
-            comments=self._comments("article", article.id, article.source_url),
+            comments=self._comments(
+                "article", article.id, article.source_url, comment_count=article.comment_count
+            ),
         )
 
     def _with_answer_comments(self, answer: Answer) -> Answer:
@@ -369,62 +961,179 @@ class ArchiveWorkflow:
             return answer
         return replace(
             answer,
-            comments=self._comments("answer", answer.id, answer.source_url),
+            comments=self._comments(
+                "answer", answer.id, answer.source_url, comment_count=answer.comment_count
+            ),
+        )
+
+    def _with_collection_comments(
+        self,
+        items: Sequence[_Commented],
+        target_kind: str,
+    ) -> tuple[_Commented, ...]:
+        """Attach comment threads to a question's answers or a column's articles.
+
+        Threads are requested ``network.concurrency`` items at a time. Items
+        whose request failed are retried one by one afterwards, once the
+        browser refreshed the Cookie values, so the browser is only ever
+        driven from this thread.
+        """
+
+        if not self._settings.comments:
+            return tuple(items)
+        attempts = _map_concurrently(
+            lambda item: self._attempt_comments(target_kind, item.id, item.comment_count),
+            items,
+            workers=self._settings.concurrency,
+        )
+        return tuple(
+            replace(
+                item,
+                comments=self._settled_comments(
+                    attempt,
+                    target_kind,
+                    item.id,
+                    item.source_url,
+                    comment_count=item.comment_count,
+                ),
+            )
+            for item, attempt in zip(items, attempts, strict=True)
         )
 
-    def _comments(self, target_kind: str, target_id: str, source_url: str):
+    def _comments(
+        self,
+        target_kind: str,
+        target_id: str,
+        source_url: str,
+        *,
+        comment_count: int | None = None,
+    ) -> CommentThread:
+        return self._settled_comments(
+            self._attempt_comments(target_kind, target_id, comment_count),
+            target_kind,
+            target_id,
+            source_url,
+            comment_count=comment_count,
+        )
+
+    def _attempt_comments(
+        self,
+        target_kind: str,
+        target_id: str,
+        comment_count: int | None,
+    ) -> CommentThread | Exception:
+        """Fetch one thread over HTTP, returning the error instead of raising it."""
+
         if self._comment_client is None:
             raise RuntimeError("评论已启用，但没有可用的知乎请求客户端。")
-
-        def fetch():
+        try:
             return fetch_comment_thread(
                 self._comment_client,
                 target_kind=target_kind,
                 target_id=target_id,
                 root_limit=self._settings.comment_roots,
                 reply_limit=self._settings.comment_replies,
+                comment_count=comment_count,
             )
-
-        try:
-            return fetch()
         except (
             InvalidCommentPayloadError,
             InvalidResponseError,
             ZhihuHttpError,
             TransportError,
-        ):
-            if self._settings.browser_fallback is BrowserFallbackMode.NEVER:
-                raise
-            collections = {
-                "article": "articles",
-                "answer": "answers",
-                "zvideo": "zvideos",
-            }
-            self._browser_payload(
-                route_zhihu_url(source_url),
-                collection=collections[target_kind],
-            )
-            return fetch()
+        ) as error:
+            return error
+
+    def _settled_comments(
+        self,
+        attempt: CommentThread | Exception,
+        target_kind: str,
+        target_id: str,
+        source_url: str,
+        *,
+        comment_count: int | None,
+    ) -> CommentThread:
+        """Return a fetched thread, or refresh the session once and refetch it."""
+
+        if not isinstance(attempt, Exception):
+            return attempt
+        if self._settings.browser_fallback is BrowserFallbackMode.NEVER:
+            raise attempt
+        collections = {
+            "article": "articles",
+            "answer": "answers",
+            "zvideo": "zvideos",
+        }
+        self._browser_payload(
+            route_zhihu_url(source_url),
+            collection=collections[target_kind],
+        )
+        retried = self._attempt_comments(target_kind, target_id, comment_count)
+        if isinstance(retried, Exception):
+            raise retried
+        return retried
+
+
+_ITEM_COLLECTIONS = {"questions": "answers", "columns": "articles"}
+
+_CAPTURED_API_PATHS = {
+    "questions": r"^/api/v4/questions/{}/answers$",
+    "columns": r"^/api/v4/columns/{}/items$",
+}
 
+_ITEM_URLS = {
+    "answers": "https://www.zhihu.com/answer/{}",
+    "articles": "https://zhuanlan.zhihu.com/p/{}",
+}
 
-def _validate_article_payload(
+_NO_NAVIGATION = BrowserNavigationStats(pages=0, seconds=0.0, blocked_requests=0)
+
+
+def _map_concurrently(
+    function: Callable[[_T], _R],
+    items: Sequence[_T],
+    *,
+    workers: int,
+) -> list[_R]:
+    """Apply ``function`` to every item, up to ``workers`` at a time, in order.
+
+    Worker threads run in a copy of the caller's context, so requests keep
+    the run's proxy affinity.
+    """
+
+    workers = min(workers, len(items))
+    if workers <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zhihu-worker") as pool:
+        futures = [pool.submit(copy_context().run, function, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def _with_column_origin(article: Article, origin: ColumnRef) -> Article:
+    if any(item.token == origin.token for item in article.columns):
+        return article
+    return replace(article, columns=(*article.columns, origin))
+
+
+def _complete_article(
     payload: Mapping[str, object],
     *,
     source_url: str | None = None,
-) -> None:
+) -> Article:
     article = normalize_article(payload, source_url=source_url)
     if not article.blocks:
         raise NormalizationError("article payload is missing full content")
+    return article
 
 
-def _validate_answer_payload(
+def _complete_answer(
     payload: Mapping[str, object],
     *,
     source_url: str | None = None,
-) -> None:
+) -> Answer:
     answer = normalize_answer(payload, source_url=source_url)
     if not answer.blocks:
         raise NormalizationError("answer payload is missing full content")
+    return answer
 
 
 def _receipt_media_failures(receipt: object) -> tuple[MediaArchiveFailure, ...]:
@@ -434,3 +1143,11 @@ def _receipt_media_failures(receipt: object) -> tuple[MediaArchiveFailure, ...]:
     return tuple(
         candidate for candidate in candidates if isinstance(candidate, MediaArchiveFailure)
     )
+
+
+def _navigation_stats(browser: BrowserReader | None) -> BrowserNavigationStats:
+    navigation_stats = getattr(browser, "navigation_stats", None)
+    if not callable(navigation_stats):
+        return _NO_NAVIGATION
+    stats = navigation_stats()
+    return stats if isinstance(stats, BrowserNavigationStats) else _NO_NAVIGATION
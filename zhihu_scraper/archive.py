@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Callable, Mapping
+import shutil
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, replace
 from functools import partial
 from html import escape
 from pathlib import Path, PurePosixPath
+from typing import TextIO, cast
 from urllib.parse import quote
 
 from .assets import AssetArchiveReceipt, MediaArchiveFailure, archive_assets
+from .circuit import CircuitBreaker
 from .database import ArchiveDatabase
 from .domain import (
     Answer,
@@ -23,6 +27,8 @@ from .domain import (
 )
 from .filenames import safe_filename
 from .media import MediaDownloadReceipt, download_media
+from .proxies import ProxyPool
+from .ratelimit import RateLimiter
 from .render import (
     ColumnRenderContext,
     HtmlRenderer,
@@ -74,6 +80,9 @@ class LocalArchive:
         settings: ArchiveSettings,
         *,
         downloader: MediaDownloader | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit: CircuitBreaker | None = None,
+        proxy_pool: ProxyPool | None = None,
     ) -> LocalArchive:
         if settings.pdf:
             raise NotImplementedError("PDF 输出仍是待办功能，请先保持 pdf = false。")
@@ -86,9 +95,12 @@ class LocalArchive:
             downloader=downloader
             or partial(
                 download_media,
-                proxy=settings.proxy,
+                proxy=settings.proxy_urls[0] if settings.proxy_urls else None,
                 timeout=settings.timeout,
                 max_retries=settings.retries,
+                rate_limiter=rate_limiter,
+                circuit=circuit,
+                proxy_pool=proxy_pool,
             ),
         )
 
@@ -101,6 +113,28 @@ class LocalArchive:
             return self._archive_column(render_target, database_target=target)
         return self._archive_standalone(render_target, database_target=target)
 
+    def archive_stream(
+        self,
+        target: QuestionArchive | ColumnArchive,
+        items: Iterable[Answer] | Iterable[Article],
+    ) -> ArchiveReceipt:
+        """Write a question or column while its answers or articles arrive.
+
+        ``target`` carries the question or column without items. Each item's
+        media, SQLite rows and (for columns) child files are written as soon
+        as it arrives, so memory stays bounded by one item and an interrupted
+        run keeps everything written so far. The merged question document and
+        the column directory are produced at the end; until then the previous
+        version of those files stays in place.
+        """
+
+        self._root.mkdir(parents=True, exist_ok=True)
+        if isinstance(target, ColumnArchive):
+            articles = (item for item in items if isinstance(item, Article))
+            return self._stream_column(target, articles)
+        answers = (item for item in items if isinstance(item, Answer))
+        return self._stream_question(target, answers)
+
     def _archive_standalone(
         self,
         target: ArchiveTarget,
@@ -303,6 +337,238 @@ class LocalArchive:
             media_failures=assets.failures,
         )
 
+    def _stream_question(
+        self,
+        archive: QuestionArchive,
+        answers: Iterable[Answer],
+    ) -> ArchiveReceipt:
+        filename = safe_filename(archive.title)
+        entry_directory = self._entry_directory(
+            title=archive.title,
+            target_type="question",
+            target_id=archive.id,
+            source_url=archive.source_url,
+        )
+        entry_directory.mkdir(parents=True, exist_ok=True)
+        header_assets = self._archive_media(archive, entry_directory)
+        downloads = list(header_assets.downloads)
+        failures = list(header_assets.failures)
+        header_paths = self._render_media_paths(
+            archive,
+            entry_directory,
+            header_assets.source_paths,
+        )
+        database_path = self._save_database(
+            archive,
+            media_paths=self._database_media_paths(entry_directory, header_assets.source_paths),
+        )
+        renderers = [
+            (renderer, entry_directory / f"{filename}{suffix}")
+            for renderer, suffix, enabled in (
+                (MarkdownRenderer(), ".md", self._markdown),
+                (HtmlRenderer(), ".html", self._html),
+            )
+            if enabled
+        ]
+
+        answer_count = 0
+        with ExitStack() as spools:
+            sections = [
+                spools.enter_context(_spool(path.with_name(f".{path.name}.part")))
+                for _renderer, path in renderers
+            ]
+            for answer in answers:
+                answer_count += 1
+                render_answer = cast(Answer, self._restore_unfetched_comments(answer))
+                assets = self._archive_media(render_answer, entry_directory)
+                downloads.extend(assets.downloads)
+                failures.extend(assets.failures)
+                render_paths = self._render_media_paths(
+                    render_answer,
+                    entry_directory,
+                    assets.source_paths,
+                )
+                for (renderer, _path), section in zip(renderers, sections, strict=True):
+                    section.write(
+                        renderer.render_question_answer(
+                            render_answer,
+                            index=answer_count,
+                            media_paths=render_paths,
+                        )
+                    )
+                self._save_database(
+                    answer,
+                    media_paths=self._database_media_paths(entry_directory, assets.source_paths),
+                )
+            for (renderer, path), section in zip(renderers, sections, strict=True):
+                section.flush()
+                _atomic_write_spooled(
+                    path,
+                    renderer.render_question_header(
+                        archive,
+                        answer_count=answer_count,
+                        media_paths=header_paths,
+                    ),
+                    Path(section.name),
+                    renderer.render_question_footer(),
+                )
+        if self._html:
+            self._write_html_assets(entry_directory / "assets")
+        return ArchiveReceipt(
+            entry_directory=entry_directory,
+            markdown_path=entry_directory / f"{filename}.md" if self._markdown else None,
+            html_path=entry_directory / f"{filename}.html" if self._html else None,
+            database_path=database_path,
+            media_downloads=tuple(downloads),
+            media_failures=tuple(failures),
+        )
+
+    def _stream_column(
+        self,
+        archive: ColumnArchive,
+        articles: Iterable[Article],
+    ) -> ArchiveReceipt:
+        column = archive.column
+        column_filename = safe_filename(column.title)
+        entry_directory = self._entry_directory(
+            title=column.title,
+            target_type="column",
+            target_id=column.token,
+            source_url=column.source_url,
+        )
+        content_directory = entry_directory / "内容"
+        content_directory.mkdir(parents=True, exist_ok=True)
+        column_ref = ColumnRef(
+            token=column.token,
+            title=column.title,
+            url=column.source_url,
+        )
+        directory_item = RenderNavigationItem(
+            title=column.title,
+            markdown_href=_relative_href(f"../{column_filename}.md") if self._markdown else "",
+            html_href=_relative_href(f"../{column_filename}.html") if self._html else "",
+        )
+        markdown_renderer = MarkdownRenderer()
+        html_renderer = HtmlRenderer()
+        child_markdown_paths: list[Path] = []
+        child_html_paths: list[Path] = []
+        downloads: list[MediaDownloadReceipt] = []
+        failures: list[MediaArchiveFailure] = []
+        # Only titles, dates and file names are kept for the directory page.
+        listed: list[Article] = []
+        directory_entries: dict[str, RenderNavigationItem] = {}
+        used_names: set[str] = set()
+        previous_navigation: RenderNavigationItem | None = None
+        # Each child links to its successor, so it is written once that arrives.
+        pending: tuple[Article, str, dict[str, str], RenderNavigationItem | None] | None = None
+
+        def write_child(
+            article: Article,
+            name: str,
+            media_paths: Mapping[str, str],
+            previous: RenderNavigationItem | None,
+            following: RenderNavigationItem | None,
+        ) -> None:
+            context = ColumnRenderContext(
+                column=column_ref,
+                directory=directory_item,
+                item_count=column.item_count,
+                previous=previous,
+                next=following,
+            )
+            if self._markdown:
+                article_markdown = content_directory / f"{name}.md"
+                _atomic_write_text(
+                    article_markdown,
+                    markdown_renderer.render(
+                        article,
+                        media_paths=media_paths,
+                        column_context=context,
+                    ),
+                )
+                child_markdown_paths.append(article_markdown)
+            if self._html:
+                article_html = content_directory / f"{name}.html"
+                _atomic_write_text(
+                    article_html,
+                    html_renderer.render(
+                        article,
+                        media_paths=media_paths,
+                        column_context=context,
+                    ),
+                )
+                child_html_paths.append(article_html)
+
+        for article in articles:
+            name = _unique_article_name(article, used_names)
+            render_article = cast(Article, self._restore_unfetched_comments(article))
+            assets = self._archive_media(render_article, entry_directory)
+            downloads.extend(assets.downloads)
+            failures.extend(assets.failures)
+            render_paths = self._render_media_paths(
+                render_article,
+                entry_directory,
+                assets.source_paths,
+            )
+            self._save_database(
+                replace(archive, articles=(article,)),
+                media_paths=self._database_media_paths(entry_directory, assets.source_paths),
+            )
+            navigation = _article_navigation(
+                article,
+                name,
+                markdown=self._markdown,
+                html=self._html,
+            )
+            if pending is not None:
+                write_child(*pending, navigation)
+            pending = (
+                render_article,
+                name,
+                {source: f"../{path}" for source, path in render_paths.items()},
+                previous_navigation,
+            )
+            previous_navigation = navigation
+            directory_entries[article.id] = RenderNavigationItem(
+                title=article.title,
+                markdown_href=_relative_href(f"内容/{name}.md") if self._markdown else "",
+                html_href=_relative_href(f"内容/{name}.html") if self._html else "",
+            )
+            listed.append(replace(article, blocks=(), comments=None))
+        if pending is not None:
+            write_child(*pending, None)
+
+        if column.item_count == 0 and listed:
+            column = replace(column, item_count=len(listed))
+        database_path = self._save_database(
+            replace(archive, column=column, articles=()),
+            media_paths={},
+        )
+        directory = replace(archive, column=column, articles=tuple(listed))
+        markdown_path = entry_directory / f"{column_filename}.md" if self._markdown else None
+        html_path = entry_directory / f"{column_filename}.html" if self._html else None
+        if markdown_path is not None:
+            _atomic_write_text(
+                markdown_path,
+                markdown_renderer.render(directory, directory_entries=directory_entries),
+            )
+        if html_path is not None:
+            _atomic_write_text(
+                html_path,
+                html_renderer.render(directory, directory_entries=directory_entries),
+            )
+            self._write_html_assets(entry_directory / "assets")
+        return ArchiveReceipt(
+            entry_directory=entry_directory,
+            markdown_path=markdown_path,
+            html_path=html_path,
+            database_path=database_path,
+            child_markdown_paths=tuple(child_markdown_paths),
+            child_html_paths=tuple(child_html_paths),
+            media_downloads=tuple(downloads),
+            media_failures=tuple(failures),
+        )
+
     def _archive_media(
         self,
         target: ArchiveTarget,
@@ -426,19 +692,21 @@ class LocalArchive:
 
 def _unique_article_names(articles: tuple[Article, ...]) -> tuple[str, ...]:
     used: set[str] = set()
-    names: list[str] = []
-    for article in articles:
-        base = safe_filename(article.title)
-        name = base
-        if name.casefold() in used:
-            name = safe_filename(f"{article.title}--article-{article.id}")
-        counter = 2
-        while name.casefold() in used:
-            name = safe_filename(f"{article.title}--article-{article.id}-{counter}")
-            counter += 1
-        used.add(name.casefold())
-        names.append(name)
-    return tuple(names)
+    return tuple(_unique_article_name(article, used) for article in articles)
+
+
+def _unique_article_name(article: Article, used: set[str]) -> str:
+    """Name one child file, avoiding (and then recording) the names in ``used``."""
+
+    name = safe_filename(article.title)
+    if name.casefold() in used:
+        name = safe_filename(f"{article.title}--article-{article.id}")
+    counter = 2
+    while name.casefold() in used:
+        name = safe_filename(f"{article.title}--article-{article.id}-{counter}")
+        counter += 1
+    used.add(name.casefold())
+    return name
 
 
 def _article_navigation(
@@ -519,6 +787,37 @@ def _directory_belongs_to(
     return False
 
 
+@contextmanager
+def _spool(path: Path) -> Iterator[TextIO]:
+    """A scratch text file that is removed however the block ends."""
+
+    try:
+        with path.open("w", encoding="utf-8", newline="\n") as spool:
+            yield spool
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def _atomic_write_spooled(path: Path, head: str, spool: Path, tail: str) -> None:
+    """Atomically write ``head``, the spooled text and ``tail`` as one file."""
+
+    temporary = path.with_name(f".{path.name}.tmp")
+    try:
+        with temporary.open("w", encoding="utf-8", newline="\n") as output:
+            output.write(head)
+            with spool.open(encoding="utf-8", newline="") as spooled:
+                shutil.copyfileobj(spooled, output)
+            output.write(tail)
+            output.flush()
+            os.fsync(output.fileno())
+        os.replace(temporary, path)
+    except Exception:
+        try:
+            temporary.unlink(missing_ok=True)
+        finally:
+            raise
+
+
 def _atomic_write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     temporary = path.with_name(f".{path.name}.tmp")
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import re
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Protocol, Self, cast
+from typing import Any, Protocol, Self, TypeVar, cast
 from urllib.parse import unquote, urlparse
 
 from .platform import RuntimePlatform
 
+_T = TypeVar("_T")
+
 
 class BrowserFallbackError(RuntimeError):
     """Base error for the optional browser fallback."""
@@ -36,6 +42,36 @@ class BrowserCloseError(BrowserFallbackError):
     """Raised when browser resources could not be closed cleanly."""
 
 
+@dataclass(frozen=True, slots=True)
+class BrowserNavigationStats:
+    """Page loads of one browser fallback and the requests it refused."""
+
+    pages: int
+    seconds: float
+    blocked_requests: int
+
+    @property
+    def mean_seconds(self) -> float | None:
+        return self.seconds / self.pages if self.pages else None
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserCapture:
+    """A page's initial-state document and the API responses it fetched."""
+
+    document: str
+    responses: tuple[tuple[str, object], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserPageResult:
+    """One page of a ``fetch_many_html`` batch: its HTML or why it failed."""
+
+    url: str
+    html: str | None = None
+    error: BrowserFallbackError | None = None
+
+
 class BrowserPage(Protocol):
     def goto(self, url: str, *, wait_until: str, timeout: int) -> object: ...
 
@@ -43,6 +79,12 @@ class BrowserPage(Protocol):
 
     def content(self) -> str: ...
 
+    def evaluate(self, expression: str) -> object: ...
+
+    def on(self, event: str, handler: Callable[[Any], object]) -> object: ...
+
+    def wait_for_timeout(self, timeout: float) -> object: ...
+
     def close(self) -> object: ...
 
 
@@ -57,6 +99,8 @@ class BrowserContext(Protocol):
 
     def clear_cookies(self, *, name: str | None = None) -> object: ...
 
+    def route(self, url: str, handler: Callable[[Any], object]) -> object: ...
+
     def close(self) -> object: ...
 
 
@@ -161,7 +205,13 @@ class _PlaywrightExecutor:
 
 
 class BrowserFallback:
-    """Reuse a persistent profile or an already-running local Chrome session."""
+    """Reuse a persistent profile or an already-running local Chrome session.
+
+    With ``block_resources`` the app-managed profile aborts image, media,
+    font, and analytics requests, because the fallback only reads the
+    page's initial state from its HTML. An external CDP session belongs to
+    the user and is never filtered.
+    """
 
     def __init__(
         self,
@@ -171,12 +221,17 @@ class BrowserFallback:
         headless: bool = False,
         proxy: str | None = None,
         timeout_ms: int = 30_000,
+        max_pages: int = 4,
+        block_resources: bool = False,
         runtime_platform: RuntimePlatform | None = None,
         executor: BrowserExecutor | None = None,
         sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         if timeout_ms <= 0:
             raise ValueError("timeout_ms must be positive")
+        if max_pages <= 0:
+            raise ValueError("max_pages must be positive")
         if cdp_url is not None:
             _validate_cdp_url(cdp_url)
         runtime = runtime_platform or RuntimePlatform.detect()
@@ -187,26 +242,100 @@ class BrowserFallback:
         self.headless = headless
         self.proxy = proxy
         self.timeout_ms = timeout_ms
+        self.max_pages = max_pages
+        self.block_resources = block_resources
         self._runtime = runtime
         self._executor: BrowserExecutor = executor or _PlaywrightExecutor()
         self._sleep = sleep
+        self._clock = clock
+        self._pages = 0
+        self._navigation_seconds = 0.0
+        self._blocked_requests = 0
         self._context: BrowserContext | None = None
         self._closed = False
 
     def fetch_html(self, url: str) -> str:
+        return self._fetch(url, self._stable_content)
+
+    def fetch_initial_state(self, url: str) -> str:
+        """Load a page and return only its initial state as a small document.
+
+        The state is read in the page as JSON text and wrapped in a lone
+        ``js-initialData`` script, which the page extractors decode without
+        parsing any surrounding markup. A page without a recognizable state
+        yields its full HTML instead, as ``fetch_html`` would.
+        """
+
+        return self._fetch(url, self._initial_state_content)
+
+    def capture_api_responses(
+        self,
+        url: str,
+        api_path: str,
+        *,
+        max_scrolls: int = 30,
+    ) -> BrowserCapture:
+        """Scroll a page and keep the JSON of its own API calls to ``api_path``.
+
+        ``api_path`` is a regular expression matched against the path of
+        each response Zhihu's page script fetches. Scrolling stops once a
+        captured page reports ``paging.is_end``, after three scrolls without
+        a new response, or after ``max_scrolls``. Responses whose body is not
+        JSON are skipped.
+        """
+
+        pattern = re.compile(api_path)
+        matched: deque[Any] = deque()
+
+        def keep_matching(response: Any) -> None:
+            if pattern.search(urlparse(response.url).path):
+                matched.append(response)
+
+        def load(page: BrowserPage) -> BrowserCapture:
+            document = self._initial_state_content(page)
+            captured: list[tuple[str, object]] = []
+            idle_scrolls = 0
+            for _ in range(max_scrolls + 1):
+                fresh = _read_json_responses(matched)
+                captured.extend(fresh)
+                if any(_is_last_page(payload) for _url, payload in fresh):
+                    break
+                idle_scrolls = 0 if fresh else idle_scrolls + 1
+                if idle_scrolls > 3:
+                    break
+                page.evaluate(_SCROLL_SCRIPT)
+                page.wait_for_timeout(_SCROLL_PAUSE_MS)
+            return BrowserCapture(document, tuple(captured))
+
+        return self._fetch(
+            url,
+            load,
+            before_navigation=lambda page: page.on("response", keep_matching),
+        )
+
+    def _fetch(
+        self,
+        url: str,
+        read: Callable[[BrowserPage], _T],
+        *,
+        before_navigation: Callable[[BrowserPage], object] | None = None,
+    ) -> _T:
         _validate_zhihu_url(url)
         page: BrowserPage | None = None
         try:
-            context = self._ensure_context()
-            self._clear_managed_challenge_cookies(context)
-            page = context.new_page()
+            started = self._clock()
+            page = self._new_page()
+            if before_navigation is not None:
+                before_navigation(page)
             page.goto(
                 url,
                 wait_until="domcontentloaded",
                 timeout=self.timeout_ms,
             )
             page.wait_for_load_state("domcontentloaded", timeout=self.timeout_ms)
-            return self._stable_content(page)
+            result = read(page)
+            self._record_navigation(started)
+            return result
         except BrowserFallbackError:
             raise
         except Exception:
@@ -214,13 +343,94 @@ class BrowserFallback:
                 "The browser could not load the requested Zhihu page."
             ) from None
         finally:
-            if page is not None:
-                try:
-                    page.close()
-                except Exception:
-                    # Per-page cleanup is best effort; closing the persistent
-                    # context remains available through ``close``.
-                    pass
+            _close_page(page)
+
+    def fetch_many_html(
+        self,
+        urls: Iterable[str],
+        *,
+        initial_state: bool = False,
+    ) -> Iterator[BrowserPageResult]:
+        """Load several Zhihu pages over at most ``max_pages`` open tabs.
+
+        Each navigation returns as soon as Zhihu commits the response, so the
+        other tabs keep loading while one page is read. Results are yielded
+        as tabs complete, so a fast page is not held behind a slow one that
+        was started earlier; each result carries its URL for callers that
+        need the input order back. When no tab has finished loading yet the
+        oldest one is waited for. A page that fails is reported in its result
+        and does not stop the batch. Challenge cookies are cleared once per batch.
+        With ``initial_state`` each result holds what ``fetch_initial_state``
+        would return instead of the full HTML.
+        """
+
+        read = self._initial_state_content if initial_state else self._stable_content
+
+        waiting = deque(urls)
+        for url in waiting:
+            _validate_zhihu_url(url)
+        if not waiting:
+            return
+        context = self._ensure_context()
+        self._clear_managed_challenge_cookies(context)
+        loading: deque[tuple[str, BrowserPage | None, float]] = deque()
+        try:
+            while waiting or loading:
+                while waiting and len(loading) < self.max_pages:
+                    url = waiting.popleft()
+                    started = self._clock()
+                    loading.append((url, self._start_navigation(context, url), started))
+                ready = next((entry for entry in loading if _page_loaded(entry[1])), loading[0])
+                loading.remove(ready)
+                yield self._finish_navigation(*ready, read)
+        finally:
+            for _url, page, _started in loading:
+                _close_page(page)
+
+    def _start_navigation(self, context: BrowserContext, url: str) -> BrowserPage | None:
+        page: BrowserPage | None = None
+        try:
+            page = context.new_page()
+            page.goto(url, wait_until="commit", timeout=self.timeout_ms)
+            return page
+        except Exception:
+            _close_page(page)
+            return None
+
+    def _finish_navigation(
+        self,
+        url: str,
+        page: BrowserPage | None,
+        started: float,
+        read: Callable[[BrowserPage], str],
+    ) -> BrowserPageResult:
+        if page is not None:
+            try:
+                page.wait_for_load_state("domcontentloaded", timeout=self.timeout_ms)
+                html = read(page)
+                self._record_navigation(started)
+                return BrowserPageResult(url, html=html)
+            except Exception:
+                pass
+            finally:
+                _close_page(page)
+        return BrowserPageResult(
+            url,
+            error=BrowserNavigationError("The browser could not load the requested Zhihu page."),
+        )
+
+    def navigation_stats(self) -> BrowserNavigationStats:
+        """Report loaded pages, their total load time, and blocked requests."""
+
+        return BrowserNavigationStats(
+            pages=self._pages,
+            seconds=self._navigation_seconds,
+            blocked_requests=self._blocked_requests,
+        )
+
+    def _record_navigation(self, started: float) -> None:
+        self._pages += 1
+        self._navigation_seconds += self._clock() - started
 
     def _clear_managed_challenge_cookies(self, context: BrowserContext) -> None:
         """Repair only the app-owned profile after an earlier blocked request.
@@ -289,6 +499,11 @@ class BrowserFallback:
                 "The Zhihu cookies could not be imported into the browser session."
             ) from None
 
+    def warm_up(self) -> None:
+        """Start or connect the browser context before the first page is needed."""
+
+        self._ensure_context()
+
     def _ensure_context(self) -> BrowserContext:
         if self._closed:
             raise BrowserFallbackError("Browser fallback is closed.")
@@ -330,14 +545,65 @@ class BrowserFallback:
         self._prepare_context(self._context)
         return self._context
 
+    def _new_page(self) -> BrowserPage:
+        """Open a tab, starting a new context once when the cached one is dead."""
+
+        for attempt in range(2):
+            context = self._ensure_context()
+            self._clear_managed_challenge_cookies(context)
+            try:
+                return context.new_page()
+            except Exception:
+                if attempt == 1:
+                    raise
+                self._discard_context()
+        raise AssertionError("new page retry loop must return or raise")
+
+    def _discard_context(self) -> None:
+        context, self._context = self._context, None
+        if context is not None and self.cdp_url is None:
+            try:
+                context.close()
+            except Exception:
+                # The context is already dead; a new one replaces it.
+                pass
+
+    def _forget_context(self, context: BrowserContext) -> None:
+        if self._context is context:
+            self._context = None
+
     def _prepare_context(self, context: BrowserContext) -> None:
         try:
             context.add_init_script(_BROWSER_INIT_SCRIPT)
+            if self.block_resources and self.cdp_url is None:
+                context.route("**/*", self._route_request)
+            # A context closed by the user or a crash is started again on
+            # the next call instead of failing every later navigation.
+            on = getattr(context, "on", None)
+            if callable(on):
+                on("close", lambda _closed: self._forget_context(context))
         except Exception:
             raise BrowserLaunchError(
                 "The browser context could not be prepared for Zhihu navigation."
             ) from None
 
+    def _route_request(self, route: Any) -> None:
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or _is_tracker(request.url):
+            self._blocked_requests += 1
+            route.abort()
+        else:
+            route.continue_()
+
+    def _initial_state_content(self, page: BrowserPage) -> str:
+        try:
+            state = page.evaluate(_INITIAL_STATE_SCRIPT)
+        except Exception:
+            state = None
+        if isinstance(state, str) and state.lstrip().startswith("{"):
+            return f'<script id="js-initialData" type="text/json">{state}</script>'
+        return self._stable_content(page)
+
     def _stable_content(self, page: BrowserPage) -> str:
         for attempt in range(5):
             try:
@@ -390,6 +656,171 @@ class BrowserFallback:
                 raise
 
 
+_SCROLL_SCRIPT = "() => window.scrollTo(0, document.body.scrollHeight)"
+
+# Time for Zhihu's page script to request and receive the next page.
+_SCROLL_PAUSE_MS = 800
+
+
+class BackgroundBrowser:
+    """Run one ``BrowserFallback`` on a dedicated thread so it can warm up early.
+
+    Playwright's synchronous objects belong to the thread that created them,
+    so every call is forwarded to the browser's own thread and awaited there.
+    ``warm_up`` returns at once while the context starts in the background;
+    the first real call simply waits for it. Closing a browser that was
+    never warmed or used starts nothing.
+    """
+
+    def __init__(self, browser: BrowserFallback) -> None:
+        self._browser = browser
+        self._thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zhihu-browser")
+        self._closed = False
+
+    @property
+    def max_pages(self) -> int:
+        return self._browser.max_pages
+
+    def warm_up(self) -> None:
+        self._thread.submit(self._warm_up)
+
+    def fetch_html(self, url: str) -> str:
+        return self._call(self._browser.fetch_html, url)
+
+    def fetch_initial_state(self, url: str) -> str:
+        return self._call(self._browser.fetch_initial_state, url)
+
+    def fetch_many_html(
+        self,
+        urls: Iterable[str],
+        *,
+        initial_state: bool = False,
+    ) -> Iterator[BrowserPageResult]:
+        pages = tuple(urls)
+        return iter(
+            self._call(
+                lambda: list(self._browser.fetch_many_html(pages, initial_state=initial_state))
+            )
+        )
+
+    def capture_api_responses(
+        self,
+        url: str,
+        api_path: str,
+        *,
+        max_scrolls: int = 30,
+    ) -> BrowserCapture:
+        return self._call(
+            lambda: self._browser.capture_api_responses(url, api_path, max_scrolls=max_scrolls)
+        )
+
+    def cookie_dict(self) -> dict[str, str]:
+        return self._call(self._browser.cookie_dict)
+
+    def set_cookie_dict(self, cookies: dict[str, str]) -> None:
+        self._call(self._browser.set_cookie_dict, cookies)
+
+    def navigation_stats(self) -> BrowserNavigationStats:
+        return self._browser.navigation_stats()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._thread.submit(self._browser.close).result()
+        finally:
+            self._thread.shutdown(wait=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            self.close()
+        except BrowserCloseError:
+            if exc_value is None:
+                raise
+
+    def _warm_up(self) -> None:
+        try:
+            self._browser.warm_up()
+        except BrowserFallbackError:
+            # The first real call starts the context again and reports why.
+            pass
+
+    def _call(self, function: Callable[..., _T], *args: Any) -> _T:
+        if self._closed:
+            raise BrowserFallbackError("Browser fallback is closed.")
+        return self._thread.submit(function, *args).result()
+
+
+def _read_json_responses(matched: deque[Any]) -> list[tuple[str, object]]:
+    payloads: list[tuple[str, object]] = []
+    while matched:
+        response = matched.popleft()
+        try:
+            payloads.append((response.url, response.json()))
+        except Exception:
+            # Redirects, aborted requests, and non-JSON bodies carry no page.
+            continue
+    return payloads
+
+
+def _is_last_page(payload: object) -> bool:
+    if not isinstance(payload, dict):
+        return False
+    paging = payload.get("paging")
+    return isinstance(paging, dict) and paging.get("is_end") is True
+
+
+def _page_loaded(page: BrowserPage | None) -> bool:
+    """Whether a started tab can be read without waiting on it.
+
+    A tab whose navigation already failed is reported straight away.
+    """
+
+    if page is None:
+        return True
+    try:
+        return page.evaluate("document.readyState") in ("interactive", "complete")
+    except Exception:
+        # Readiness is only a hint; the tab is waited for in start order.
+        return False
+
+
+def _close_page(page: BrowserPage | None) -> None:
+    if page is None:
+        return
+    try:
+        page.close()
+    except Exception:
+        # Per-page cleanup is best effort; closing the persistent context
+        # remains available through ``close``.
+        pass
+
+
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+_TRACKER_HOSTS = (
+    "zhihu-web-analytics.zhihu.com",
+    "datahub.zhihu.com",
+    "hm.baidu.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+)
+
+
+def _is_tracker(url: str) -> bool:
+    hostname = (urlparse(url).hostname or "").casefold()
+    return any(hostname == host or hostname.endswith(f".{host}") for host in _TRACKER_HOSTS)
+
+
 def _validate_zhihu_url(url: str) -> None:
     parsed = urlparse(url)
     hostname = (parsed.hostname or "").casefold()
@@ -417,6 +848,22 @@ _BROWSER_INIT_SCRIPT = """\
 """
 
 
+# Zhihu keeps the state as JSON text in ``js-initialData``; older pages assign
+# it to ``window.__INITIAL_STATE__`` instead.
+_INITIAL_STATE_SCRIPT = """\
+() => {
+  const script = document.getElementById("js-initialData");
+  if (script && script.textContent) {
+    return script.textContent;
+  }
+  if (window.__INITIAL_STATE__) {
+    return JSON.stringify(window.__INITIAL_STATE__);
+  }
+  return null;
+}
+"""
+
+
 def _validate_cdp_url(url: str) -> None:
     """Keep the authenticated browser-control channel on this machine."""
 
@@ -0,0 +1,213 @@
+"""Persistent Zhihu response cache with conditional revalidation."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS responses_accessed_at
+ON responses(accessed_at);
+"""
+
+
+# Cache hits whose recency is written in one statement.
+_TOUCH_BATCH = 64
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """One stored response body and the validators needed to revalidate it."""
+
+    body: str
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    revalidated: int
+    misses: int
+
+
+class ResponseCache:
+    """Size-bounded, least-recently-used response store in one SQLite file.
+
+    Entries are keyed by a digest of the URL, the response kind, and an opaque
+    session identity; Cookie values are never written. Entries younger than
+    ``ttl`` are served without a request. Older entries stay available for
+    ``If-None-Match``/``If-Modified-Since`` revalidation until evicted.
+
+    A hit only reads the file. Its recency is kept in memory and written
+    together with the next stored response, or once ``_TOUCH_BATCH`` hits
+    have accumulated, so serving from the cache never waits for a commit.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl: float = 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl < 0:
+            raise ValueError("ttl must not be negative")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.path = Path(path)
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self._initialized = False
+        self._touched: dict[str, float] = {}
+
+    def lookup(self, identity: str, kind: str, url: str) -> CachedResponse | None:
+        """Return a stored response, fresh or stale, and mark it recently used.
+
+        Fresh entries count as hits; stale ones are only counted once the
+        caller reports the revalidation outcome via ``refresh`` or ``store``.
+        """
+
+        cache_key = _cache_key(identity, kind, url)
+        with self._lock, closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            entry = CachedResponse(
+                body=row[0],
+                etag=row[1],
+                last_modified=row[2],
+                stored_at=row[3],
+            )
+            if not self.is_fresh(entry) and entry.etag is None and entry.last_modified is None:
+                # Without validators an expired entry can never be reused.
+                connection.execute("DELETE FROM responses WHERE cache_key = ?", (cache_key,))
+                connection.commit()
+                return None
+            self._touched[cache_key] = self._clock()
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touches(connection)
+                connection.commit()
+            if self.is_fresh(entry):
+                self._hits += 1
+            return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return self._clock() - entry.stored_at < self._ttl
+
+    def store(
+        self,
+        identity: str,
+        kind: str,
+        url: str,
+        *,
+        body: str,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        size = len(body.encode("utf-8"))
+        now = self._clock()
+        with self._lock, closing(self._connect()) as connection:
+            self._misses += 1
+            if size > self._max_bytes:
+                return
+            connection.execute(
+                """
+                INSERT INTO responses (
+                    cache_key, body, etag, last_modified, stored_at, accessed_at, size
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    body = excluded.body,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at,
+                    size = excluded.size
+                """,
+                (_cache_key(identity, kind, url), body, etag, last_modified, now, now, size),
+            )
+            self._flush_touches(connection)
+            self._evict(connection)
+            connection.commit()
+
+    def refresh(self, identity: str, kind: str, url: str) -> None:
+        """Restart the TTL of an entry the server confirmed with HTTP 304."""
+
+        now = self._clock()
+        with self._lock, closing(self._connect()) as connection:
+            self._revalidated += 1
+            connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE cache_key = ?",
+                (now, now, _cache_key(identity, kind, url)),
+            )
+            connection.commit()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                revalidated=self._revalidated,
+                misses=self._misses,
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10.0)
+        if not self._initialized:
+            connection.executescript(_SCHEMA)
+            self._initialized = True
+        return connection
+
+    def _flush_touches(self, connection: sqlite3.Connection) -> None:
+        touched, self._touched = self._touched, {}
+        connection.executemany(
+            "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE cache_key = ?",
+            [(accessed_at, cache_key) for cache_key, accessed_at in touched.items()],
+        )
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self._max_bytes:
+            return
+        rows = connection.execute(
+            "SELECT cache_key, size FROM responses ORDER BY accessed_at, cache_key"
+        ).fetchall()
+        evicted = []
+        for cache_key, size in rows:
+            if total <= self._max_bytes:
+                break
+            evicted.append((cache_key,))
+            total -= size
+        connection.executemany("DELETE FROM responses WHERE cache_key = ?", evicted)
+
+
+def _cache_key(identity: str, kind: str, url: str) -> str:
+    return hashlib.sha256(f"{identity}\0{kind}\0{url}".encode()).hexdigest()
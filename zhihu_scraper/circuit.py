@@ -0,0 +1,160 @@
+"""Run-scoped retry budget and circuit breakers for Zhihu and its media CDNs."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitReport:
+    """Observable breaker state for one host class at the end of a run."""
+
+    name: str
+    state: CircuitState
+    times_opened: int
+    rejected: int
+    retries_used: int
+    retry_budget: int
+
+    @property
+    def budget_exhausted(self) -> bool:
+        return self.retries_used >= self.retry_budget
+
+
+class RetryBudget:
+    """A fixed number of retries shared by every request in one run."""
+
+    def __init__(self, total: int) -> None:
+        if total < 0:
+            raise ValueError("retry budget must not be negative")
+        self.total = total
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            return self._used
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._used >= self.total:
+                return False
+            self._used += 1
+            return True
+
+    def reset(self) -> None:
+        """Give a new run the full budget again."""
+
+        with self._lock:
+            self._used = 0
+
+
+class CircuitBreaker:
+    """Fail fast after repeated transport or server failures.
+
+    ``failure_threshold`` consecutive failures open the circuit, and every
+    request is refused until ``reset_timeout`` has passed. One probe request
+    is then let through: success closes the circuit, failure reopens it.
+    Retries additionally draw from the shared ``budget``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        budget: RetryBudget,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        self.name = name
+        self._budget = budget
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._rejected = 0
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent now; refusals are counted."""
+
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                if self._clock() - self._opened_at < self._reset_timeout:
+                    self._rejected += 1
+                    return False
+                self._state = CircuitState.HALF_OPEN
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probe_in_flight:
+                    self._rejected += 1
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            probe_failed = self._state is CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+            if probe_failed or (
+                self._state is CircuitState.CLOSED
+                and self._consecutive_failures >= self._failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self._times_opened += 1
+
+    def reset(self) -> None:
+        """Close the circuit and clear the counters and retry budget for a new run."""
+
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = 0.0
+            self._probe_in_flight = False
+            self._times_opened = 0
+            self._rejected = 0
+        self._budget.reset()
+
+    def allow_retry(self) -> bool:
+        """Spend one retry from the run budget unless the circuit is open."""
+
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                return False
+        return self._budget.try_spend()
+
+    def report(self) -> CircuitReport:
+        with self._lock:
+            return CircuitReport(
+                name=self.name,
+                state=self._state,
+                times_opened=self._times_opened,
+                rejected=self._rejected,
+                retries_used=self._budget.used,
+                retry_budget=self._budget.total,
+            )
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import io
+import os
 import sys
 from collections.abc import Sequence
+from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import replace
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from .facade import archive_url, check_session
+from .daemon import ArchiveDaemon, WarmWorkflows, default_socket_path, send_job
 from .settings import (
     ArchiveSettings,
     BrowserFallback,
@@ -16,6 +21,10 @@ from .settings import (
     load_settings,
 )
 
+if TYPE_CHECKING:
+    from .application import ArchiveReport
+    from .facade import AccountSessionReport, SessionReport
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -46,6 +55,17 @@ def build_parser() -> argparse.ArgumentParser:
         help="覆盖浏览器回退策略：auto、never 或 always",
     )
     fetch.add_argument("--cdp", help="连接本机已登录 Chrome 的 CDP 地址")
+    fetch.add_argument(
+        "--restart",
+        action="store_true",
+        help="丢弃上次中断留下的分页进度，从第一页重新抓取",
+    )
+    fetch.add_argument(
+        "--daemon",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="守护进程运行时把任务交给它（默认开启）",
+    )
 
     check = subcommands.add_parser("check", help="检查 Cookie 是否存在且仍可登录")
     _settings_argument(check)
@@ -60,12 +80,21 @@ def build_parser() -> argparse.ArgumentParser:
         help="设置文件路径（默认 ./settings.toml）",
     )
 
+    daemon = subcommands.add_parser("daemon", help="常驻后台，复用会话和浏览器处理 fetch")
+    daemon.add_argument(
+        "--socket",
+        type=Path,
+        help="Unix 套接字路径；默认取 ZHIHU_DAEMON_SOCKET 或用户数据目录",
+    )
+
     return parser
 
 
 def run_cli(argv: Sequence[str] | None = None) -> int:
     _configure_standard_streams()
     parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
     arguments = parser.parse_args(argv)
     try:
         if arguments.command == "init":
@@ -75,28 +104,26 @@ def run_cli(argv: Sequence[str] | None = None) -> int:
             else:
                 print(f"设置文件已存在，未覆盖：{arguments.path}")
             return 0
+        if arguments.command == "daemon":
+            return _serve_daemon(arguments.socket or default_socket_path())
+        if arguments.command == "fetch" and arguments.daemon:
+            forwarded = _forward_to_daemon(argv)
+            if forwarded is not None:
+                return forwarded
 
         settings = load_settings(arguments.settings)
         if arguments.command == "check":
             if arguments.cookie_file is not None:
-                settings = replace(settings, cookie_file=arguments.cookie_file)
+                settings = replace(
+                    settings,
+                    cookie_file=arguments.cookie_file,
+                    cookie_files=(),
+                )
             return _run_check(settings)
 
-        if arguments.output is not None:
-            settings = replace(settings, output_dir=arguments.output)
-        if arguments.comments is not None:
-            settings = replace(settings, comments=arguments.comments)
-        if arguments.media is not None:
-            settings = replace(settings, media_download=arguments.media)
-        if arguments.browser is not None:
-            settings = replace(
-                settings,
-                browser_fallback=BrowserFallback(arguments.browser),
-            )
-        if arguments.cdp is not None:
-            settings = replace(settings, cdp_url=arguments.cdp)
-
-        report = archive_url(arguments.url, settings)
+        report = archive_url(
+            arguments.url, _fetch_settings(arguments, settings), restart=arguments.restart
+        )
         _print_archive_report(report)
         return 0
     except KeyboardInterrupt:
@@ -111,6 +138,20 @@ def main() -> None:
     raise SystemExit(run_cli())
 
 
+def archive_url(url: str, settings: ArchiveSettings, *, restart: bool = False) -> ArchiveReport:
+    """Archive in this process, importing the workflow only when it is needed."""
+
+    from .facade import archive_url as archive
+
+    return archive(url, settings, restart=restart)
+
+
+def check_session(settings: ArchiveSettings) -> SessionReport:
+    from .facade import check_session as check
+
+    return check(settings)
+
+
 def _configure_standard_streams() -> None:
     """Keep Chinese CLI output usable when Windows redirects legacy streams."""
 
@@ -133,8 +174,92 @@ def _settings_argument(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _fetch_settings(arguments: argparse.Namespace, settings: ArchiveSettings) -> ArchiveSettings:
+    if arguments.output is not None:
+        settings = replace(settings, output_dir=arguments.output)
+    if arguments.comments is not None:
+        settings = replace(settings, comments=arguments.comments)
+    if arguments.media is not None:
+        settings = replace(settings, media_download=arguments.media)
+    if arguments.browser is not None:
+        settings = replace(
+            settings,
+            browser_fallback=BrowserFallback(arguments.browser),
+        )
+    if arguments.cdp is not None:
+        settings = replace(settings, cdp_url=arguments.cdp)
+    return settings
+
+
+def _forward_to_daemon(argv: Sequence[str]) -> int | None:
+    """Hand a fetch to a running daemon and replay its output here."""
+
+    reply = send_job(
+        {"argv": list(argv), "cwd": os.getcwd()},
+        socket_path=default_socket_path(),
+    )
+    if reply is None:
+        return None
+    sys.stdout.write(str(reply.get("stdout", "")))
+    sys.stderr.write(str(reply.get("stderr", "")))
+    return int(reply.get("exit_code", 1))
+
+
+def _serve_daemon(socket_path: Path) -> int:
+    from .facade import build_workflow
+
+    workflows = WarmWorkflows(build_workflow)
+    try:
+        with ArchiveDaemon(partial(_run_daemon_job, workflows), socket_path=socket_path) as daemon:
+            print(f"归档守护进程已启动：{socket_path}", flush=True)
+            try:
+                daemon.serve_forever()
+            except KeyboardInterrupt:
+                print("归档守护进程已停止。")
+    finally:
+        workflows.close()
+    return 0
+
+
+def _run_daemon_job(workflows: WarmWorkflows, job: dict[str, Any]) -> dict[str, Any]:
+    """Run one forwarded fetch in the client's working directory.
+
+    Relative settings and output paths keep their meaning because the job
+    runs from the directory the client was started in; jobs are serial, so
+    changing the daemon's directory for the duration is safe.
+    """
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 1
+    previous_directory = os.getcwd()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            directory = str(job["cwd"])
+            os.chdir(directory)
+            arguments = build_parser().parse_args([str(part) for part in job["argv"]])
+            if arguments.command != "fetch":
+                raise ValueError("守护进程只处理 fetch 任务。")
+            settings = _fetch_settings(arguments, load_settings(arguments.settings))
+            report = workflows.get(settings, directory=directory).run(
+                arguments.url, restart=arguments.restart
+            )
+            _print_archive_report(report)
+            exit_code = 0
+        except SystemExit as stopped:
+            exit_code = stopped.code if isinstance(stopped.code, int) else 2
+        except Exception as error:
+            print(f"错误：{error}", file=sys.stderr)
+        finally:
+            os.chdir(previous_directory)
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
 def _run_check(settings: ArchiveSettings) -> int:
     report = check_session(settings)
+    accounts = getattr(report, "accounts", ())
+    if accounts:
+        return _print_account_reports(accounts)
     missing = report.cookie_diagnostic.missing
     if missing:
         print(f"Cookie 字段缺少：{', '.join(missing)}")
@@ -150,6 +275,23 @@ def _run_check(settings: ArchiveSettings) -> int:
     return 1
 
 
+def _print_account_reports(accounts: Sequence[AccountSessionReport]) -> int:
+    healthy = 0
+    for account in accounts:
+        missing = account.cookie_diagnostic.missing
+        fields = f"缺少 {', '.join(missing)}" if missing else "字段齐全"
+        if account.login_status is None:
+            status = "Cookie 文件为空，未请求登录状态"
+        elif account.login_status.authenticated:
+            healthy += 1
+            status = "登录状态有效"
+        else:
+            status = "登录状态无效或已过期"
+        print(f"账号 {account.name}：Cookie {fields}，{status}。")
+    print(f"{healthy}/{len(accounts)} 个账号可用。")
+    return 0 if healthy == len(accounts) else 1
+
+
 def _print_archive_report(report: object) -> None:
     target = getattr(report, "target")
     receipt = getattr(report, "receipt")
@@ -163,14 +305,58 @@ def _print_archive_report(report: object) -> None:
         print(f"SQLite：{receipt.database_path}")
     if getattr(report, "used_browser", False):
         print("抓取路径：浏览器回退")
+        pages = getattr(report, "browser_pages", 0)
+        launches = getattr(report, "browser_launches", 0)
+        print(f"浏览器回退：加载 {pages} 个页面，本次启动浏览器 {launches} 次。")
     else:
         print("抓取路径：HTTP/API")
+    navigation = getattr(report, "browser_navigation", None)
+    if navigation is not None:
+        print(
+            f"浏览器页面：加载 {navigation.pages} 个，平均 {navigation.mean_seconds:.2f} 秒，"
+            f"拦截 {navigation.blocked_requests} 个资源请求。"
+        )
+    warm_browser_used = getattr(report, "warm_browser_used", None)
+    if warm_browser_used is not None:
+        print(
+            "浏览器预热：回退使用了预先启动的浏览器。"
+            if warm_browser_used
+            else "浏览器预热：本次没有用到预先启动的浏览器。"
+        )
     media_failures = getattr(report, "media_failures", ())
     if media_failures:
         print(f"媒体警告：{len(media_failures)} 个非必要媒体下载失败，正文归档已保留。")
         for failure in media_failures:
             message = getattr(failure, "display_message", "媒体下载失败，已保留远程链接。")
             print(f"- {message}")
+    for circuit in getattr(report, "circuits", ()):
+        if circuit.times_opened:
+            print(
+                f"熔断警告：{circuit.name} 请求因连续失败暂停过 {circuit.times_opened} 次，"
+                f"{circuit.rejected} 个请求被直接跳过。"
+            )
+    if any(circuit.budget_exhausted for circuit in getattr(report, "circuits", ())):
+        print("重试预算已用完：后续失败的请求未再重试，可调大 network.retry_budget。")
+    for proxy in getattr(report, "proxies", ()):
+        latency = "无" if proxy.mean_latency is None else f"{proxy.mean_latency:.2f} 秒"
+        print(
+            f"代理 {proxy.label}：请求 {proxy.requests} 次，失败 {proxy.failures} 次，"
+            f"平均延迟 {latency}" + ("，当前已暂停" if proxy.ejected else "")
+        )
+    coalescing = getattr(report, "coalescing", None)
+    if coalescing is not None and (coalescing.hits or coalescing.coalesced):
+        print(
+            f"请求合并：复用最近结果 {coalescing.hits} 次，合并同时请求 {coalescing.coalesced} 次，"
+            f"实际请求 {coalescing.misses} 次。"
+        )
+    for account in getattr(report, "accounts", ()):
+        state = (
+            "，冷却中" if account.benched else ("，已用完配额" if account.quota_exhausted else "")
+        )
+        print(
+            f"账号 {account.name}：请求 {account.requests} 次，"
+            f"被拒绝 {account.rejections} 次{state}"
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,194 @@
+"""Merge identical in-flight Zhihu API calls and memoize them briefly."""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Protocol, cast
+from urllib.parse import urljoin
+
+from .http import LoginStatus, TransportError
+
+# Login checks share the flight table under a key no URL can produce.
+_LOGIN_KEY = "check_login"
+
+
+class _CoalescedClient(Protocol):
+    def get_json(self, url_or_path: str) -> object: ...
+
+    def get_html(self, url_or_path: str) -> str: ...
+
+    def check_login(self) -> LoginStatus: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class CoalescingStats:
+    hits: int
+    coalesced: int
+    misses: int
+
+
+class CoalescingZhihuClient:
+    """Singleflight and short-lived memo in front of a Zhihu HTTP client.
+
+    Concurrent ``get_json`` calls for the same URL share one request, and
+    successful JSON results are reused for ``memo_ttl`` seconds. Failures are
+    never memoized, so a later call retries through the wrapped client. Every
+    caller receives its own copy of a shared result, so one caller's edits
+    never reach another or the memo. The wrapper keeps the wrapped client's blocking contract. Only when that
+    client offers ``submit_json`` does the wrapper offer it too, starting the
+    shared request without waiting; callers that check for ``submit_json``
+    otherwise keep their sequential path.
+    """
+
+    def __init__(
+        self,
+        client: _CoalescedClient,
+        *,
+        memo_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if memo_ttl < 0:
+            raise ValueError("memo_ttl must not be negative")
+        self._client = client
+        self._memo_ttl = memo_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, list[Future[object]]] = {}
+        self._memo: dict[str, tuple[float, object]] = {}
+        self._hits = 0
+        self._coalesced = 0
+        self._misses = 0
+
+    def __getattr__(self, name: str) -> Callable[[str], Future[object]]:
+        client = self.__dict__.get("_client")
+        if name == "submit_json" and callable(getattr(client, "submit_json", None)):
+            return self._submit_json
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def get_json(self, url_or_path: str) -> object:
+        return self._submit_json(url_or_path).result()
+
+    def get_html(self, url_or_path: str) -> str:
+        return self._client.get_html(url_or_path)
+
+    def check_login(self) -> LoginStatus:
+        def start() -> Future[object]:
+            return _run_now(self._client.check_login)
+
+        return cast(LoginStatus, self._join(_LOGIN_KEY, start).result())
+
+    def update_cookies(self, cookies: Mapping[str, str]) -> None:
+        """Forward new Cookie values and drop results fetched with the old ones."""
+
+        update = getattr(self._client, "update_cookies", None)
+        if callable(update):
+            update(cookies)
+        with self._lock:
+            self._memo.clear()
+
+    def stats(self) -> CoalescingStats:
+        with self._lock:
+            return CoalescingStats(
+                hits=self._hits,
+                coalesced=self._coalesced,
+                misses=self._misses,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._coalesced = 0
+            self._misses = 0
+
+    def close(self) -> None:
+        self._client.close()
+
+    def _submit_json(self, url_or_path: str) -> Future[object]:
+        """Start or join one JSON request without waiting for its response."""
+
+        url = urljoin("https://www.zhihu.com/", url_or_path)
+        return self._join(url, lambda: self._start_json(url))
+
+    def _join(self, key: str, start: Callable[[], Future[object]]) -> Future[object]:
+        waiter: Future[object] = Future()
+        # Shared results must reach every caller, so waiters cannot be
+        # cancelled once they are handed out.
+        waiter.set_running_or_notify_cancel()
+        with self._lock:
+            memoized = self._memo.get(key)
+            if memoized is not None and self._clock() < memoized[0]:
+                self._hits += 1
+                waiter.set_result(copy.deepcopy(memoized[1]))
+                return waiter
+            waiters = self._in_flight.get(key)
+            if waiters is not None:
+                self._coalesced += 1
+                waiters.append(waiter)
+                return waiter
+            self._misses += 1
+            self._in_flight[key] = [waiter]
+        try:
+            request = start()
+        except BaseException as error:
+            self._land(key, error=error)
+            raise
+        request.add_done_callback(lambda done: self._finish(key, done))
+        return waiter
+
+    def _start_json(self, url: str) -> Future[object]:
+        submit = getattr(self._client, "submit_json", None)
+        if callable(submit):
+            return cast(Future[object], submit(url))
+        return _run_now(lambda: self._client.get_json(url))
+
+    def _finish(self, key: str, request: Future[object]) -> None:
+        if request.cancelled():
+            self._land(key, error=TransportError("Zhihu request was cancelled."))
+            return
+        error = request.exception()
+        if error is not None:
+            self._land(key, error=error)
+            return
+        self._land(key, result=request.result())
+
+    def _land(
+        self,
+        key: str,
+        *,
+        result: object = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            waiters = self._in_flight.pop(key, [])
+            now = self._clock()
+            # Entries share one TTL, so insertion order is expiry order.
+            while self._memo:
+                oldest = next(iter(self._memo))
+                if self._memo[oldest][0] > now:
+                    break
+                del self._memo[oldest]
+            if error is None and self._memo_ttl > 0:
+                self._memo.pop(key, None)
+                self._memo[key] = (now + self._memo_ttl, result)
+        for waiter in waiters:
+            if error is None:
+                waiter.set_result(copy.deepcopy(result))
+            else:
+                waiter.set_exception(error)
+
+
+def _run_now(call: Callable[[], object]) -> Future[object]:
+    future: Future[object] = Future()
+    future.set_running_or_notify_cancel()
+    try:
+        future.set_result(call())
+    except BaseException as error:
+        future.set_exception(error)
+    return future
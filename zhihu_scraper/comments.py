@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from concurrent.futures import Future
 from datetime import UTC, datetime
 from typing import Protocol
 
@@ -25,8 +26,15 @@ def fetch_comment_thread(
     target_id: str,
     root_limit: int = 10,
     reply_limit: int = 10,
+    comment_count: int | None = None,
 ) -> CommentThread:
-    """Fetch a bounded thread in the order returned by Zhihu's API."""
+    """Fetch a bounded thread in the order returned by Zhihu's API.
+
+    A ``comment_count`` of zero, as reported by the answer or article
+    payload, yields an empty complete thread without any request. With a
+    client exposing ``submit_json`` the first reply page of every root
+    comment is requested at once instead of one root after another.
+    """
 
     for name, value in (("root_limit", root_limit), ("reply_limit", reply_limit)):
         if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
@@ -41,6 +49,14 @@ def fetch_comment_thread(
         collection = collections[target_kind]
     except KeyError:
         raise ValueError("target_kind must be article, answer, or zvideo.") from None
+    if comment_count == 0:
+        return CommentThread(
+            comments=(),
+            order="api_returned",
+            roots_complete=True,
+            root_limit=root_limit,
+            reply_limit=reply_limit,
+        )
     root_url = (
         f"/api/v4/comment_v5/{collection}/{target_id}/root_comment?limit={root_limit}&offset="
     )
@@ -49,34 +65,46 @@ def fetch_comment_thread(
         first_url=root_url,
         limit=root_limit,
     )
+    parsed_roots = [(item, _normalize_comment(item)) for item in root_items]
+    reply_urls = [
+        None
+        if isinstance(item, Mapping) and item.get("child_comment_count") == 0
+        else f"/api/v4/comment_v5/comment/{root.id}/child_comment?limit={reply_limit}&offset="
+        for item, root in parsed_roots
+    ]
+    submit = getattr(client, "submit_json", None)
+    first_pages: dict[str, Future[object]] = (
+        {url: submit(url) for url in reply_urls if url is not None} if callable(submit) else {}
+    )
     roots: list[Comment] = []
-    for item in root_items:
-        root = _normalize_comment(item)
-        replies: tuple[Comment, ...]
-        if isinstance(item, Mapping) and item.get("child_comment_count") == 0:
-            replies = ()
-            replies_complete = True
-        else:
-            reply_url = (
-                f"/api/v4/comment_v5/comment/{root.id}/child_comment?limit={reply_limit}&offset="
-            )
-            reply_items, replies_complete = _fetch_bounded_pages(
-                client,
-                first_url=reply_url,
-                limit=reply_limit,
-            )
-            replies = tuple(_normalize_comment(reply) for reply in reply_items)
-        roots.append(
-            Comment(
-                id=root.id,
-                author=root.author,
-                blocks=root.blocks,
-                created_at=root.created_at,
-                like_count=root.like_count,
-                replies=replies,
-                replies_complete=replies_complete,
+    try:
+        for (_, root), reply_url in zip(parsed_roots, reply_urls, strict=True):
+            replies: tuple[Comment, ...]
+            if reply_url is None:
+                replies = ()
+                replies_complete = True
+            else:
+                reply_items, replies_complete = _fetch_bounded_pages(
+                    client,
+                    first_url=reply_url,
+                    limit=reply_limit,
+                    first_page=first_pages.pop(reply_url, None),
+                )
+                replies = tuple(_normalize_comment(reply) for reply in reply_items)
+            roots.append(
+                Comment(
+                    id=root.id,
+                    author=root.author,
+                    blocks=root.blocks,
+                    created_at=root.created_at,
+                    like_count=root.like_count,
+                    replies=replies,
+                    replies_complete=replies_complete,
+                )
             )
-        )
+    finally:
+        for future in first_pages.values():
+            future.cancel()
     return CommentThread(
         comments=tuple(roots),
         order="api_returned",
@@ -91,6 +119,7 @@ def _fetch_bounded_pages(
     *,
     first_url: str,
     limit: int,
+    first_page: Future[object] | None = None,
 ) -> tuple[list[object], bool]:
     items: list[object] = []
     next_url = first_url
@@ -99,7 +128,11 @@ def _fetch_bounded_pages(
         if next_url in visited:
             raise InvalidCommentPayloadError("Zhihu comment paging contains a loop.")
         visited.add(next_url)
-        data, is_end, following_url = _page(client.get_json(next_url))
+        if first_page is not None:
+            payload, first_page = first_page.result(), None
+        else:
+            payload = client.get_json(next_url)
+        data, is_end, following_url = _page(payload)
         remaining = limit - len(items)
         items.extend(data[:remaining])
         if len(data) > remaining:
@@ -0,0 +1,218 @@
+"""Keep warm archive workflows alive behind a local Unix domain socket."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from .platform import RuntimePlatform
+
+if TYPE_CHECKING:
+    from .application import ArchiveWorkflow
+    from .settings import ArchiveSettings
+
+SOCKET_ENVIRONMENT_VARIABLE = "ZHIHU_DAEMON_SOCKET"
+
+_SOCKET_NAME = "daemon.sock"
+_CONNECT_TIMEOUT = 1.0
+
+
+class DaemonError(RuntimeError):
+    """A daemon problem that can be shown directly to a Chinese-speaking user."""
+
+
+def daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> Path:
+    """Socket shared by ``zhihu daemon`` and ``zhihu fetch`` unless overridden."""
+
+    configured = os.environ.get(SOCKET_ENVIRONMENT_VARIABLE)
+    if configured:
+        return Path(configured).expanduser()
+    return Path(RuntimePlatform.detect().user_data_directory) / _SOCKET_NAME
+
+
+def send_job(job: Mapping[str, Any], *, socket_path: Path) -> dict[str, Any] | None:
+    """Run one job on a listening daemon, or return ``None`` when none listens."""
+
+    if not daemon_supported() or not socket_path.exists():
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.settimeout(_CONNECT_TIMEOUT)
+        try:
+            connection.connect(str(socket_path))
+        except OSError:
+            return None
+        connection.settimeout(None)
+        connection.sendall(json.dumps(job, ensure_ascii=False).encode("utf-8") + b"\n")
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile("rb") as reader:
+            reply = reader.readline()
+    finally:
+        connection.close()
+    if not reply:
+        raise DaemonError("归档守护进程未返回结果，可能已经退出。")
+    decoded = json.loads(reply)
+    if not isinstance(decoded, dict):
+        raise DaemonError("归档守护进程返回了无法识别的结果。")
+    return decoded
+
+
+class ArchiveDaemon:
+    """Serve archive jobs one at a time over a Unix domain socket.
+
+    Each connection carries one JSON line in and receives one JSON line back.
+    Jobs run serially on the serving thread, so ``handle`` may keep sessions,
+    database connections and browsers that are bound to that thread. The
+    socket is readable by its owner only and is removed on ``close``; a file
+    left behind by a daemon that crashed is replaced, a live one is refused.
+    """
+
+    def __init__(
+        self, handle: Callable[[dict[str, Any]], dict[str, Any]], *, socket_path: Path
+    ) -> None:
+        if not daemon_supported():
+            raise DaemonError("当前系统不支持 Unix 套接字，无法启动归档守护进程。")
+        if socket_path.exists():
+            if _is_listening(socket_path):
+                raise DaemonError(f"已有归档守护进程在监听：{socket_path}")
+            socket_path.unlink()
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path = socket_path
+        # The socket is created owner-only, so no other user can connect in
+        # the moment between bind() and a later chmod.
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = _JobServer(str(socket_path), _JobHandler)
+        finally:
+            os.umask(previous_umask)
+        self._server.handle_job = handle
+        self._closed = False
+
+    def __enter__(self) -> ArchiveDaemon:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever(poll_interval=0.5)
+
+    def shutdown(self) -> None:
+        """Stop ``serve_forever`` from another thread after the current job."""
+
+        self._server.shutdown()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._server.server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+class WarmWorkflows:
+    """Build one workflow per working directory and settings, and keep it open.
+
+    A workflow is rebuilt when one of its Cookie files changed since it was
+    built, so edited Cookie values take effect on the next job. The least
+    recently used workflow is closed once more than ``limit`` distinct
+    configurations are warm.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[ArchiveSettings], ArchiveWorkflow],
+        *,
+        limit: int = 4,
+    ) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self._build = build
+        self._limit = limit
+        self._workflows: dict[
+            tuple[str, ArchiveSettings], tuple[tuple[object, ...], ArchiveWorkflow]
+        ] = {}
+
+    def get(self, settings: ArchiveSettings, *, directory: str) -> ArchiveWorkflow:
+        key = (directory, settings)
+        stamp = _cookie_stamp(settings, directory)
+        warm = self._workflows.pop(key, None)
+        if warm is not None and warm[0] != stamp:
+            warm[1].close()
+            warm = None
+        workflow = warm[1] if warm is not None else self._build(settings)
+        self._workflows[key] = (stamp, workflow)
+        while len(self._workflows) > self._limit:
+            oldest = next(iter(self._workflows))
+            self._workflows.pop(oldest)[1].close()
+        return workflow
+
+    def close(self) -> None:
+        workflows, self._workflows = self._workflows, {}
+        for _, workflow in workflows.values():
+            workflow.close()
+
+
+def _cookie_stamp(settings: ArchiveSettings, directory: str) -> tuple[object, ...]:
+    """Identify the current contents of every configured Cookie file."""
+
+    paths = (
+        *((settings.cookie_file,) if settings.cookie_file is not None else ()),
+        *settings.cookie_files,
+    )
+    stamp: list[object] = []
+    for path in paths:
+        try:
+            status = (Path(directory) / path).stat()
+        except OSError:
+            stamp.append((str(path), None))
+        else:
+            stamp.append((str(path), status.st_mtime_ns, status.st_size))
+    return tuple(stamp)
+
+
+def _is_listening(socket_path: Path) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.settimeout(_CONNECT_TIMEOUT)
+        probe.connect(str(socket_path))
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+if daemon_supported():
+
+    class _JobServer(socketserver.UnixStreamServer):
+        handle_job: Callable[[dict[str, Any]], dict[str, Any]]
+
+    class _JobHandler(socketserver.StreamRequestHandler):
+        server: _JobServer
+
+        def handle(self) -> None:
+            try:
+                job = json.loads(self.rfile.readline())
+            except ValueError:
+                job = None
+            if isinstance(job, dict):
+                reply = self.server.handle_job(job)
+            else:
+                reply = {"exit_code": 1, "stdout": "", "stderr": "错误：归档任务格式无效。\n"}
+            self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
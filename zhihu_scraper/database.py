@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
 from collections.abc import Iterable, Mapping, Sequence
 from contextlib import closing
@@ -31,6 +32,7 @@ from .domain import (
     Text,
     Video,
 )
+from .paging import PageCursor
 from .render import content_plain_text
 
 _SCHEMA = """
@@ -111,6 +113,33 @@ CREATE TABLE IF NOT EXISTS media (
     size_bytes INTEGER,
     PRIMARY KEY (content_key, asset_id, source_url)
 );
+
+CREATE TABLE IF NOT EXISTS page_sizes (
+    endpoint TEXT PRIMARY KEY,
+    page_size INTEGER NOT NULL,
+    server_cap INTEGER,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS collection_cursors (
+    endpoint TEXT NOT NULL,
+    shape TEXT NOT NULL,
+    next_url TEXT,
+    item_offset INTEGER NOT NULL,
+    page_size INTEGER NOT NULL,
+    total INTEGER,
+    pages INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (endpoint, shape)
+);
+
+CREATE TABLE IF NOT EXISTS collection_pages (
+    endpoint TEXT NOT NULL,
+    shape TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    items TEXT NOT NULL,
+    PRIMARY KEY (endpoint, shape, page)
+);
 """
 
 
@@ -251,6 +280,173 @@ class ArchiveDatabase:
                 paths.setdefault(asset_id, archive_path)
         return paths
 
+    def load_page_sizes(self) -> dict[str, tuple[int, int | None]]:
+        """Return learned page sizes and server caps keyed by endpoint kind."""
+
+        if not self.path.is_file():
+            return {}
+        try:
+            with closing(sqlite3.connect(self.path)) as connection:
+                rows = connection.execute(
+                    "SELECT endpoint, page_size, server_cap FROM page_sizes"
+                ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return {
+            endpoint: (page_size, server_cap if isinstance(server_cap, int) else None)
+            for endpoint, page_size, server_cap in rows
+            if isinstance(endpoint, str) and isinstance(page_size, int) and page_size > 0
+        }
+
+    def save_page_size(self, endpoint: str, page_size: int, server_cap: int | None) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with closing(sqlite3.connect(self.path)) as connection:
+                with connection:
+                    connection.execute("PRAGMA busy_timeout = 5000")
+                    connection.executescript(_SCHEMA)
+                    connection.execute(
+                        """
+                        INSERT INTO page_sizes (endpoint, page_size, server_cap, updated_at)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT(endpoint) DO UPDATE SET
+                            page_size = excluded.page_size,
+                            server_cap = excluded.server_cap,
+                            updated_at = excluded.updated_at
+                        """,
+                        (endpoint, page_size, server_cap, datetime.now(UTC).isoformat()),
+                    )
+        except sqlite3.Error:
+            # Page-size hints are an optimization; never fail an archive for them.
+            return
+
+    def load_checkpoint(
+        self, endpoint: str, shape: str
+    ) -> tuple[PageCursor, list[dict[str, object]]] | None:
+        """Return the committed cursor and items of an unfinished crawl.
+
+        A checkpoint with a missing or unreadable page is ignored as a whole,
+        so the crawl starts over instead of archiving a gap.
+        """
+
+        if not self.path.is_file():
+            return None
+        try:
+            with closing(sqlite3.connect(self.path)) as connection:
+                cursor_row = connection.execute(
+                    """
+                    SELECT next_url, item_offset, page_size, total, pages, updated_at
+                    FROM collection_cursors WHERE endpoint = ? AND shape = ?
+                    """,
+                    (endpoint, shape),
+                ).fetchone()
+                page_rows = connection.execute(
+                    """
+                    SELECT page, items FROM collection_pages
+                    WHERE endpoint = ? AND shape = ? ORDER BY page
+                    """,
+                    (endpoint, shape),
+                ).fetchall()
+        except sqlite3.Error:
+            return None
+        if cursor_row is None:
+            return None
+        next_url, offset, page_size, total, pages, updated_at = cursor_row
+        try:
+            saved_at = datetime.fromisoformat(updated_at)
+        except (TypeError, ValueError):
+            return None
+        if (
+            not (next_url is None or isinstance(next_url, str))
+            or not isinstance(offset, int)
+            or not isinstance(page_size, int)
+            or not 1 <= page_size <= 100
+            or not (total is None or isinstance(total, int))
+            or not isinstance(pages, int)
+            or saved_at.tzinfo is None
+            or [page for page, _ in page_rows] != list(range(1, pages + 1))
+        ):
+            return None
+        items: list[dict[str, object]] = []
+        for _, raw_items in page_rows:
+            try:
+                decoded = json.loads(raw_items)
+            except (TypeError, ValueError):
+                return None
+            if not isinstance(decoded, list) or not all(isinstance(item, dict) for item in decoded):
+                return None
+            items.extend(decoded)
+        return PageCursor(next_url, offset, page_size, total, pages, saved_at), items
+
+    def save_checkpoint_page(
+        self,
+        endpoint: str,
+        shape: str,
+        items: Sequence[Mapping[str, object]],
+        cursor: PageCursor,
+    ) -> None:
+        """Commit one fetched page together with the cursor that follows it."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with closing(sqlite3.connect(self.path)) as connection:
+                with connection:
+                    connection.execute("PRAGMA busy_timeout = 5000")
+                    connection.executescript(_SCHEMA)
+                    connection.execute(
+                        """
+                        INSERT OR REPLACE INTO collection_pages (endpoint, shape, page, items)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (
+                            endpoint,
+                            shape,
+                            cursor.pages,
+                            json.dumps([dict(item) for item in items], ensure_ascii=False),
+                        ),
+                    )
+                    connection.execute(
+                        """
+                        INSERT OR REPLACE INTO collection_cursors (
+                            endpoint, shape, next_url, item_offset, page_size, total, pages,
+                            updated_at
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            endpoint,
+                            shape,
+                            cursor.next_url,
+                            cursor.offset,
+                            cursor.page_size,
+                            cursor.total,
+                            cursor.pages,
+                            (cursor.saved_at or datetime.now(UTC)).isoformat(),
+                        ),
+                    )
+        except (sqlite3.Error, TypeError, ValueError):
+            # A lost checkpoint only costs a longer crawl next time.
+            return
+
+    def clear_checkpoints(self, endpoint: str) -> None:
+        """Forget every checkpoint of ``endpoint``, whatever its field shape."""
+
+        if not self.path.is_file():
+            return
+        try:
+            with closing(sqlite3.connect(self.path)) as connection:
+                with connection:
+                    connection.execute("PRAGMA busy_timeout = 5000")
+                    connection.executescript(_SCHEMA)
+                    connection.execute(
+                        "DELETE FROM collection_pages WHERE endpoint = ?", (endpoint,)
+                    )
+                    connection.execute(
+                        "DELETE FROM collection_cursors WHERE endpoint = ?", (endpoint,)
+                    )
+        except sqlite3.Error:
+            return
+
     def _save_article(
         self,
         connection: sqlite3.Connection,
@@ -174,6 +174,7 @@ class Article:
     voteup_count: int = 0
     cover_url: str | None = None
     columns: tuple[ColumnRef, ...] = ()
+    comment_count: int | None = None
     comments: CommentThread | None = None
 
 
@@ -194,6 +195,7 @@ class Answer:
     blocks: tuple[Block, ...]
     updated_at: datetime | None = None
     voteup_count: int = 0
+    comment_count: int | None = None
     comments: CommentThread | None = None
 
     @property
@@ -5,37 +5,62 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 
+from .accounts import AccountHealth, AccountPool
 from .application import ArchiveReport, ArchiveSink, ArchiveWorkflow, BrowserReader
 from .archive import LocalArchive
-from .browser import BrowserFallback
+from .browser import BackgroundBrowser, BrowserFallback
+from .cache import ResponseCache
+from .circuit import CircuitBreaker, RetryBudget
+from .coalesce import CoalescingZhihuClient
+from .database import ArchiveDatabase
 from .http import (
+    AsyncZhihuHttpClient,
+    ConcurrentZhihuHttpClient,
     CookieDiagnostic,
     LoginStatus,
+    PooledZhihuHttpClient,
     ZhihuHttpClient,
     diagnose_cookies,
     load_cookies,
 )
+from .paging import AdaptivePageSize
+from .proxies import ProxyPool
+from .ratelimit import RateLimiter
 from .settings import ArchiveSettings
 from .settings import BrowserFallback as BrowserFallbackMode
-from .source import ZhihuSource
+from .source import FieldProjection, ZhihuSource
+
+
+@dataclass(frozen=True, slots=True)
+class AccountSessionReport:
+    name: str
+    cookie_diagnostic: CookieDiagnostic
+    login_status: LoginStatus | None
 
 
 @dataclass(frozen=True, slots=True)
 class SessionReport:
     cookie_diagnostic: CookieDiagnostic
     login_status: LoginStatus | None
+    accounts: tuple[AccountSessionReport, ...] = ()
 
 
 def archive_url(
     raw_url: str,
     settings: ArchiveSettings | None = None,
+    *,
+    restart: bool = False,
 ) -> ArchiveReport:
-    """Archive one supported Zhihu URL using validated local settings."""
+    """Archive one supported Zhihu URL using validated local settings.
+
+    ``restart`` discards the checkpoints an interrupted crawl of the same
+    question or column left behind instead of resuming from them.
+    """
 
     effective_settings = settings or ArchiveSettings()
     workflow = build_workflow(effective_settings)
     try:
-        return workflow.run(raw_url)
+        return workflow.run(raw_url, restart=restart)
     finally:
         workflow.close()
 
@@ -43,34 +68,75 @@ def archive_url(
 def build_workflow(
     settings: ArchiveSettings,
     *,
-    client: ZhihuHttpClient | None = None,
+    client: (
+        ZhihuHttpClient
+        | PooledZhihuHttpClient
+        | ConcurrentZhihuHttpClient
+        | CoalescingZhihuClient
+        | None
+    ) = None,
     sink: ArchiveSink | None = None,
     browser_factory: Callable[[], BrowserReader] | None = None,
     cookies: Mapping[str, str] | None = None,
 ) -> ArchiveWorkflow:
     """Compose the public workflow while keeping every boundary injectable."""
 
-    configured_cookies = dict(cookies) if cookies is not None else _configured_cookies(settings)
-    http_client = client or ZhihuHttpClient(
-        cookies=configured_cookies,
-        proxy=settings.proxy,
-        max_retries=settings.retries,
-        timeout=settings.timeout,
+    accounts = (
+        [("cookies", dict(cookies))] if cookies is not None else _configured_accounts(settings)
+    )
+    # The first account's Cookie values seed the browser fallback.
+    configured_cookies = accounts[0][1] if accounts else {}
+    rate_limiter = _configured_rate_limiter(settings)
+    api_circuit, media_circuit = _configured_circuits(settings)
+    proxy_pool = _configured_proxy_pool(settings)
+    # A daemon keeps the workflow for many runs; these start over in each.
+    run_resets: list[Callable[[], None]] = [api_circuit.reset, media_circuit.reset]
+    if proxy_pool is not None:
+        run_resets.append(proxy_pool.reset_stats)
+    account_health: list[Callable[[], tuple[AccountHealth, ...]]] = []
+    http_client = client or _configured_client(
+        settings,
+        accounts,
+        rate_limiter,
+        api_circuit,
+        proxy_pool,
+        run_resets,
+        account_health,
+    )
+    archive_sink = sink or LocalArchive.from_settings(
+        settings,
+        rate_limiter=rate_limiter,
+        circuit=media_circuit,
+        proxy_pool=proxy_pool,
     )
-    archive_sink = sink or LocalArchive.from_settings(settings)
     if browser_factory is None and settings.browser_fallback is not BrowserFallbackMode.NEVER:
 
-        def configured_browser() -> BrowserFallback:
-            return BrowserFallback(
+        def configured_browser() -> BrowserFallback | BackgroundBrowser:
+            browser = BrowserFallback(
                 cdp_url=settings.cdp_url,
                 headless=settings.headless,
-                proxy=settings.proxy,
+                proxy=_first_proxy(settings),
                 timeout_ms=max(1, int(settings.timeout * 1000)),
+                block_resources=settings.block_resources,
             )
+            return BackgroundBrowser(browser) if settings.warm_up else browser
 
         browser_factory = configured_browser
     return ArchiveWorkflow(
-        source=ZhihuSource(http_client),
+        source=ZhihuSource(
+            http_client,
+            read_ahead=settings.concurrency if settings.concurrency > 1 else 0,
+            projection=(
+                FieldProjection.lean(comments=settings.comments)
+                if settings.lean_fields
+                else FieldProjection.full()
+            ),
+            page_sizes=_configured_page_sizes(settings),
+            checkpoints=(
+                ArchiveDatabase(settings.output_dir / "zhihu.db") if settings.sqlite else None
+            ),
+            resume=settings.resume,
+        ),
         sink=archive_sink,
         settings=settings,
         comment_client=http_client,
@@ -78,6 +144,13 @@ def build_workflow(
         browser_cookies=configured_cookies,
         browser_cookie_sink=getattr(http_client, "update_cookies", None),
         resource_closer=http_client.close if client is None else None,
+        circuit_reports=lambda: (api_circuit.report(), media_circuit.report()),
+        proxy_stats=proxy_pool.stats if proxy_pool is not None else None,
+        account_health=account_health[0] if account_health else None,
+        coalescing_stats=(
+            http_client.stats if isinstance(http_client, CoalescingZhihuClient) else None
+        ),
+        run_reset=lambda: _reset_all(run_resets),
     )
 
 
@@ -85,35 +158,200 @@ def check_session(settings: ArchiveSettings | None = None) -> SessionReport:
     """Check Cookie names and the real Zhihu identity endpoint without disclosure."""
 
     effective_settings = settings or ArchiveSettings()
-    cookies = _configured_cookies(effective_settings)
+    accounts = _configured_accounts(effective_settings)
+    cookies = accounts[0][1] if accounts else {}
     diagnostic = diagnose_cookies(cookies)
-    if not cookies:
+    if not any(account_cookies for _, account_cookies in accounts):
         return SessionReport(
             cookie_diagnostic=diagnostic,
             login_status=None,
         )
+    # An account whose Cookie file is empty is reported without a request.
+    reports = tuple(
+        AccountSessionReport(
+            name=name,
+            cookie_diagnostic=diagnose_cookies(account_cookies),
+            login_status=(
+                _login_status(effective_settings, account_cookies) if account_cookies else None
+            ),
+        )
+        for name, account_cookies in accounts
+    )
+    return SessionReport(
+        cookie_diagnostic=diagnostic,
+        login_status=reports[0].login_status,
+        accounts=reports if len(reports) > 1 else (),
+    )
+
+
+def _login_status(settings: ArchiveSettings, cookies: Mapping[str, str]) -> LoginStatus:
     client = ZhihuHttpClient(
         cookies=cookies,
-        proxy=effective_settings.proxy,
-        max_retries=effective_settings.retries,
-        timeout=effective_settings.timeout,
+        proxy=_first_proxy(settings),
+        max_retries=settings.retries,
+        timeout=settings.timeout,
     )
     try:
-        return SessionReport(
-            cookie_diagnostic=diagnostic,
-            login_status=client.check_login(),
-        )
+        return client.check_login()
     finally:
         client.close()
 
 
-def _configured_cookies(settings: ArchiveSettings) -> dict[str, str]:
-    if settings.cookie_file is None:
-        return {}
-    return load_cookies(settings.cookie_file)
+def _configured_client(
+    settings: ArchiveSettings,
+    accounts: list[tuple[str, dict[str, str]]],
+    rate_limiter: RateLimiter,
+    circuit: CircuitBreaker,
+    proxy_pool: ProxyPool | None,
+    run_resets: list[Callable[[], None]],
+    account_health: list[Callable[[], tuple[AccountHealth, ...]]],
+) -> CoalescingZhihuClient:
+    cache = _configured_cache(settings)
+
+    def transport(
+        cookies: Mapping[str, str],
+        limiter: RateLimiter,
+    ) -> PooledZhihuHttpClient | ConcurrentZhihuHttpClient:
+        return _transport_client(settings, cookies, limiter, circuit, cache, proxy_pool)
+
+    if len(accounts) < 2:
+        coalescing = CoalescingZhihuClient(
+            transport(accounts[0][1] if accounts else {}, rate_limiter),
+            memo_ttl=settings.memo_ttl,
+        )
+        run_resets.append(coalescing.reset_stats)
+        return coalescing
+    # Each account is paced on its own, so a 429 pause or a slow window of
+    # one session does not hold back the others. The pool builds one client
+    # per account, in order.
+    limiters = iter([_configured_rate_limiter(settings, account=name) for name, _ in accounts])
+    pool = AccountPool(
+        accounts,
+        lambda cookies: transport(cookies, next(limiters)),
+        quota=settings.account_quota,
+        bench_seconds=settings.account_cooldown,
+    )
+    run_resets.append(pool.reset)
+    account_health.append(pool.health)
+    coalescing = CoalescingZhihuClient(pool, memo_ttl=settings.memo_ttl)
+    run_resets.append(coalescing.reset_stats)
+    return coalescing
+
+
+def _transport_client(
+    settings: ArchiveSettings,
+    cookies: Mapping[str, str],
+    rate_limiter: RateLimiter,
+    circuit: CircuitBreaker,
+    cache: ResponseCache | None,
+    proxy_pool: ProxyPool | None,
+) -> PooledZhihuHttpClient | ConcurrentZhihuHttpClient:
+    if settings.concurrency == 1:
+        return PooledZhihuHttpClient(
+            cookies=cookies,
+            proxy=_first_proxy(settings),
+            max_retries=settings.retries,
+            timeout=settings.timeout,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            circuit=circuit,
+            proxy_pool=proxy_pool,
+        )
+    return ConcurrentZhihuHttpClient(
+        AsyncZhihuHttpClient(
+            cookies=cookies,
+            proxy=_first_proxy(settings),
+            max_retries=settings.retries,
+            timeout=settings.timeout,
+            max_in_flight=settings.concurrency,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            circuit=circuit,
+            proxy_pool=proxy_pool,
+        )
+    )
+
+
+def _configured_page_sizes(settings: ArchiveSettings) -> AdaptivePageSize | None:
+    if not settings.adaptive_page_size:
+        return None
+    store = ArchiveDatabase(settings.output_dir / "zhihu.db") if settings.sqlite else None
+    return AdaptivePageSize(store)
+
+
+def _configured_cache(settings: ArchiveSettings) -> ResponseCache | None:
+    if not settings.response_cache:
+        return None
+    return ResponseCache(
+        settings.output_dir / ".zhihu-http-cache.db",
+        ttl=settings.cache_ttl,
+        max_bytes=settings.cache_max_mb * 1024 * 1024,
+    )
+
+
+def _first_proxy(settings: ArchiveSettings) -> str | None:
+    return settings.proxy_urls[0] if settings.proxy_urls else None
+
+
+def _reset_all(resets: list[Callable[[], None]]) -> None:
+    for reset in resets:
+        reset()
+
+
+def _configured_proxy_pool(settings: ArchiveSettings) -> ProxyPool | None:
+    """Pool several proxies; a single one keeps the plain ``proxy`` path."""
+
+    if len(settings.proxy_urls) < 2:
+        return None
+    return ProxyPool(settings.proxy_urls, cooldown=settings.proxy_cooldown)
+
+
+def _configured_circuits(settings: ArchiveSettings) -> tuple[CircuitBreaker, CircuitBreaker]:
+    """Give API and media requests their own breaker over one run-wide retry budget."""
+
+    budget = RetryBudget(settings.retry_budget)
+
+    def breaker(name: str) -> CircuitBreaker:
+        return CircuitBreaker(
+            name,
+            budget=budget,
+            failure_threshold=settings.circuit_threshold,
+            reset_timeout=settings.circuit_reset,
+        )
+
+    return breaker("api"), breaker("media")
+
+
+def _configured_rate_limiter(
+    settings: ArchiveSettings,
+    *,
+    account: str | None = None,
+) -> RateLimiter:
+    """Pace API, comment, and media requests of one run from a single budget.
+
+    With ``account`` the limiter paces only that account's API requests and
+    keeps its shared pause in a file of its own.
+    """
+
+    shared_name = ".zhihu-rate-limit.json" if account is None else f".zhihu-rate-limit.{account}"
+    return RateLimiter(
+        api_rate=settings.requests_per_second,
+        media_rate=settings.media_requests_per_second,
+        max_concurrency=settings.concurrency,
+        shared_state=(settings.output_dir / shared_name if settings.shared_rate_limit else None),
+    )
+
+
+def _configured_accounts(settings: ArchiveSettings) -> list[tuple[str, dict[str, str]]]:
+    paths = [] if settings.cookie_file is None else [settings.cookie_file]
+    paths.extend(path for path in settings.cookie_files if path not in paths)
+    # Accounts are named by file name so reports never show Cookie values or
+    # private directories.
+    return [(path.name, load_cookies(path)) for path in paths]
 
 
 __all__ = [
+    "AccountSessionReport",
     "ArchiveReport",
     "ArchiveSettings",
     "SessionReport",
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
 import json
+import threading
 import time
-from collections.abc import Callable, Iterable, Mapping
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Protocol, Self, cast
+from typing import Any, Protocol, Self, TypeVar, cast
 from urllib.parse import urljoin, urlparse
 
 from curl_cffi import requests
 
+from .cache import CachedResponse, ResponseCache
+from .circuit import CircuitBreaker
+from .proxies import ProxyPool, current_affinity, with_affinity
+from .ratelimit import HostClass, RateLimiter, retry_after_seconds
+
 
 @dataclass(frozen=True, slots=True)
 class CookieDiagnostic:
@@ -49,6 +59,13 @@ class _HttpSession(Protocol):
     def get(self, url: str, **kwargs: Any) -> _HttpResponse: ...
 
 
+class _AsyncHttpSession(Protocol):
+    async def get(self, url: str, **kwargs: Any) -> _HttpResponse: ...
+
+
+_T = TypeVar("_T")
+
+
 class ZhihuHttpError(RuntimeError):
     """Base class for sanitized, user-facing Zhihu HTTP failures."""
 
@@ -77,6 +94,10 @@ class TransportError(RuntimeError):
     """The HTTP transport failed without exposing its potentially sensitive details."""
 
 
+class CircuitOpenError(TransportError):
+    """Requests are refused while repeated Zhihu failures keep the circuit open."""
+
+
 class InvalidResponseError(RuntimeError):
     """Zhihu returned a response that could not be decoded safely."""
 
@@ -101,6 +122,10 @@ class ZhihuHttpClient:
         max_retries: int = 2,
         timeout: float = 20.0,
         sleep: Callable[[float], None] = time.sleep,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        circuit: CircuitBreaker | None = None,
+        proxy_pool: ProxyPool | None = None,
     ) -> None:
         self._cookies = dict(cookies or {})
         self._proxy = proxy
@@ -111,18 +136,20 @@ class ZhihuHttpClient:
         self._max_retries = max_retries
         self._timeout = timeout
         self._sleep = sleep
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._circuit = circuit
+        self._proxy_pool = proxy_pool
         self._closed = False
 
     def update_cookies(self, cookies: Mapping[str, str]) -> None:
         """Merge browser-exported Cookie values into future HTTP requests."""
 
-        for name, value in cookies.items():
-            if not isinstance(name, str) or not isinstance(value, str):
-                continue
-            normalized_name = name.strip()
-            normalized_value = value.strip()
-            if normalized_name and normalized_value:
-                self._cookies[normalized_name] = normalized_value
+        # Replace rather than mutate so a request running on another thread
+        # keeps the snapshot it started with.
+        # The cache identity is derived from these values on every request,
+        # so a new ``z_c0`` reads and writes its own entries from now on.
+        self._cookies = _merged_cookies(self._cookies, cookies)
 
     def close(self) -> None:
         """Release the underlying connection pool exactly once."""
@@ -155,110 +182,505 @@ class ZhihuHttpClient:
             if exc_value is None:
                 raise
 
-    def get_json(self, url_or_path: str) -> object:
-        response = self._get(url_or_path, accept="application/json, text/plain, */*")
-        try:
-            return response.json()
-        except Exception:
-            raise InvalidResponseError(
-                "Zhihu returned a response that was not valid JSON."
-            ) from None
+    def get_json(self, url_or_path: str, *, use_cache: bool = True) -> object:
+        response, pending = self._get(
+            url_or_path,
+            accept="application/json, text/plain, */*",
+            use_cache=use_cache,
+        )
+        payload = _json_payload(response)
+        if pending is not None and _is_cacheable_payload(payload):
+            pending.store(response)
+        return payload
 
     def get_html(self, url_or_path: str) -> str:
-        response = self._get(
+        response, pending = self._get(
             url_or_path,
             accept="text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         )
+        if pending is not None:
+            pending.store(response)
         return response.text
 
     def check_login(self) -> LoginStatus:
         try:
-            payload = self.get_json("/api/v4/me")
+            # The identity endpoint always reflects the live session.
+            payload = self.get_json("/api/v4/me", use_cache=False)
         except (AuthenticationError, AccessDeniedError):
             return LoginStatus(
                 authenticated=False,
                 reason="authentication_rejected",
             )
-        if not isinstance(payload, Mapping):
-            return LoginStatus(authenticated=False, reason="invalid_response")
-
-        raw_member_id = payload.get("id")
-        raw_url_token = payload.get("url_token")
-        member_id = raw_member_id if isinstance(raw_member_id, str) else None
-        url_token = raw_url_token if isinstance(raw_url_token, str) else None
-        authenticated = bool(member_id or url_token)
-        raw_name = payload.get("name")
-        name = raw_name if isinstance(raw_name, str) else None
-        return LoginStatus(
-            authenticated=authenticated,
-            member_id=member_id,
-            name=name,
-            reason=None if authenticated else "identity_missing",
-        )
+        return _login_status(payload)
+
+    def _get(
+        self,
+        url_or_path: str,
+        *,
+        accept: str,
+        use_cache: bool = True,
+    ) -> tuple[_HttpResponse, _CacheContext | None]:
+        """Return the response and, for a new 200 body, where it may be cached.
+
+        The caller stores the body only once it has validated the payload.
+        """
 
-    def _get(self, url_or_path: str, *, accept: str) -> _HttpResponse:
         if self._closed:
             raise TransportError("Zhihu HTTP client is closed.")
         url = _absolute_zhihu_url(url_or_path)
-        request_options: dict[str, object] = {
-            "headers": {
-                "Accept": accept,
-                "Referer": "https://www.zhihu.com/",
-            },
-            "cookies": self._cookies,
-            "timeout": self._timeout,
-            "allow_redirects": False,
-        }
-        if self._proxy:
-            request_options["proxy"] = self._proxy
+        cached = (
+            _CacheContext.open(self._cache, self._cookies, accept, url)
+            if self._cache is not None and use_cache
+            else None
+        )
+        if cached is not None and (fresh := cached.fresh_response()) is not None:
+            return fresh, None
+        request_options = _request_options(
+            accept=accept,
+            cookies=self._cookies,
+            timeout=self._timeout,
+            proxy=self._proxy,
+            conditional_headers=cached.conditional_headers() if cached is not None else None,
+        )
 
         for retry_number in range(self._max_retries + 1):
+            _enter_circuit(self._circuit)
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(HostClass.API)
+            proxy = self._proxy_pool.choose() if self._proxy_pool is not None else None
+            started = time.monotonic()
+            response: _HttpResponse | None = None
             try:
-                response = self._session.get(url, **request_options)
+                response = self._session.get(url, **_with_proxy(request_options, proxy))
             except Exception:
-                if retry_number < self._max_retries:
+                response = None
+            finally:
+                # Released even when an interrupt escapes the request.
+                _release_slot(self._rate_limiter, response, started)
+            _record_outcome(self._circuit, response)
+            _record_proxy(self._proxy_pool, proxy, response, started)
+            if response is None:
+                if retry_number < self._max_retries and _may_retry(self._circuit):
                     self._sleep(_retry_delay({}, retry_number))
                     continue
-                raise TransportError(
-                    "Zhihu request failed after limited retries; check the network or proxy."
-                ) from None
-            should_retry = response.status_code == 429 or 500 <= response.status_code <= 599
-            if should_retry and retry_number < self._max_retries:
+                raise _transport_failure()
+            if (
+                _should_retry(response)
+                and retry_number < self._max_retries
+                and _may_retry(self._circuit)
+            ):
                 self._sleep(_retry_delay(response.headers, retry_number))
                 continue
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    401,
-                    "Zhihu returned HTTP 401; authentication is missing or expired. "
-                    "Check the z_c0 and d_c0 Cookie fields.",
-                )
-            if response.status_code == 403:
-                raise AccessDeniedError(
-                    403,
-                    "Zhihu returned HTTP 403; access was denied. "
-                    "Refresh the z_c0 and d_c0 Cookie fields or use browser fallback.",
-                )
-            if response.status_code == 429:
-                raise RateLimitError(
-                    429,
-                    "Zhihu returned HTTP 429 after limited retries; "
-                    "reduce request frequency and try again later.",
-                )
-            if 500 <= response.status_code <= 599:
-                raise ServerError(
-                    response.status_code,
-                    f"Zhihu returned HTTP {response.status_code} after limited retries; "
-                    "the server is temporarily unavailable.",
-                )
-            if 300 <= response.status_code <= 399:
-                raise InvalidResponseError(
-                    "Zhihu returned an unexpected redirect; authenticated requests "
-                    "are never forwarded to another origin."
-                )
-            return response
+            if cached is not None:
+                return cached.complete(response)
+            return _checked_response(response), None
+
+        raise AssertionError("retry loop must return or raise")
+
+
+class PooledZhihuHttpClient:
+    """Thread-safe ``ZhihuHttpClient`` with one session per calling thread.
+
+    Each thread lazily gets its own ``ZhihuHttpClient`` and keeps reusing its
+    connections, so several workflows can share one client in a process.
+    Cookie updates are applied to every pooled session under one lock, and
+    sessions created afterwards start from the merged values. ``close``
+    releases every session exactly once.
+    """
+
+    def __init__(
+        self,
+        *,
+        cookies: Mapping[str, str] | None = None,
+        proxy: str | None = None,
+        session_factory: Callable[[], _HttpSession] | None = None,
+        max_retries: int = 2,
+        timeout: float = 20.0,
+        sleep: Callable[[float], None] = time.sleep,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        circuit: CircuitBreaker | None = None,
+        proxy_pool: ProxyPool | None = None,
+    ) -> None:
+        self._cookies = dict(cookies or {})
+        self._proxy = proxy
+        self._session_factory = session_factory
+        self._max_retries = max_retries
+        self._timeout = timeout
+        self._sleep = sleep
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._circuit = circuit
+        self._proxy_pool = proxy_pool
+        self._local = threading.local()
+        self._clients: list[ZhihuHttpClient] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def session_count(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def get_json(self, url_or_path: str, *, use_cache: bool = True) -> object:
+        return self._client().get_json(url_or_path, use_cache=use_cache)
+
+    def get_html(self, url_or_path: str) -> str:
+        return self._client().get_html(url_or_path)
+
+    def check_login(self) -> LoginStatus:
+        return self._client().check_login()
+
+    def update_cookies(self, cookies: Mapping[str, str]) -> None:
+        """Merge browser-exported Cookie values into every pooled session."""
+
+        with self._lock:
+            self._cookies = _merged_cookies(self._cookies, cookies)
+            for client in self._clients:
+                client.update_cookies(self._cookies)
+
+    def close(self) -> None:
+        """Close every pooled session exactly once, even if one of them fails."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            clients = self._clients
+            self._clients = []
+        failed = False
+        for client in clients:
+            try:
+                client.close()
+            except TransportError:
+                failed = True
+        if failed:
+            raise TransportError("Zhihu HTTP resources could not be closed cleanly.")
+
+    def __enter__(self) -> Self:
+        if self._closed:
+            raise TransportError("Zhihu HTTP client is closed.")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            self.close()
+        except TransportError:
+            if exc_value is None:
+                raise
+
+    def _client(self) -> ZhihuHttpClient:
+        client: ZhihuHttpClient | None = getattr(self._local, "client", None)
+        if client is not None:
+            return client
+        with self._lock:
+            if self._closed:
+                raise TransportError("Zhihu HTTP client is closed.")
+            client = ZhihuHttpClient(
+                cookies=self._cookies,
+                proxy=self._proxy,
+                session=self._session_factory() if self._session_factory is not None else None,
+                max_retries=self._max_retries,
+                timeout=self._timeout,
+                sleep=self._sleep,
+                rate_limiter=self._rate_limiter,
+                cache=self._cache,
+                circuit=self._circuit,
+                proxy_pool=self._proxy_pool,
+            )
+            self._clients.append(client)
+        self._local.client = client
+        return client
+
+
+class AsyncZhihuHttpClient:
+    """Asyncio counterpart of ``ZhihuHttpClient`` with a bounded in-flight limit.
+
+    Redirect refusal, trusted-origin checks, retries and sanitized errors are
+    shared with the synchronous client; only the transport is awaited.
+    """
+
+    def __init__(
+        self,
+        *,
+        cookies: Mapping[str, str] | None = None,
+        proxy: str | None = None,
+        session: _AsyncHttpSession | None = None,
+        max_retries: int = 2,
+        timeout: float = 20.0,
+        max_in_flight: int = 8,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        circuit: CircuitBreaker | None = None,
+        proxy_pool: ProxyPool | None = None,
+    ) -> None:
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        self._cookies = dict(cookies or {})
+        self._proxy = proxy
+        self._session = session
+        self._owns_session = session is None
+        self._max_retries = max_retries
+        self._timeout = timeout
+        self._max_in_flight = max_in_flight
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._sleep = sleep
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._circuit = circuit
+        self._proxy_pool = proxy_pool
+        self._closed = False
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    def update_cookies(self, cookies: Mapping[str, str]) -> None:
+        """Merge browser-exported Cookie values into future HTTP requests."""
+
+        # Replace rather than mutate so requests already running on the event
+        # loop keep a consistent snapshot while another thread updates cookies.
+        self._cookies = _merged_cookies(self._cookies, cookies)
+
+    async def aclose(self) -> None:
+        """Release the underlying connection pool exactly once."""
+
+        if self._closed:
+            return
+        self._closed = True
+        session = self._session
+        self._session = None
+        close_session = getattr(session, "close", None)
+        if not callable(close_session):
+            return
+        try:
+            result = close_session()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            raise TransportError("Zhihu HTTP resources could not be closed cleanly.") from None
+
+    async def __aenter__(self) -> Self:
+        if self._closed:
+            raise TransportError("Zhihu HTTP client is closed.")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            await self.aclose()
+        except TransportError:
+            if exc_value is None:
+                raise
+
+    async def get_json(self, url_or_path: str, *, use_cache: bool = True) -> object:
+        response, pending = await self._get(
+            url_or_path,
+            accept="application/json, text/plain, */*",
+            use_cache=use_cache,
+        )
+        payload = _json_payload(response)
+        if pending is not None and _is_cacheable_payload(payload):
+            await asyncio.to_thread(pending.store, response)
+        return payload
+
+    async def get_html(self, url_or_path: str) -> str:
+        response, pending = await self._get(
+            url_or_path,
+            accept="text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        )
+        if pending is not None:
+            await asyncio.to_thread(pending.store, response)
+        return response.text
+
+    async def check_login(self) -> LoginStatus:
+        try:
+            # The identity endpoint always reflects the live session.
+            payload = await self.get_json("/api/v4/me", use_cache=False)
+        except (AuthenticationError, AccessDeniedError):
+            return LoginStatus(
+                authenticated=False,
+                reason="authentication_rejected",
+            )
+        return _login_status(payload)
+
+    async def _get(
+        self,
+        url_or_path: str,
+        *,
+        accept: str,
+        use_cache: bool = True,
+    ) -> tuple[_HttpResponse, _CacheContext | None]:
+        if self._closed:
+            raise TransportError("Zhihu HTTP client is closed.")
+        url = _absolute_zhihu_url(url_or_path)
+        # Cache reads and writes touch SQLite, so keep them off the event loop.
+        cached = (
+            await asyncio.to_thread(_CacheContext.open, self._cache, self._cookies, accept, url)
+            if self._cache is not None and use_cache
+            else None
+        )
+        if cached is not None and (fresh := cached.fresh_response()) is not None:
+            return fresh, None
+        request_options = _request_options(
+            accept=accept,
+            cookies=self._cookies,
+            timeout=self._timeout,
+            proxy=self._proxy,
+            conditional_headers=cached.conditional_headers() if cached is not None else None,
+        )
+
+        for retry_number in range(self._max_retries + 1):
+            # Hold an in-flight slot only while the request is on the wire so
+            # retry back-off never blocks unrelated requests.
+            async with self._in_flight:
+                _enter_circuit(self._circuit)
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire_async(HostClass.API)
+                proxy = self._proxy_pool.choose() if self._proxy_pool is not None else None
+                started = time.monotonic()
+                response = None
+                try:
+                    response = await self._active_session().get(
+                        url,
+                        **_with_proxy(request_options, proxy),
+                    )
+                except Exception:
+                    response = None
+                finally:
+                    # Released even when the request task is cancelled.
+                    _release_slot(self._rate_limiter, response, started)
+                _record_outcome(self._circuit, response)
+                _record_proxy(self._proxy_pool, proxy, response, started)
+            if response is None:
+                if retry_number < self._max_retries and _may_retry(self._circuit):
+                    await self._sleep(_retry_delay({}, retry_number))
+                    continue
+                raise _transport_failure()
+            if (
+                _should_retry(response)
+                and retry_number < self._max_retries
+                and _may_retry(self._circuit)
+            ):
+                await self._sleep(_retry_delay(response.headers, retry_number))
+                continue
+            if cached is not None:
+                return await asyncio.to_thread(cached.complete, response)
+            return _checked_response(response), None
 
         raise AssertionError("retry loop must return or raise")
 
+    def _active_session(self) -> _AsyncHttpSession:
+        if self._session is None:
+            # curl_cffi binds its async session to the running loop, so the
+            # default session is created lazily inside the first request.
+            self._session = cast(
+                _AsyncHttpSession,
+                requests.AsyncSession(
+                    impersonate="chrome",
+                    max_clients=self._max_in_flight,
+                ),
+            )
+        return self._session
+
+
+class ConcurrentZhihuHttpClient:
+    """Blocking facade that runs an ``AsyncZhihuHttpClient`` on a private loop.
+
+    It satisfies the same synchronous ``get_json``/``get_html`` contract as
+    ``ZhihuHttpClient``, so ``ZhihuSource`` and ``fetch_comment_thread`` work
+    unchanged, and adds ``submit_json`` for callers that can overlap requests.
+    Every method is safe to call from several threads.
+    """
+
+    def __init__(self, client: AsyncZhihuHttpClient) -> None:
+        self._client = client
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="zhihu-http",
+            daemon=True,
+        )
+        self._thread.start()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._client.max_in_flight
+
+    def submit_json(self, url_or_path: str, *, use_cache: bool = True) -> Future[object]:
+        """Start one JSON request without waiting for its response."""
+
+        return self._submit(self._client.get_json(url_or_path, use_cache=use_cache))
+
+    def get_json(self, url_or_path: str, *, use_cache: bool = True) -> object:
+        return self.submit_json(url_or_path, use_cache=use_cache).result()
+
+    def get_html(self, url_or_path: str) -> str:
+        return self._submit(self._client.get_html(url_or_path)).result()
+
+    def check_login(self) -> LoginStatus:
+        return self._submit(self._client.check_login()).result()
+
+    def update_cookies(self, cookies: Mapping[str, str]) -> None:
+        """Merge browser-exported Cookie values into future HTTP requests."""
+
+        self._client.update_cookies(cookies)
+
+    def close(self) -> None:
+        """Close the async client, then stop and release the private loop."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self) -> Self:
+        if self._closed:
+            raise TransportError("Zhihu HTTP client is closed.")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            self.close()
+        except TransportError:
+            if exc_value is None:
+                raise
+
+    def _submit(self, coroutine: Coroutine[Any, Any, _T]) -> Future[_T]:
+        with self._lock:
+            if self._closed:
+                coroutine.close()
+                raise TransportError("Zhihu HTTP client is closed.")
+            # The loop thread has its own context, so the caller's proxy
+            # affinity travels with the coroutine.
+            return asyncio.run_coroutine_threadsafe(
+                with_affinity(current_affinity(), coroutine),
+                self._loop,
+            )
+
 
 def load_cookies(path: Path) -> dict[str, str]:
     """Load non-empty name/value pairs from a browser cookie export."""
@@ -297,6 +719,18 @@ def load_cookies(path: Path) -> dict[str, str]:
     return cookies
 
 
+def _merged_cookies(current: Mapping[str, str], updates: Mapping[str, str]) -> dict[str, str]:
+    merged = dict(current)
+    for name, value in updates.items():
+        if not isinstance(name, str) or not isinstance(value, str):
+            continue
+        normalized_name = name.strip()
+        normalized_value = value.strip()
+        if normalized_name and normalized_value:
+            merged[normalized_name] = normalized_value
+    return merged
+
+
 def _is_zhihu_cookie_domain(value: object) -> bool:
     """Limit full browser exports to cookies scoped to Zhihu origins."""
 
@@ -325,11 +759,245 @@ def _absolute_zhihu_url(url_or_path: str) -> str:
     return url
 
 
+def _login_status(payload: object) -> LoginStatus:
+    if not isinstance(payload, Mapping):
+        return LoginStatus(authenticated=False, reason="invalid_response")
+
+    raw_member_id = payload.get("id")
+    raw_url_token = payload.get("url_token")
+    member_id = raw_member_id if isinstance(raw_member_id, str) else None
+    url_token = raw_url_token if isinstance(raw_url_token, str) else None
+    authenticated = bool(member_id or url_token)
+    raw_name = payload.get("name")
+    name = raw_name if isinstance(raw_name, str) else None
+    return LoginStatus(
+        authenticated=authenticated,
+        member_id=member_id,
+        name=name,
+        reason=None if authenticated else "identity_missing",
+    )
+
+
+def _request_options(
+    *,
+    accept: str,
+    cookies: Mapping[str, str],
+    timeout: float,
+    proxy: str | None,
+    conditional_headers: Mapping[str, str] | None = None,
+) -> dict[str, object]:
+    request_options: dict[str, object] = {
+        "headers": {
+            "Accept": accept,
+            "Referer": "https://www.zhihu.com/",
+            **(conditional_headers or {}),
+        },
+        "cookies": cookies,
+        "timeout": timeout,
+        "allow_redirects": False,
+    }
+    if proxy:
+        request_options["proxy"] = proxy
+    return request_options
+
+
+def _should_retry(response: _HttpResponse) -> bool:
+    return response.status_code == 429 or 500 <= response.status_code <= 599
+
+
+def _transport_failure() -> TransportError:
+    return TransportError("Zhihu request failed after limited retries; check the network or proxy.")
+
+
+def _checked_response(response: _HttpResponse) -> _HttpResponse:
+    """Map a final response onto sanitized errors, or return it on success."""
+
+    if response.status_code == 401:
+        raise AuthenticationError(
+            401,
+            "Zhihu returned HTTP 401; authentication is missing or expired. "
+            "Check the z_c0 and d_c0 Cookie fields.",
+        )
+    if response.status_code == 403:
+        raise AccessDeniedError(
+            403,
+            "Zhihu returned HTTP 403; access was denied. "
+            "Refresh the z_c0 and d_c0 Cookie fields or use browser fallback.",
+        )
+    if response.status_code == 429:
+        raise RateLimitError(
+            429,
+            "Zhihu returned HTTP 429 after limited retries; "
+            "reduce request frequency and try again later.",
+        )
+    if 500 <= response.status_code <= 599:
+        raise ServerError(
+            response.status_code,
+            f"Zhihu returned HTTP {response.status_code} after limited retries; "
+            "the server is temporarily unavailable.",
+        )
+    if 300 <= response.status_code <= 399:
+        raise InvalidResponseError(
+            "Zhihu returned an unexpected redirect; authenticated requests "
+            "are never forwarded to another origin."
+        )
+    return response
+
+
+@dataclass(slots=True)
+class _CachedHttpResponse:
+    text: str
+    status_code: int = 200
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    def json(self) -> object:
+        return json.loads(self.text)
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheContext:
+    """One request's view of the response cache."""
+
+    cache: ResponseCache
+    identity: str
+    accept: str
+    url: str
+    entry: CachedResponse | None
+
+    @classmethod
+    def open(
+        cls,
+        cache: ResponseCache,
+        cookies: Mapping[str, str],
+        accept: str,
+        url: str,
+    ) -> _CacheContext:
+        identity = _session_identity(cookies)
+        return cls(cache, identity, accept, url, cache.lookup(identity, accept, url))
+
+    def fresh_response(self) -> _HttpResponse | None:
+        if self.entry is None or not self.cache.is_fresh(self.entry):
+            return None
+        return _CachedHttpResponse(self.entry.body)
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.entry is not None and self.entry.etag is not None:
+            headers["If-None-Match"] = self.entry.etag
+        if self.entry is not None and self.entry.last_modified is not None:
+            headers["If-Modified-Since"] = self.entry.last_modified
+        return headers
+
+    def complete(
+        self,
+        response: _HttpResponse,
+    ) -> tuple[_HttpResponse, _CacheContext | None]:
+        """Serve a confirmed 304 from the cache, or return a 200 still to store."""
+
+        if response.status_code == 304 and self.entry is not None:
+            self.cache.refresh(self.identity, self.accept, self.url)
+            return _CachedHttpResponse(self.entry.body), None
+        checked = _checked_response(response)
+        return checked, self if checked.status_code == 200 else None
+
+    def store(self, response: _HttpResponse) -> None:
+        self.cache.store(
+            self.identity,
+            self.accept,
+            self.url,
+            body=response.text,
+            etag=_header(response.headers, "ETag"),
+            last_modified=_header(response.headers, "Last-Modified"),
+        )
+
+
+def _json_payload(response: _HttpResponse) -> object:
+    try:
+        return response.json()
+    except Exception:
+        raise InvalidResponseError("Zhihu returned a response that was not valid JSON.") from None
+
+
+def _is_cacheable_payload(payload: object) -> bool:
+    """Keep Zhihu's 200 responses that carry an ``error`` object out of the cache."""
+
+    return not (isinstance(payload, Mapping) and "error" in payload)
+
+
+def _session_identity(cookies: Mapping[str, str]) -> str:
+    """Return an opaque digest that separates cache entries per login session."""
+
+    token = cookies.get("z_c0")
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(f"zhihu-session\0{token}".encode()).hexdigest()
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    value = headers.get(name)
+    if value is None:
+        value = {str(key).casefold(): item for key, item in headers.items()}.get(name.casefold())
+    return value if isinstance(value, str) and value else None
+
+
+def _enter_circuit(circuit: CircuitBreaker | None) -> None:
+    if circuit is not None and not circuit.allow_request():
+        raise CircuitOpenError(
+            "Zhihu requests are paused after repeated failures; try again later."
+        )
+
+
+def _record_outcome(circuit: CircuitBreaker | None, response: _HttpResponse | None) -> None:
+    if circuit is None:
+        return
+    if response is None or 500 <= response.status_code <= 599:
+        circuit.record_failure()
+    else:
+        circuit.record_success()
+
+
+def _may_retry(circuit: CircuitBreaker | None) -> bool:
+    return circuit is None or circuit.allow_retry()
+
+
+def _with_proxy(request_options: dict[str, object], proxy: str | None) -> dict[str, object]:
+    if proxy is None:
+        return request_options
+    return {**request_options, "proxy": proxy}
+
+
+def _record_proxy(
+    proxy_pool: ProxyPool | None,
+    proxy: str | None,
+    response: _HttpResponse | None,
+    started: float,
+) -> None:
+    if proxy_pool is None or proxy is None:
+        return
+    proxy_pool.record(
+        proxy,
+        ok=response is not None and not _should_retry(response),
+        latency=time.monotonic() - started,
+    )
+
+
+def _release_slot(
+    rate_limiter: RateLimiter | None,
+    response: _HttpResponse | None,
+    started: float,
+) -> None:
+    if rate_limiter is None:
+        return
+    rate_limiter.release(
+        HostClass.API,
+        status=None if response is None else response.status_code,
+        latency=time.monotonic() - started,
+        retry_after=None if response is None else retry_after_seconds(response.headers),
+    )
+
+
 def _retry_delay(headers: Mapping[str, str], retry_number: int) -> float:
-    retry_after = headers.get("Retry-After")
+    retry_after = retry_after_seconds(headers)
     if retry_after is not None:
-        try:
-            return max(0.0, float(retry_after))
-        except (TypeError, ValueError):
-            pass
+        return retry_after
     return min(float(2**retry_number), 8.0)
@@ -17,6 +17,10 @@ from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin, urlsplit
 from urllib.request import HTTPRedirectHandler, ProxyHandler, Request, build_opener
 
+from .circuit import CircuitBreaker
+from .proxies import ProxyPool
+from .ratelimit import HostClass, RateLimiter, host_class_for, retry_after_seconds
+
 
 @dataclass(frozen=True, slots=True)
 class MediaCandidate:
@@ -106,8 +110,17 @@ def download_media(
     max_retries: int = 2,
     sleep: Callable[[float], None] = time.sleep,
     chunk_size: int = 1024 * 1024,
+    rate_limiter: RateLimiter | None = None,
+    circuit: CircuitBreaker | None = None,
+    proxy_pool: ProxyPool | None = None,
 ) -> MediaDownloadReceipt:
-    """Download one media URL, resuming a sibling ``.part`` file when possible."""
+    """Download one media URL, resuming a sibling ``.part`` file when possible.
+
+    A shared ``rate_limiter`` paces every attempt; it is released once the
+    response status is known so long transfers do not read as slow requests.
+    With a ``proxy_pool`` each attempt asks the pool for its proxy instead of
+    using ``proxy``.
+    """
 
     if chunk_size <= 0:
         raise ValueError("chunk_size must be positive")
@@ -132,13 +145,10 @@ def download_media(
         )
 
     partial_path = destination.with_name(f"{destination.name}.part")
+    host_class = host_class_for(source_url)
     opener = None
-    if transport is None:
-        handlers: list[Any] = []
-        if proxy is not None:
-            handlers.append(ProxyHandler({"http": proxy, "https": proxy}))
-        handlers.append(_SafeMediaRedirectHandler())
-        opener = build_opener(*handlers)
+    if transport is None and proxy_pool is None:
+        opener = _media_opener(proxy)
 
     for retry_number in range(max_retries + 1):
         partial_size = partial_path.stat().st_size if partial_path.is_file() else 0
@@ -150,6 +160,14 @@ def download_media(
             headers["Range"] = f"bytes={partial_size}-"
         request = Request(source_url, headers=headers, method="GET")
 
+        if circuit is not None and not circuit.allow_request():
+            raise MediaDownloadError("media downloads are paused after repeated failures")
+        attempt_proxy = proxy_pool.choose() if proxy_pool is not None else None
+        if transport is None and attempt_proxy is not None:
+            opener = _media_opener(attempt_proxy)
+        if rate_limiter is not None:
+            rate_limiter.acquire(host_class)
+        slot = _LimiterSlot(rate_limiter, host_class, circuit, proxy_pool, attempt_proxy)
         try:
             # Keep the DNS check adjacent to the actual open. urllib does not
             # expose a supported way to pin an HTTPS connection to this result,
@@ -162,6 +180,7 @@ def download_media(
                 timeout=timeout,
             ) as response:
                 status = _response_status(response)
+                slot.release(status, response.headers)
                 redirect_location = _header(response.headers, "Location")
                 if 300 <= status <= 399 and redirect_location is not None:
                     redirect_url = urljoin(source_url, redirect_location)
@@ -206,6 +225,7 @@ def download_media(
                 bytes_total=bytes_total,
             )
         except HTTPError as error:
+            slot.release(error.code, dict(error.headers.items()) if error.headers else {})
             if error.code != 429 and not 500 <= error.code <= 599:
                 raise MediaDownloadError(f"unexpected HTTP status {error.code}") from None
             retry_error: BaseException = error
@@ -213,8 +233,10 @@ def download_media(
             retry_error = error
         except (ConnectionError, TimeoutError, URLError) as error:
             retry_error = error
+        finally:
+            slot.release(None, {})
 
-        if retry_number < max_retries:
+        if retry_number < max_retries and (circuit is None or circuit.allow_retry()):
             sleep(min(float(2**retry_number), 8.0))
             continue
         if isinstance(retry_error, _RetryableMediaError):
@@ -224,6 +246,61 @@ def download_media(
     raise AssertionError("media retry loop must return or raise")
 
 
+def _media_opener(proxy: str | None) -> Any:
+    handlers: list[Any] = []
+    if proxy is not None:
+        handlers.append(ProxyHandler({"http": proxy, "https": proxy}))
+    handlers.append(_SafeMediaRedirectHandler())
+    return build_opener(*handlers)
+
+
+class _LimiterSlot:
+    """Report one attempt's outcome to the limiter, circuit and proxy pool once."""
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter | None,
+        host_class: HostClass,
+        circuit: CircuitBreaker | None,
+        proxy_pool: ProxyPool | None = None,
+        proxy: str | None = None,
+    ) -> None:
+        self._rate_limiter = rate_limiter
+        self._host_class = host_class
+        self._circuit = circuit
+        self._proxy_pool = proxy_pool
+        self._proxy = proxy
+        self._started = time.monotonic()
+        self._released = False
+
+    def release(self, status: int | None, headers: Mapping[str, str]) -> None:
+        if self._released:
+            return
+        self._released = True
+        failed = status is None or 500 <= status <= 599
+        throttled = status == 429 or (status is not None and 500 <= status <= 599)
+        latency = time.monotonic() - self._started
+        if self._circuit is not None:
+            if failed:
+                self._circuit.record_failure()
+            else:
+                self._circuit.record_success()
+        if self._proxy_pool is not None and self._proxy is not None:
+            self._proxy_pool.record(
+                self._proxy,
+                ok=status is not None and not throttled,
+                latency=latency,
+            )
+        if self._rate_limiter is None:
+            return
+        self._rate_limiter.release(
+            self._host_class,
+            status=status,
+            latency=latency,
+            retry_after=retry_after_seconds(headers) if throttled else None,
+        )
+
+
 def _open_response(
     request: Request,
     *,
@@ -27,6 +27,15 @@ class NormalizationError(ValueError):
     """A source payload is missing identity required by the archive."""
 
 
+class MissingProjectedFieldError(NormalizationError):
+    """A required field that a lean ``include`` set leaves out is absent."""
+
+
+# Fields ``normalize_answer`` reads that Zhihu only returns when they are
+# listed in the ``include`` parameter.
+ANSWER_INCLUDE_FIELDS = ("content", "voteup_count", "question", "author")
+
+
 def normalize_article(
     payload: Mapping[str, Any],
     *,
@@ -81,6 +90,7 @@ def normalize_article(
             )
         ),
         columns=_normalize_columns(payload),
+        comment_count=_optional_int(_field(payload, "comment_count", "commentCount")),
         comments=None,
     )
 
@@ -93,7 +103,7 @@ def normalize_answer(
     answer_id = _required_identifier(payload.get("id"), label="answer id")
     question_payload = payload.get("question")
     if not isinstance(question_payload, Mapping):
-        raise NormalizationError("missing answer question")
+        raise MissingProjectedFieldError("missing answer question")
     question_id = _required_identifier(
         question_payload.get("id"),
         label="question id",
@@ -138,6 +148,7 @@ def normalize_answer(
         voteup_count=_nonnegative_int(
             _field(payload, "voteup_count", "voteupCount", "vote_count", "voteCount")
         ),
+        comment_count=_optional_int(_field(payload, "comment_count", "commentCount")),
         comments=None,
     )
 
@@ -0,0 +1,174 @@
+"""Adaptive page sizes and crawl checkpoints for paginated Zhihu collections."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+
+class PageSizeStore(Protocol):
+    def load_page_sizes(self) -> Mapping[str, tuple[int, int | None]]: ...
+
+    def save_page_size(self, endpoint: str, page_size: int, server_cap: int | None) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class PageCursor:
+    """Where an interrupted collection crawl continues.
+
+    ``next_url`` is ``None`` once the page marked ``is_end`` was committed;
+    ``pages`` counts the committed pages, the cursor's own included.
+    ``saved_at`` is when the cursor was committed, if known.
+    """
+
+    next_url: str | None
+    offset: int
+    page_size: int
+    total: int | None
+    pages: int
+    saved_at: datetime | None = None
+
+
+class CheckpointStore(Protocol):
+    def load_checkpoint(
+        self, endpoint: str, shape: str
+    ) -> tuple[PageCursor, list[dict[str, object]]] | None: ...
+
+    def save_checkpoint_page(
+        self,
+        endpoint: str,
+        shape: str,
+        items: Sequence[Mapping[str, object]],
+        cursor: PageCursor,
+    ) -> None: ...
+
+    def clear_checkpoints(self, endpoint: str) -> None: ...
+
+
+@dataclass(slots=True)
+class _EndpointState:
+    page_size: int
+    server_cap: int | None
+    short_page: int | None = None
+    full_pages_at_cap: int = 0
+
+
+# Full pages at a learned cap after which a larger page is requested again.
+_REPROBE_AFTER = 20
+
+
+class AdaptivePageSize:
+    """Choose one page size per endpoint and learn from every page.
+
+    Endpoints without history start at ``maximum``. A page that fails with a
+    timeout or server error halves the size, slow pages shrink it by a
+    quarter, and fast full pages grow it by half again. Two consecutive
+    non-final pages that return the same short count reveal a server-side
+    cap, which is remembered so later runs do not request more than Zhihu
+    will serve; a short page at or above the known cap raises it. After
+    ``_REPROBE_AFTER`` full pages at the cap it is dropped and a larger page
+    is requested again. With a ``store`` the learned values survive between
+    runs.
+    """
+
+    def __init__(
+        self,
+        store: PageSizeStore | None = None,
+        *,
+        minimum: int = 5,
+        maximum: int = 100,
+        latency_target: float = 2.0,
+    ) -> None:
+        if not 1 <= minimum <= maximum:
+            raise ValueError("page size bounds must satisfy 1 <= minimum <= maximum")
+        self._store = store
+        self._minimum = minimum
+        self._maximum = maximum
+        self._latency_target = latency_target
+        self._lock = threading.Lock()
+        self._states: dict[str, _EndpointState] | None = None
+
+    def initial(self, endpoint: str) -> int:
+        with self._lock:
+            return self._state(endpoint).page_size
+
+    def succeeded(
+        self,
+        endpoint: str,
+        *,
+        requested: int,
+        returned: int,
+        is_end: bool,
+        latency: float,
+    ) -> int:
+        """Record one decoded page and return the size for the next request."""
+
+        with self._lock:
+            state = self._state(endpoint)
+            previous = (state.page_size, state.server_cap)
+            if not is_end and 0 < returned < requested:
+                # One short page may be a thin spot in the collection; only a
+                # repeated count, or one at least the known cap, is a cap.
+                if returned == state.short_page or (
+                    state.server_cap is not None and returned >= state.server_cap
+                ):
+                    state.server_cap = self._bounded(returned, None)
+                    state.page_size = self._bounded(state.page_size, state.server_cap)
+                    state.full_pages_at_cap = 0
+                state.short_page = returned
+            else:
+                state.short_page = None
+                if latency > self._latency_target:
+                    state.page_size = self._bounded(math.floor(requested * 0.75), state.server_cap)
+                elif returned == requested and not is_end:
+                    if state.server_cap is not None and requested >= state.server_cap:
+                        state.full_pages_at_cap += 1
+                        if state.full_pages_at_cap >= _REPROBE_AFTER:
+                            state.server_cap = None
+                            state.full_pages_at_cap = 0
+                    state.page_size = self._bounded(math.ceil(requested * 1.5), state.server_cap)
+            self._save(endpoint, state, previous)
+            return state.page_size
+
+    def failed(self, endpoint: str, *, requested: int) -> int | None:
+        """Shrink after a timeout or server error, or return ``None`` at the floor."""
+
+        with self._lock:
+            if requested <= self._minimum:
+                return None
+            state = self._state(endpoint)
+            previous = (state.page_size, state.server_cap)
+            state.page_size = self._bounded(requested // 2, state.server_cap)
+            self._save(endpoint, state, previous)
+            return state.page_size
+
+    def _state(self, endpoint: str) -> _EndpointState:
+        if self._states is None:
+            self._states = {}
+            stored = self._store.load_page_sizes() if self._store is not None else {}
+            for name, (page_size, server_cap) in stored.items():
+                cap = server_cap if server_cap is not None and server_cap > 0 else None
+                self._states[name] = _EndpointState(self._bounded(page_size, cap), cap)
+        state = self._states.get(endpoint)
+        if state is None:
+            state = _EndpointState(self._maximum, None)
+            self._states[endpoint] = state
+        return state
+
+    def _bounded(self, page_size: int, server_cap: int | None) -> int:
+        upper = self._maximum if server_cap is None else min(self._maximum, server_cap)
+        return max(min(self._minimum, upper), min(page_size, upper))
+
+    def _save(
+        self,
+        endpoint: str,
+        state: _EndpointState,
+        previous: tuple[int, int | None],
+    ) -> None:
+        if self._store is None or (state.page_size, state.server_cap) == previous:
+            return
+        self._store.save_page_size(endpoint, state.page_size, state.server_cap)
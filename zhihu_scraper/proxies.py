@@ -0,0 +1,184 @@
+"""Score several egress proxies and keep each archive target on one of them."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Coroutine, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, TypeVar
+from urllib.parse import urlparse
+
+_T = TypeVar("_T")
+
+_AFFINITY: ContextVar[str | None] = ContextVar("zhihu_proxy_affinity", default=None)
+
+# Weight of the newest latency sample in each proxy's moving average.
+_LATENCY_WEIGHT = 0.3
+
+
+@contextmanager
+def proxy_affinity(key: str) -> Iterator[None]:
+    """Route every proxied request made inside the block through one egress."""
+
+    token = _AFFINITY.set(key)
+    try:
+        yield
+    finally:
+        _AFFINITY.reset(token)
+
+
+def current_affinity() -> str | None:
+    return _AFFINITY.get()
+
+
+async def with_affinity(
+    key: str | None,
+    coroutine: Coroutine[Any, Any, _T],
+) -> _T:
+    """Carry a caller's affinity into a coroutine scheduled on another loop."""
+
+    if key is None:
+        return await coroutine
+    with proxy_affinity(key):
+        return await coroutine
+
+
+@dataclass(frozen=True, slots=True)
+class ProxyStats:
+    """End-of-run numbers for one proxy, labelled without credentials."""
+
+    label: str
+    requests: int
+    failures: int
+    ejections: int
+    mean_latency: float | None
+    ejected: bool
+
+
+@dataclass(slots=True)
+class _ProxyState:
+    url: str
+    label: str
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejections: int = 0
+    latency: float | None = None
+    ejected_until: float = 0.0
+
+
+class ProxyPool:
+    """Choose among several proxies by observed latency and errors.
+
+    Untried proxies are preferred, then the one with the lowest moving
+    average latency. ``failure_threshold`` consecutive failures eject a
+    proxy for ``cooldown`` seconds; after that it is admitted again and a
+    single further failure ejects it once more. Requests made under
+    ``proxy_affinity`` keep the proxy first chosen for that key while it
+    stays healthy. When every proxy is ejected, the one due back soonest is
+    used rather than failing the run.
+    """
+
+    def __init__(
+        self,
+        proxies: Sequence[str],
+        *,
+        failure_threshold: int = 3,
+        cooldown: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not proxies:
+            raise ValueError("a proxy pool needs at least one proxy")
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        self._states = [_ProxyState(url, _proxy_label(url)) for url in dict.fromkeys(proxies)]
+        self._by_url = {state.url: state for state in self._states}
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sticky: dict[str, _ProxyState] = {}
+
+    def choose(self) -> str:
+        """Return the proxy for the next attempt and count it as a request."""
+
+        key = _AFFINITY.get()
+        with self._lock:
+            now = self._clock()
+            healthy = [state for state in self._states if state.ejected_until <= now]
+            chosen = self._sticky.get(key) if key is not None else None
+            if chosen is None or chosen.ejected_until > now:
+                if healthy:
+                    chosen = min(
+                        healthy,
+                        key=lambda state: (
+                            state.latency is not None,
+                            state.latency or 0.0,
+                            state.requests,
+                        ),
+                    )
+                else:
+                    chosen = min(self._states, key=lambda state: state.ejected_until)
+                if key is not None:
+                    self._sticky[key] = chosen
+            chosen.requests += 1
+            return chosen.url
+
+    def record(self, proxy: str, *, ok: bool, latency: float | None = None) -> None:
+        """Score one finished attempt; throttling and 5xx count as failures."""
+
+        with self._lock:
+            state = self._by_url.get(proxy)
+            if state is None:
+                return
+            if ok:
+                state.consecutive_failures = 0
+                if latency is not None:
+                    state.latency = (
+                        latency
+                        if state.latency is None
+                        else state.latency + _LATENCY_WEIGHT * (latency - state.latency)
+                    )
+                return
+            state.failures += 1
+            state.consecutive_failures += 1
+            if state.consecutive_failures >= self._failure_threshold:
+                state.ejected_until = self._clock() + self._cooldown
+                state.ejections += 1
+                state.consecutive_failures = self._failure_threshold - 1
+
+    def reset_stats(self) -> None:
+        """Start a new run's statistics; learned latency and ejections stay."""
+
+        with self._lock:
+            for state in self._states:
+                state.requests = 0
+                state.failures = 0
+                state.ejections = 0
+            self._sticky.clear()
+
+    def stats(self) -> tuple[ProxyStats, ...]:
+        with self._lock:
+            now = self._clock()
+            return tuple(
+                ProxyStats(
+                    label=state.label,
+                    requests=state.requests,
+                    failures=state.failures,
+                    ejections=state.ejections,
+                    mean_latency=state.latency,
+                    ejected=state.ejected_until > now,
+                )
+                for state in self._states
+            )
+
+
+def _proxy_label(proxy: str) -> str:
+    parsed = urlparse(proxy)
+    host = parsed.hostname or "proxy"
+    if ":" in host:
+        host = f"[{host}]"
+    return f"{parsed.scheme}://{host}" + (f":{parsed.port}" if parsed.port else "")
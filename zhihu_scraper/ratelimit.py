@@ -0,0 +1,251 @@
+"""Shared request pacing for the Zhihu API, comments, and media downloads."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# How long a caller waits before re-checking for a free concurrency slot.
+_SLOT_POLL_SECONDS = 0.05
+# The shared pause file is re-read at most this often.
+_SHARED_REFRESH_SECONDS = 0.5
+
+
+class HostClass(StrEnum):
+    """Independently paced groups of hosts."""
+
+    API = "api"
+    MEDIA = "media"
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitStats:
+    host_class: HostClass
+    concurrency_limit: int
+    requests: int
+    throttled: int
+    paused_seconds: float
+
+
+def host_class_for(url: str) -> HostClass:
+    """Classify Zhihu's image and video CDNs separately from API and pages."""
+
+    hostname = (urlsplit(url).hostname or "").casefold().rstrip(".")
+    if any(
+        hostname == domain or hostname.endswith(f".{domain}")
+        for domain in ("zhimg.com", "vzuu.com")
+    ):
+        return HostClass.MEDIA
+    return HostClass.API
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Return a numeric ``Retry-After`` delay, or ``None`` when absent."""
+
+    raw_value = headers.get("Retry-After")
+    if raw_value is None:
+        lowered = {str(key).casefold(): value for key, value in headers.items()}
+        raw_value = lowered.get("retry-after")
+    if raw_value is None:
+        return None
+    try:
+        return max(0.0, float(raw_value))
+    except (TypeError, ValueError):
+        return None
+
+
+class _Bucket:
+    def __init__(self, *, rate: float, burst: float, max_concurrency: int, now: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+
+
+class RateLimiter:
+    """Token bucket per host class with AIMD concurrency and a global pause.
+
+    Every caller reserves a slot before sending and reports the outcome after
+    the response. Throttling and server errors halve the concurrency window,
+    fast successes grow it back by one slot per window, and any ``Retry-After``
+    pauses every host class until it has elapsed. With ``shared_state`` the
+    pause is also published to a small JSON file so other processes archiving
+    into the same directory wait too.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_rate: float = 4.0,
+        media_rate: float = 10.0,
+        max_concurrency: int = 1,
+        latency_target: float = 5.0,
+        shared_state: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if api_rate <= 0 or media_rate <= 0:
+            raise ValueError("request rates must be positive")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        now = clock()
+        self._buckets = {
+            HostClass.API: _Bucket(
+                rate=api_rate,
+                burst=max(1.0, api_rate),
+                max_concurrency=max_concurrency,
+                now=now,
+            ),
+            HostClass.MEDIA: _Bucket(
+                rate=media_rate,
+                burst=max(1.0, media_rate),
+                max_concurrency=max_concurrency,
+                now=now,
+            ),
+        }
+        self._latency_target = latency_target
+        self._shared_state = shared_state
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._paused_until = now
+        self._paused_seconds = 0.0
+        self._shared_checked_at: float | None = None
+
+    def try_acquire(self, host_class: HostClass) -> float:
+        """Reserve a request slot, or return how long to wait before retrying."""
+
+        with self._lock:
+            now = self._clock()
+            self._refresh_shared_pause(now)
+            if now < self._paused_until:
+                return self._paused_until - now
+            bucket = self._buckets[host_class]
+            bucket.tokens = min(
+                bucket.burst,
+                bucket.tokens + (now - bucket.updated) * bucket.rate,
+            )
+            bucket.updated = now
+            if bucket.in_flight >= math.floor(bucket.limit):
+                return _SLOT_POLL_SECONDS
+            if bucket.tokens < 1.0:
+                return (1.0 - bucket.tokens) / bucket.rate
+            bucket.tokens -= 1.0
+            bucket.in_flight += 1
+            bucket.requests += 1
+            return 0.0
+
+    def acquire(self, host_class: HostClass) -> None:
+        while True:
+            delay = self.try_acquire(host_class)
+            if delay <= 0:
+                return
+            self._sleep(delay)
+
+    async def acquire_async(self, host_class: HostClass) -> None:
+        while True:
+            delay = self.try_acquire(host_class)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def release(
+        self,
+        host_class: HostClass,
+        *,
+        status: int | None,
+        latency: float,
+        retry_after: float | None = None,
+    ) -> None:
+        """Return a slot and adapt the window to the observed outcome.
+
+        ``status`` is ``None`` when the transport failed before any response.
+        """
+
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets[host_class]
+            bucket.in_flight = max(0, bucket.in_flight - 1)
+            congested = status is None or status == 429 or 500 <= status <= 599
+            if status == 429:
+                bucket.throttled += 1
+            if congested:
+                bucket.limit = max(1.0, bucket.limit / 2)
+            elif latency > self._latency_target:
+                bucket.limit = max(1.0, bucket.limit * 0.75)
+            else:
+                bucket.limit = min(
+                    float(bucket.max_concurrency),
+                    bucket.limit + 1.0 / bucket.limit,
+                )
+            if retry_after is not None and retry_after > 0:
+                self._pause(now, retry_after)
+
+    def stats(self) -> tuple[RateLimitStats, ...]:
+        with self._lock:
+            return tuple(
+                RateLimitStats(
+                    host_class=host_class,
+                    concurrency_limit=math.floor(bucket.limit),
+                    requests=bucket.requests,
+                    throttled=bucket.throttled,
+                    paused_seconds=self._paused_seconds,
+                )
+                for host_class, bucket in self._buckets.items()
+            )
+
+    def _pause(self, now: float, seconds: float) -> None:
+        until = now + seconds
+        if until <= self._paused_until:
+            return
+        self._paused_seconds += until - max(now, self._paused_until)
+        self._paused_until = until
+        if self._shared_state is not None:
+            _write_shared_pause(self._shared_state, self._wall_clock() + seconds)
+
+    def _refresh_shared_pause(self, now: float) -> None:
+        if self._shared_state is None:
+            return
+        if (
+            self._shared_checked_at is not None
+            and now - self._shared_checked_at < _SHARED_REFRESH_SECONDS
+        ):
+            return
+        self._shared_checked_at = now
+        try:
+            document = json.loads(self._shared_state.read_text(encoding="utf-8"))
+        except (OSError, UnicodeError, json.JSONDecodeError):
+            return
+        raw_until = document.get("paused_until") if isinstance(document, dict) else None
+        if isinstance(raw_until, int | float) and not isinstance(raw_until, bool):
+            remaining = float(raw_until) - self._wall_clock()
+            if remaining > 0:
+                self._paused_until = max(self._paused_until, now + remaining)
+
+
+def _write_shared_pause(path: Path, paused_until: float) -> None:
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(json.dumps({"paused_until": paused_until}), encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        # Cross-process coordination is best effort; this process has already
+        # paused itself.
+        temporary.unlink(missing_ok=True)
@@ -173,6 +173,37 @@ class MarkdownRenderer:
             return _video_to_markdown(target, paths=paths)
         raise TypeError(f"Unsupported archive target: {type(target).__name__}")
 
+    def render_question_header(
+        self,
+        archive: QuestionArchive,
+        *,
+        answer_count: int,
+        media_paths: Mapping[str, str] | None = None,
+    ) -> str:
+        """Open a merged question document whose answers are rendered one by one.
+
+        ``render_question_header`` + every ``render_question_answer`` +
+        ``render_question_footer`` equals ``render`` of the whole archive.
+        """
+
+        return _question_header_markdown(
+            archive,
+            answer_count=answer_count,
+            paths=media_paths or {},
+        )
+
+    def render_question_answer(
+        self,
+        answer: Answer,
+        *,
+        index: int,
+        media_paths: Mapping[str, str] | None = None,
+    ) -> str:
+        return _question_answer_markdown(answer, index=index, paths=media_paths or {})
+
+    def render_question_footer(self) -> str:
+        return "\n"
+
 
 class HtmlRenderer:
     def render(
@@ -204,6 +235,36 @@ class HtmlRenderer:
         )
         return _html_document(target.title, body, stylesheet_href=stylesheet_href)
 
+    def render_question_header(
+        self,
+        archive: QuestionArchive,
+        *,
+        answer_count: int,
+        media_paths: Mapping[str, str] | None = None,
+    ) -> str:
+        """Open a merged question document whose answers are rendered one by one.
+
+        ``render_question_header`` + every ``render_question_answer`` +
+        ``render_question_footer`` equals ``render`` of the whole archive.
+        """
+
+        return _html_document_start(
+            archive.title,
+            stylesheet_href="assets/archive.css",
+        ) + _question_header_html(archive, answer_count=answer_count, paths=media_paths or {})
+
+    def render_question_answer(
+        self,
+        answer: Answer,
+        *,
+        index: int,
+        media_paths: Mapping[str, str] | None = None,
+    ) -> str:
+        return _question_answer_html(answer, index=index, paths=media_paths or {})
+
+    def render_question_footer(self) -> str:
+        return "    </article>\n" + _HTML_DOCUMENT_END
+
     @staticmethod
     def assets() -> Mapping[str, str]:
         return {"archive.css": ARCHIVE_CSS}
@@ -305,51 +366,73 @@ def _question_to_markdown(
     archive: QuestionArchive,
     *,
     paths: Mapping[str, str],
+) -> str:
+    return (
+        _question_header_markdown(archive, answer_count=len(archive.answers), paths=paths)
+        + "".join(
+            _question_answer_markdown(answer, index=index, paths=paths)
+            for index, answer in enumerate(archive.answers, start=1)
+        )
+        + "\n"
+    )
+
+
+def _question_header_markdown(
+    archive: QuestionArchive,
+    *,
+    answer_count: int,
+    paths: Mapping[str, str],
 ) -> str:
     question = archive.question
     parts = [
         f"# {_markdown_single_line(question.title)}",
         "",
         f"> 知乎原问题：{_markdown_link(question.source_url, question.source_url)}",
-        f"> 共归档 {len(archive.answers)} 个回答",
+        f"> 共归档 {answer_count} 个回答",
         f"> 知乎显示回答数：{question.answer_count}",
         f"> 归档时间：{archive.archived_at.date().isoformat()}",
     ]
     detail = _blocks_to_markdown(question.detail, paths=paths).strip()
     if detail:
         parts.extend(["", "## 问题详情", "", detail])
-    for index, answer in enumerate(archive.answers, start=1):
+    return "\n".join(parts)
+
+
+def _question_answer_markdown(
+    answer: Answer,
+    *,
+    index: int,
+    paths: Mapping[str, str],
+) -> str:
+    parts = [
+        "",
+        "---",
+        "",
+        f"## 回答 {index} · {_markdown_single_line(answer.author.name)}",
+        "",
+        *_markdown_metadata(
+            author=None,
+            source_url=answer.source_url,
+            published_at=answer.published_at,
+            voteup_count=answer.voteup_count,
+            source_label="查看这个回答",
+        ),
+    ]
+    answer_body = _blocks_to_markdown(answer.blocks, paths=paths).strip()
+    if answer_body:
+        parts.extend(["", answer_body])
+    if answer.comments is not None:
         parts.extend(
             [
                 "",
-                "---",
-                "",
-                f"## 回答 {index} · {_markdown_single_line(answer.author.name)}",
-                "",
-                *_markdown_metadata(
-                    author=None,
-                    source_url=answer.source_url,
-                    published_at=answer.published_at,
-                    voteup_count=answer.voteup_count,
-                    source_label="查看这个回答",
+                _comments_to_markdown(
+                    answer.comments,
+                    heading_level=3,
+                    paths=paths,
                 ),
             ]
         )
-        answer_body = _blocks_to_markdown(answer.blocks, paths=paths).strip()
-        if answer_body:
-            parts.extend(["", answer_body])
-        if answer.comments is not None:
-            parts.extend(
-                [
-                    "",
-                    _comments_to_markdown(
-                        answer.comments,
-                        heading_level=3,
-                        paths=paths,
-                    ),
-                ]
-            )
-    return "\n".join([*parts, ""])
+    return "\n" + "\n".join(parts)
 
 
 def _column_to_markdown(
@@ -485,49 +568,69 @@ def _question_to_html(
     archive: QuestionArchive,
     *,
     paths: Mapping[str, str],
+) -> str:
+    return (
+        _question_header_html(archive, answer_count=len(archive.answers), paths=paths)
+        + "".join(
+            _question_answer_html(answer, index=index, paths=paths)
+            for index, answer in enumerate(archive.answers, start=1)
+        )
+        + "    </article>\n"
+    )
+
+
+def _question_header_html(
+    archive: QuestionArchive,
+    *,
+    answer_count: int,
+    paths: Mapping[str, str],
 ) -> str:
     question = archive.question
     question_source = _html_link("知乎原问题", question.source_url)
     detail = _blocks_to_html(question.detail, paths=paths) if question.detail else ""
-    sections: list[str] = []
-    for index, answer in enumerate(archive.answers, start=1):
-        source = _html_link("查看这个回答", answer.source_url)
-        date = (
-            f"<span>发布于 {html.escape(answer.published_at.date().isoformat())}</span>"
-            if answer.published_at
-            else ""
-        )
-        comments = (
-            _comments_to_html(
-                answer.comments,
-                heading_level=3,
-                paths=paths,
-            )
-            if answer.comments
-            else ""
-        )
-        sections.append(
-            '      <section class="answer">\n'
-            f"        <h2>回答 {index} · {html.escape(answer.author.name)}</h2>\n"
-            '        <p class="answer-metadata">'
-            f"{source} · {answer.voteup_count} 赞同"
-            f"{' · ' + date if date else ''}</p>\n"
-            f"{_blocks_to_html(answer.blocks, paths=paths, indent='        ')}\n"
-            f"{comments}"
-            "      </section>\n"
-        )
     return (
         '    <article class="question-archive">\n'
         f"      <h1>{html.escape(question.title)}</h1>\n"
         '      <section class="metadata">\n'
         f"        <p>{question_source}</p>\n"
-        f"        <p>共归档 {len(archive.answers)} 个回答</p>\n"
+        f"        <p>共归档 {answer_count} 个回答</p>\n"
         f"        <p>知乎显示回答数：{question.answer_count}</p>\n"
         f"        <p>归档时间：{archive.archived_at.date().isoformat()}</p>\n"
         "      </section>\n"
         f"{'      <h2>问题详情</h2>\\n' + detail + chr(10) if detail else ''}"
-        f"{''.join(sections)}"
-        "    </article>\n"
+    )
+
+
+def _question_answer_html(
+    answer: Answer,
+    *,
+    index: int,
+    paths: Mapping[str, str],
+) -> str:
+    source = _html_link("查看这个回答", answer.source_url)
+    date = (
+        f"<span>发布于 {html.escape(answer.published_at.date().isoformat())}</span>"
+        if answer.published_at
+        else ""
+    )
+    comments = (
+        _comments_to_html(
+            answer.comments,
+            heading_level=3,
+            paths=paths,
+        )
+        if answer.comments
+        else ""
+    )
+    return (
+        '      <section class="answer">\n'
+        f"        <h2>回答 {index} · {html.escape(answer.author.name)}</h2>\n"
+        '        <p class="answer-metadata">'
+        f"{source} · {answer.voteup_count} 赞同"
+        f"{' · ' + date if date else ''}</p>\n"
+        f"{_blocks_to_html(answer.blocks, paths=paths, indent='        ')}\n"
+        f"{comments}"
+        "      </section>\n"
     )
 
 
@@ -891,6 +994,10 @@ def _html_document(
     *,
     stylesheet_href: str,
 ) -> str:
+    return _html_document_start(title, stylesheet_href=stylesheet_href) + body + _HTML_DOCUMENT_END
+
+
+def _html_document_start(title: str, *, stylesheet_href: str) -> str:
     escaped_title = html.escape(title)
     return (
         "<!doctype html>\n"
@@ -902,12 +1009,12 @@ def _html_document(
         f'    <link rel="stylesheet" href="{html.escape(stylesheet_href, quote=True)}">\n'
         "  </head>\n"
         "  <body>\n"
-        f"{body}"
-        "  </body>\n"
-        "</html>\n"
     )
 
 
+_HTML_DOCUMENT_END = "  </body>\n</html>\n"
+
+
 def _inlines_plain_text(inlines: Sequence[Inline]) -> str:
     parts: list[str] = []
     for inline in inlines:
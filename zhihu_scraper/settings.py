@@ -41,15 +41,39 @@ class ArchiveSettings:
     comment_roots: int = 10
     comment_replies: int = 10
     media_download: bool = True
+    streaming: bool = False
+    resume: bool = True
 
     cookie_file: Path | None = None
+    cookie_files: tuple[Path, ...] = ()
+    account_quota: int = 0
+    account_cooldown: int = 600
     proxy: str | None = None
+    proxies: tuple[str, ...] = ()
+    proxy_cooldown: int = 120
     timeout: float = 30.0
     retries: int = 3
+    retry_budget: int = 50
+    circuit_threshold: int = 5
+    circuit_reset: int = 30
     page_size: int = 20
+    adaptive_page_size: bool = False
+    concurrency: int = 1
+    requests_per_second: float = 4.0
+    media_requests_per_second: float = 10.0
+    shared_rate_limit: bool = False
+    response_cache: bool = False
+    cache_ttl: int = 3600
+    cache_max_mb: int = 256
+    memo_ttl: int = 30
+    lean_fields: bool = True
+    hydration_budget: int = 20
 
     browser_fallback: BrowserFallback = BrowserFallback.AUTO
     headless: bool = False
+    block_resources: bool = True
+    capture_api: bool = True
+    warm_up: bool = False
     cdp_url: str | None = None
 
     def __post_init__(self) -> None:
@@ -59,13 +83,17 @@ class ArchiveSettings:
             if self.cookie_file is None
             else _path_value(self.cookie_file, "network.cookie_file")
         )
+        cookie_files = _path_list(self.cookie_files, "network.cookie_files")
         proxy = _proxy_url(self.proxy)
+        proxies = _proxy_list(self.proxies)
         fallback = _browser_fallback(self.browser_fallback)
         cdp_url = _optional_nonempty_string(self.cdp_url, "browser.cdp_url")
 
         object.__setattr__(self, "output_dir", output_dir)
         object.__setattr__(self, "cookie_file", cookie_file)
+        object.__setattr__(self, "cookie_files", cookie_files)
         object.__setattr__(self, "proxy", proxy)
+        object.__setattr__(self, "proxies", proxies)
         object.__setattr__(self, "browser_fallback", fallback)
         object.__setattr__(self, "cdp_url", cdp_url)
         object.__setattr__(
@@ -79,6 +107,21 @@ class ArchiveSettings:
                 range_description="大于 0 且不超过 300 秒",
             ),
         )
+        for field_name, maximum in (
+            ("requests_per_second", 50.0),
+            ("media_requests_per_second", 100.0),
+        ):
+            object.__setattr__(
+                self,
+                field_name,
+                _number_in_range(
+                    getattr(self, field_name),
+                    f"network.{field_name}",
+                    minimum_exclusive=0,
+                    maximum=maximum,
+                    range_description=f"大于 0 且不超过 {maximum:g}",
+                ),
+            )
 
         for field_name in (
             "markdown",
@@ -87,9 +130,27 @@ class ArchiveSettings:
             "pdf",
             "comments",
             "media_download",
+            "streaming",
+            "resume",
+            "shared_rate_limit",
+            "response_cache",
+            "lean_fields",
+            "adaptive_page_size",
             "headless",
+            "block_resources",
+            "capture_api",
+            "warm_up",
         ):
-            section = "browser" if field_name == "headless" else "archive"
+            section = {
+                "headless": "browser",
+                "block_resources": "browser",
+                "capture_api": "browser",
+                "warm_up": "browser",
+                "shared_rate_limit": "network",
+                "response_cache": "network",
+                "lean_fields": "network",
+                "adaptive_page_size": "network",
+            }.get(field_name, "archive")
             _boolean(getattr(self, field_name), f"{section}.{field_name}")
 
         _integer_in_range(
@@ -105,7 +166,50 @@ class ArchiveSettings:
             maximum=100,
         )
         _integer_in_range(self.retries, "network.retries", minimum=0, maximum=10)
+        _integer_in_range(
+            self.account_quota,
+            "network.account_quota",
+            minimum=0,
+            maximum=1_000_000,
+        )
+        _integer_in_range(
+            self.account_cooldown,
+            "network.account_cooldown",
+            minimum=1,
+            maximum=86400,
+        )
+        _integer_in_range(
+            self.proxy_cooldown,
+            "network.proxy_cooldown",
+            minimum=1,
+            maximum=3600,
+        )
+        _integer_in_range(self.retry_budget, "network.retry_budget", minimum=0, maximum=1000)
+        _integer_in_range(
+            self.circuit_threshold,
+            "network.circuit_threshold",
+            minimum=1,
+            maximum=100,
+        )
+        _integer_in_range(self.circuit_reset, "network.circuit_reset", minimum=1, maximum=600)
         _integer_in_range(self.page_size, "network.page_size", minimum=1, maximum=100)
+        _integer_in_range(self.concurrency, "network.concurrency", minimum=1, maximum=16)
+        _integer_in_range(self.cache_ttl, "network.cache_ttl", minimum=0, maximum=30 * 86400)
+        _integer_in_range(self.cache_max_mb, "network.cache_max_mb", minimum=1, maximum=10240)
+        _integer_in_range(self.memo_ttl, "network.memo_ttl", minimum=0, maximum=600)
+        _integer_in_range(
+            self.hydration_budget,
+            "network.hydration_budget",
+            minimum=0,
+            maximum=1000,
+        )
+
+    @property
+    def proxy_urls(self) -> tuple[str, ...]:
+        """Every configured proxy, ``network.proxy`` first, without duplicates."""
+
+        leading = () if self.proxy is None else (self.proxy,)
+        return tuple(dict.fromkeys(leading + self.proxies))
 
     @classmethod
     def from_toml(cls, path: str | Path) -> ArchiveSettings:
@@ -155,17 +259,44 @@ class ArchiveSettings:
                 "comment_roots",
                 "comment_replies",
                 "media_download",
+                "streaming",
+                "resume",
             },
         )
         _reject_unknown_fields(
             network,
             "network",
-            {"cookie_file", "proxy", "timeout", "retries", "page_size"},
+            {
+                "cookie_file",
+                "cookie_files",
+                "account_quota",
+                "account_cooldown",
+                "proxy",
+                "proxies",
+                "proxy_cooldown",
+                "timeout",
+                "retries",
+                "retry_budget",
+                "circuit_threshold",
+                "circuit_reset",
+                "page_size",
+                "adaptive_page_size",
+                "concurrency",
+                "requests_per_second",
+                "media_requests_per_second",
+                "shared_rate_limit",
+                "response_cache",
+                "cache_ttl",
+                "cache_max_mb",
+                "memo_ttl",
+                "lean_fields",
+                "hydration_budget",
+            },
         )
         _reject_unknown_fields(
             browser,
             "browser",
-            {"fallback", "headless", "cdp_url"},
+            {"fallback", "headless", "block_resources", "capture_api", "warm_up", "cdp_url"},
         )
 
         defaults = cls()
@@ -196,21 +327,65 @@ class ArchiveSettings:
                 "media_download",
                 defaults.media_download,
             ),
+            streaming=_value(archive, "streaming", defaults.streaming),
+            resume=_value(archive, "resume", defaults.resume),
             cookie_file=_optional_path_from_table(
                 network,
                 "cookie_file",
                 "network.cookie_file",
             ),
+            cookie_files=_value(network, "cookie_files", defaults.cookie_files),
+            account_quota=_value(network, "account_quota", defaults.account_quota),
+            account_cooldown=_value(network, "account_cooldown", defaults.account_cooldown),
             proxy=_value(network, "proxy", defaults.proxy),
+            proxies=_value(network, "proxies", defaults.proxies),
+            proxy_cooldown=_value(network, "proxy_cooldown", defaults.proxy_cooldown),
             timeout=_value(network, "timeout", defaults.timeout),
             retries=_value(network, "retries", defaults.retries),
+            retry_budget=_value(network, "retry_budget", defaults.retry_budget),
+            circuit_threshold=_value(
+                network,
+                "circuit_threshold",
+                defaults.circuit_threshold,
+            ),
+            circuit_reset=_value(network, "circuit_reset", defaults.circuit_reset),
             page_size=_value(network, "page_size", defaults.page_size),
+            adaptive_page_size=_value(
+                network,
+                "adaptive_page_size",
+                defaults.adaptive_page_size,
+            ),
+            concurrency=_value(network, "concurrency", defaults.concurrency),
+            requests_per_second=_value(
+                network,
+                "requests_per_second",
+                defaults.requests_per_second,
+            ),
+            media_requests_per_second=_value(
+                network,
+                "media_requests_per_second",
+                defaults.media_requests_per_second,
+            ),
+            shared_rate_limit=_value(
+                network,
+                "shared_rate_limit",
+                defaults.shared_rate_limit,
+            ),
+            response_cache=_value(network, "response_cache", defaults.response_cache),
+            cache_ttl=_value(network, "cache_ttl", defaults.cache_ttl),
+            cache_max_mb=_value(network, "cache_max_mb", defaults.cache_max_mb),
+            memo_ttl=_value(network, "memo_ttl", defaults.memo_ttl),
+            lean_fields=_value(network, "lean_fields", defaults.lean_fields),
+            hydration_budget=_value(network, "hydration_budget", defaults.hydration_budget),
             browser_fallback=_value(
                 browser,
                 "fallback",
                 defaults.browser_fallback,
             ),
             headless=_value(browser, "headless", defaults.headless),
+            block_resources=_value(browser, "block_resources", defaults.block_resources),
+            capture_api=_value(browser, "capture_api", defaults.capture_api),
+            warm_up=_value(browser, "warm_up", defaults.warm_up),
             cdp_url=_value(browser, "cdp_url", defaults.cdp_url),
         )
 
@@ -228,17 +403,41 @@ class ArchiveSettings:
                 "comment_roots": self.comment_roots,
                 "comment_replies": self.comment_replies,
                 "media_download": self.media_download,
+                "streaming": self.streaming,
+                "resume": self.resume,
             },
             "network": {
                 "cookie_file_configured": self.cookie_file is not None,
+                "cookie_files_configured": len(self.cookie_files),
+                "account_quota": self.account_quota,
+                "account_cooldown": self.account_cooldown,
                 "proxy_configured": self.proxy is not None,
+                "proxies_configured": len(self.proxies),
+                "proxy_cooldown": self.proxy_cooldown,
                 "timeout": self.timeout,
                 "retries": self.retries,
+                "retry_budget": self.retry_budget,
+                "circuit_threshold": self.circuit_threshold,
+                "circuit_reset": self.circuit_reset,
                 "page_size": self.page_size,
+                "adaptive_page_size": self.adaptive_page_size,
+                "concurrency": self.concurrency,
+                "requests_per_second": self.requests_per_second,
+                "media_requests_per_second": self.media_requests_per_second,
+                "shared_rate_limit": self.shared_rate_limit,
+                "response_cache": self.response_cache,
+                "cache_ttl": self.cache_ttl,
+                "cache_max_mb": self.cache_max_mb,
+                "memo_ttl": self.memo_ttl,
+                "lean_fields": self.lean_fields,
+                "hydration_budget": self.hydration_budget,
             },
             "browser": {
                 "fallback": self.browser_fallback.value,
                 "headless": self.headless,
+                "block_resources": self.block_resources,
+                "capture_api": self.capture_api,
+                "warm_up": self.warm_up,
                 "cdp_configured": self.cdp_url is not None,
             },
         }
@@ -257,18 +456,59 @@ comments = false
 comment_roots = 10
 comment_replies = 10
 media_download = true
+# 为 true 时问题和专栏边抓边写：每个回答/文章到达即保存文件、媒体和 SQLite，合并文档与目录在最后生成。
+streaming = false
+# 为 true 时问题和专栏的分页进度逐页记入 SQLite，中断后下次运行从上次提交的页继续；--restart 丢弃进度。
+resume = true
 
 [network]
 # Cookie 值不要写进本文件；需要登录态时只填写导出的 Cookie 文件路径。
 # cookie_file = "~/.config/zhihu-scraper/cookies.json"
+# 多个账号时可再列出其他 Cookie 文件，请求会分摊到各账号；被知乎拒绝的账号暂停 account_cooldown 秒。
+# cookie_files = ["~/.config/zhihu-scraper/second.json"]
+# 每个账号每次运行最多发送的请求数；0 表示不限。
+account_quota = 0
+account_cooldown = 600
 # proxy = "http://127.0.0.1:7890"
+# 多个出口时列出其他代理；按延迟和错误选择，连续失败的代理暂停 proxy_cooldown 秒，同一目标始终使用同一个代理。
+# proxies = ["http://127.0.0.1:7891"]
+proxy_cooldown = 120
 timeout = 30.0
 retries = 3
+# 整次运行共享的重试次数上限；连续 circuit_threshold 次网络错误或 5xx 后暂停请求 circuit_reset 秒。
+retry_budget = 50
+circuit_threshold = 5
+circuit_reset = 30
 page_size = 20
+# 为 true 时按接口自动调整分页大小，并把学到的值记在 zhihu.db 中；此时忽略 page_size。
+adaptive_page_size = false
+# 大于 1 时并发请求分页和评论；请保持较小的值以免触发限流。
+concurrency = 1
+# 每秒请求上限；遇到 429 或 Retry-After 时会自动放慢并暂停所有请求。
+requests_per_second = 4.0
+media_requests_per_second = 10.0
+# 为 true 时，写入同一输出目录的多个进程共享限流暂停。
+shared_rate_limit = false
+# 为 true 时把 API 和页面响应缓存到输出目录，cache_ttl 秒内直接复用，过期后用 ETag 重新验证。
+response_cache = false
+cache_ttl = 3600
+cache_max_mb = 256
+# 同一次运行中相同 API 请求合并为一次，成功结果在 memo_ttl 秒内复用；0 表示只合并并发请求。
+memo_ttl = 30
+# 回答接口只请求归档实际用到的字段；字段缺失时自动改用完整字段重试。
+lean_fields = true
+# 问题或专栏中缺少完整正文的条目逐条单独补抓，最多这么多条；超出时整体改用完整字段或浏览器重抓。
+hydration_budget = 20
 
 [browser]
 fallback = "auto"
 headless = false
+# 项目管理的浏览器只读取页面初始状态，不加载图片、视频、字体和统计脚本。
+block_resources = true
+# 问题和专栏回退到浏览器时，滚动页面并直接使用页面自己请求到的回答/文章列表。
+capture_api = true
+# 每次运行开始时在后台预先启动浏览器，回退时省去启动等待；用不到时会在结束时关闭。
+warm_up = false
 # cdp_url = "http://127.0.0.1:9222"
 """
 
@@ -371,6 +611,12 @@ def _path_value(value: object, field_name: str) -> Path:
     return path.expanduser()
 
 
+def _path_list(value: object, field_name: str) -> tuple[Path, ...]:
+    if not isinstance(value, list | tuple):
+        raise SettingsError(f"配置项 {field_name} 必须是路径字符串列表")
+    return tuple(_path_value(item, field_name) for item in value)
+
+
 def _optional_nonempty_string(value: object, field_name: str) -> str | None:
     if value is None:
         return None
@@ -382,15 +628,28 @@ def _optional_nonempty_string(value: object, field_name: str) -> str | None:
     return normalized
 
 
-def _proxy_url(value: object) -> str | None:
-    normalized = _optional_nonempty_string(value, "network.proxy")
+def _proxy_list(value: object) -> tuple[str, ...]:
+    if not isinstance(value, list | tuple):
+        raise SettingsError("配置项 network.proxies 必须是代理地址列表")
+    proxies = []
+    for item in value:
+        if item is None:
+            raise SettingsError("配置项 network.proxies 不能包含空地址")
+        proxy = _proxy_url(item, "network.proxies")
+        if proxy is not None:
+            proxies.append(proxy)
+    return tuple(proxies)
+
+
+def _proxy_url(value: object, field_name: str = "network.proxy") -> str | None:
+    normalized = _optional_nonempty_string(value, field_name)
     if normalized is None:
         return None
     try:
         parsed = urlparse(normalized)
         parsed.port
     except ValueError:
-        raise SettingsError("配置项 network.proxy 必须是有效的 HTTP 或 HTTPS 代理地址") from None
+        raise SettingsError(f"配置项 {field_name} 必须是有效的 HTTP 或 HTTPS 代理地址") from None
     if (
         parsed.scheme not in {"http", "https"}
         or not parsed.hostname
@@ -398,7 +657,7 @@ def _proxy_url(value: object) -> str | None:
         or parsed.query
         or parsed.fragment
     ):
-        raise SettingsError("配置项 network.proxy 必须是有效的 HTTP 或 HTTPS 代理地址")
+        raise SettingsError(f"配置项 {field_name} 必须是有效的 HTTP 或 HTTPS 代理地址")
     return normalized
 
 
@@ -9,12 +9,21 @@ from __future__ import annotations
 
 import json
 import re
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from html import unescape
 from html.parser import HTMLParser
 from typing import Protocol
-from urllib.parse import quote, urlsplit
+from urllib.parse import parse_qs, quote, urlsplit
 
+from zhihu_scraper.http import ServerError, TransportError
+from zhihu_scraper.normalize import ANSWER_INCLUDE_FIELDS
+from zhihu_scraper.paging import AdaptivePageSize, CheckpointStore, PageCursor
 from zhihu_scraper.urls import TargetKind, ZhihuTarget, route_zhihu_url
 
 
@@ -32,11 +41,107 @@ class PaginationLoopError(InvalidZhihuPayloadError):
     """Zhihu pagination did not make forward progress."""
 
 
-class ZhihuSource:
-    """Fetch raw payloads through a small, injectable HTTP interface."""
+@dataclass(frozen=True, slots=True)
+class FieldProjection:
+    """Optional answer fields requested through Zhihu's ``include`` parameter.
+
+    ``full()`` keeps the historical include sets. ``lean()`` asks only for
+    ``ANSWER_INCLUDE_FIELDS``, the fields ``normalize_answer`` reads, plus
+    ``comment_count`` when comments are archived. Article, column and video
+    endpoints take no include list and always return their default shape.
+    """
+
+    answer_fields: tuple[str, ...]
+    question_answer_fields: tuple[str, ...]
+
+    @classmethod
+    def full(cls) -> FieldProjection:
+        return cls(
+            answer_fields=("content", "voteup_count", "question", "author"),
+            question_answer_fields=("content", "voteup_count", "comment_count"),
+        )
+
+    @classmethod
+    def lean(cls, *, comments: bool) -> FieldProjection:
+        fields = (*ANSWER_INCLUDE_FIELDS, *(("comment_count",) if comments else ()))
+        return cls(answer_fields=fields, question_answer_fields=fields)
+
+    @property
+    def is_full(self) -> bool:
+        return self == FieldProjection.full()
+
+    @property
+    def shape(self) -> str:
+        return "full" if self.is_full else "lean"
+
+
+_COLLECTION_ENDPOINTS = {
+    TargetKind.QUESTION: "/api/v4/questions/{}/answers",
+    TargetKind.COLUMN: "/api/v4/columns/{}/items",
+}
+
 
-    def __init__(self, client: _PayloadClient) -> None:
+class ZhihuSource:
+    """Fetch raw payloads through a small, injectable HTTP interface.
+
+    With ``read_ahead`` above zero and a client exposing ``submit_json``,
+    offset-addressable collections request up to that many following pages
+    concurrently while the current page is being consumed. With
+    ``page_sizes`` the requested ``page_size`` is replaced by a per-endpoint
+    size that adapts to latency, failures and server caps. With
+    ``checkpoints`` every collection page is committed as it arrives, and a
+    later crawl of the same collection replays the committed items before
+    continuing from the page after them. Checkpoints older than
+    ``checkpoint_max_age`` are discarded instead of resumed, and reaching the
+    last page discards them as well. With ``resume`` off nothing is committed
+    and a crawl first discards what an earlier run left behind.
+    """
+
+    def __init__(
+        self,
+        client: _PayloadClient,
+        *,
+        read_ahead: int = 0,
+        projection: FieldProjection | None = None,
+        page_sizes: AdaptivePageSize | None = None,
+        checkpoints: CheckpointStore | None = None,
+        resume: bool = True,
+        checkpoint_max_age: timedelta = timedelta(days=1),
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        if read_ahead < 0:
+            raise ValueError("read_ahead must not be negative")
         self._client = client
+        self._read_ahead = read_ahead
+        self._projection = projection or FieldProjection.full()
+        self._page_sizes = page_sizes
+        self._checkpoints = checkpoints
+        self._resume = resume
+        self._checkpoint_max_age = checkpoint_max_age
+        self._clock = clock
+
+    def full_shape(self) -> ZhihuSource:
+        """Return a source requesting the full include sets, or ``self``."""
+
+        if self._projection.is_full:
+            return self
+        return ZhihuSource(
+            self._client,
+            read_ahead=self._read_ahead,
+            projection=FieldProjection.full(),
+            page_sizes=self._page_sizes,
+            checkpoints=self._checkpoints,
+            resume=self._resume,
+            checkpoint_max_age=self._checkpoint_max_age,
+            clock=self._clock,
+        )
+
+    def forget_progress(self, target: ZhihuTarget) -> None:
+        """Discard the crawl checkpoints of ``target``'s collection, if any."""
+
+        template = _COLLECTION_ENDPOINTS.get(target.kind)
+        if self._checkpoints is not None and template is not None:
+            self._checkpoints.clear_checkpoints(template.format(target.content_id))
 
     def fetch_article_payload(
         self,
@@ -59,7 +164,7 @@ class ZhihuSource:
         answer_id = _resolve_reference(answer, TargetKind.ANSWER)
         return _require_mapping(
             self._client.get_json(
-                f"/api/v4/answers/{answer_id}?include=content,voteup_count,question,author"
+                f"/api/v4/answers/{answer_id}?include={','.join(self._projection.answer_fields)}"
             ),
             "回答 API",
         )
@@ -81,20 +186,21 @@ class ZhihuSource:
         page_size: int = 20,
     ) -> Iterator[Mapping[str, object]]:
         question_id = _resolve_reference(question, TargetKind.QUESTION)
-        endpoint = f"/api/v4/questions/{question_id}/answers"
+        endpoint = _COLLECTION_ENDPOINTS[TargetKind.QUESTION].format(question_id)
         include = quote(
-            "data[*].content,voteup_count,comment_count",
+            f"data[*].{','.join(self._projection.question_answer_fields)}",
             safe="",
         )
 
-        def page_url(offset: int) -> str:
+        def page_url(offset: int, limit: int) -> str:
             return (
-                f"{endpoint}?limit={page_size}&offset={offset}"
+                f"{endpoint}?limit={limit}&offset={offset}"
                 f"&platform=desktop&sort_by=default&include={include}"
             )
 
         yield from self._iter_payloads(
             endpoint=endpoint,
+            endpoint_kind="question_answers",
             page_url=page_url,
             page_size=page_size,
             payload_label="问题回答列表",
@@ -117,13 +223,14 @@ class ZhihuSource:
         page_size: int = 20,
     ) -> Iterator[Mapping[str, object]]:
         column_token = _resolve_reference(column, TargetKind.COLUMN)
-        endpoint = f"/api/v4/columns/{column_token}/items"
+        endpoint = _COLLECTION_ENDPOINTS[TargetKind.COLUMN].format(column_token)
 
-        def page_url(offset: int) -> str:
-            return f"{endpoint}?limit={page_size}&offset={offset}"
+        def page_url(offset: int, limit: int) -> str:
+            return f"{endpoint}?limit={limit}&offset={offset}"
 
         yield from self._iter_payloads(
             endpoint=endpoint,
+            endpoint_kind="column_items",
             page_url=page_url,
             page_size=page_size,
             payload_label="专栏文章列表",
@@ -139,77 +246,343 @@ class ZhihuSource:
             "独立视频 API",
         )
 
+    def _resumable_checkpoint(
+        self, endpoint: str, shape: str
+    ) -> tuple[PageCursor, str, list[dict[str, object]]] | None:
+        """Return the cursor, next page and committed items worth resuming."""
+
+        checkpoints = self._checkpoints
+        if checkpoints is None:
+            return None
+        if not self._resume:
+            checkpoints.clear_checkpoints(endpoint)
+            return None
+        checkpoint = checkpoints.load_checkpoint(endpoint, shape)
+        if checkpoint is None:
+            return None
+        cursor, items = checkpoint
+        if (
+            cursor.next_url is None
+            or cursor.saved_at is None
+            or self._clock() - cursor.saved_at > self._checkpoint_max_age
+        ):
+            # Finished or stale progress would replay an outdated collection.
+            checkpoints.clear_checkpoints(endpoint)
+            return None
+        return cursor, cursor.next_url, items
+
     def _iter_payloads(
         self,
         *,
         endpoint: str,
-        page_url: Callable[[int], str],
+        endpoint_kind: str,
+        page_url: Callable[[int, int], str],
         page_size: int,
         payload_label: str,
     ) -> Iterator[Mapping[str, object]]:
+        page_sizes = self._page_sizes
+        if page_sizes is not None:
+            page_size = page_sizes.initial(endpoint_kind)
         if not 1 <= page_size <= 100:
             raise ValueError("分页大小必须在 1 到 100 之间。")
 
         offset = 0
-        current_url = page_url(offset)
+        current_url = page_url(offset, page_size)
         visited_urls: set[str] = set()
         seen_item_ids: set[str] = set()
-
-        while True:
-            if current_url in visited_urls:
-                raise PaginationLoopError(
-                    f"{payload_label}分页返回了重复地址，已停止以避免无限循环。"
-                )
-            visited_urls.add(current_url)
-
-            page = _require_mapping(
-                self._client.get_json(current_url),
-                payload_label,
+        read_ahead = _ReadAhead(self._client, self._read_ahead)
+        total: int | None = None
+        checkpoints = self._checkpoints if self._resume else None
+        shape = self._projection.shape
+        committed_pages = 0
+        page_items: list[Mapping[str, object]] | None = None
+
+        def commit(next_url: str) -> None:
+            nonlocal committed_pages, page_items
+            if checkpoints is None or page_items is None:
+                return
+            committed_pages += 1
+            checkpoints.save_checkpoint_page(
+                endpoint,
+                shape,
+                page_items,
+                PageCursor(next_url, offset, page_size, total, committed_pages, self._clock()),
             )
-            raw_data = page.get("data")
-            if not isinstance(raw_data, list):
-                raise InvalidZhihuPayloadError(f"{payload_label}的 data 字段必须是列表。")
-            for index, item in enumerate(raw_data):
-                if not isinstance(item, Mapping):
-                    raise InvalidZhihuPayloadError(f"{payload_label}第 {index + 1} 项必须是对象。")
-                raw_id = item.get("id")
-                stable_id = (
-                    str(raw_id).strip()
-                    if isinstance(raw_id, (str, int)) and not isinstance(raw_id, bool)
-                    else ""
+            page_items = None
+
+        try:
+            checkpoint = self._resumable_checkpoint(endpoint, shape)
+            if checkpoint is not None:
+                cursor, current_url, items = checkpoint
+                for item in items:
+                    stable_id = _stable_item_id(item)
+                    if stable_id:
+                        seen_item_ids.add(stable_id)
+                    yield item
+                offset, page_size, total = cursor.offset, cursor.page_size, cursor.total
+                committed_pages = cursor.pages
+                if current_url == page_url(offset, page_size):
+                    read_ahead.start(total)
+
+            while True:
+                # The previous page was fully handed out; the cursor now points
+                # at the request that follows it.
+                commit(current_url)
+                if current_url in visited_urls:
+                    raise PaginationLoopError(
+                        f"{payload_label}分页返回了重复地址，已停止以避免无限循环。"
+                    )
+                visited_urls.add(current_url)
+
+                started = time.monotonic()
+                try:
+                    raw_page = read_ahead.get_json(current_url)
+                except (ServerError, TransportError):
+                    smaller = (
+                        page_sizes.failed(endpoint_kind, requested=page_size)
+                        if page_sizes is not None
+                        else None
+                    )
+                    if smaller is None:
+                        raise
+                    # Retry the same offset with a lighter page.
+                    read_ahead.stop()
+                    page_size = smaller
+                    current_url = page_url(offset, page_size)
+                    continue
+                latency = time.monotonic() - started
+                page = _require_mapping(raw_page, payload_label)
+                raw_data = page.get("data")
+                if not isinstance(raw_data, list):
+                    raise InvalidZhihuPayloadError(f"{payload_label}的 data 字段必须是列表。")
+                raw_paging = page.get("paging", {})
+                if not isinstance(raw_paging, Mapping):
+                    raise InvalidZhihuPayloadError(f"{payload_label}的 paging 字段必须是对象。")
+                if offset == 0:
+                    total = _paging_total(raw_paging)
+                    read_ahead.start(total)
+                page_items = []
+                for index, item in enumerate(raw_data):
+                    if not isinstance(item, Mapping):
+                        raise InvalidZhihuPayloadError(
+                            f"{payload_label}第 {index + 1} 项必须是对象。"
+                        )
+                    stable_id = _stable_item_id(item)
+                    if stable_id:
+                        if stable_id in seen_item_ids:
+                            continue
+                        seen_item_ids.add(stable_id)
+                    page_items.append(item)
+                    yield dict(item)
+
+                raw_is_end = raw_paging.get("is_end")
+                if raw_is_end is not None and not isinstance(raw_is_end, bool):
+                    raise InvalidZhihuPayloadError(
+                        f"{payload_label}的 paging.is_end 字段必须是布尔值。"
+                    )
+                is_end = raw_is_end if isinstance(raw_is_end, bool) else len(raw_data) < page_size
+                next_page_size = (
+                    page_sizes.succeeded(
+                        endpoint_kind,
+                        requested=page_size,
+                        returned=len(raw_data),
+                        is_end=is_end,
+                        latency=latency,
+                    )
+                    if page_sizes is not None
+                    else page_size
                 )
-                if stable_id:
-                    if stable_id in seen_item_ids:
-                        continue
-                    seen_item_ids.add(stable_id)
-                yield dict(item)
-
-            raw_paging = page.get("paging", {})
-            if not isinstance(raw_paging, Mapping):
-                raise InvalidZhihuPayloadError(f"{payload_label}的 paging 字段必须是对象。")
-            raw_is_end = raw_paging.get("is_end")
-            if raw_is_end is not None and not isinstance(raw_is_end, bool):
-                raise InvalidZhihuPayloadError(
-                    f"{payload_label}的 paging.is_end 字段必须是布尔值。"
-                )
-            is_end = raw_is_end if isinstance(raw_is_end, bool) else len(raw_data) < page_size
-            if is_end:
-                return
+                if is_end:
+                    # A finished crawl is never resumed; the next one starts
+                    # over with the collection as it is then.
+                    if checkpoints is not None:
+                        checkpoints.clear_checkpoints(endpoint)
+                    return
+
+                offset += len(raw_data)
+                if read_ahead.active and len(raw_data) == page_size:
+                    # Full pages keep offsets predictable, so the next pages were
+                    # already requested from their offsets while this page was
+                    # being consumed.
+                    current_url = page_url(offset, page_size)
+                    read_ahead.schedule(page_url, offset, page_size)
+                    continue
+                read_ahead.stop()
+                if page_sizes is not None and raw_data:
+                    # Adaptive sizing addresses every page by offset itself, so
+                    # Zhihu's ``paging.next`` (which repeats the old limit) is
+                    # not followed. A learned server cap restarts read-ahead.
+                    page_size = next_page_size
+                    current_url = page_url(offset, page_size)
+                    read_ahead.start(total)
+                    continue
+                # A short page means offsets can no longer be predicted; finish
+                # with the sequential ``paging.next`` walk from here.
+                raw_next = raw_paging.get("next")
+                if raw_next is not None and not isinstance(raw_next, str):
+                    raise InvalidZhihuPayloadError(
+                        f"{payload_label}的 paging.next 字段必须是链接。"
+                    )
+                next_url = raw_next.strip() if isinstance(raw_next, str) else ""
+                if next_url:
+                    current_url = _validate_next_url(next_url, endpoint)
+                    continue
+
+                if not raw_data:
+                    raise PaginationLoopError(
+                        f"{payload_label}返回空页但仍标记为未结束，无法继续分页。"
+                    )
+                current_url = page_url(offset, page_size)
+        finally:
+            read_ahead.stop()
+
+
+class _ReadAhead:
+    """Keep the next offset-addressed pages in flight while one is consumed."""
+
+    def __init__(self, client: _PayloadClient, window: int) -> None:
+        submit = getattr(client, "submit_json", None)
+        self._client = client
+        self._submit: Callable[[str], Future[object]] | None = (
+            submit if callable(submit) and window > 0 else None
+        )
+        self._window = window
+        self._total: int | None = None
+        self._pending: dict[str, Future[object]] = {}
+        self._scheduled_until = 0
+        self.active = False
+
+    def start(self, total: int | None) -> None:
+        self.active = self._submit is not None and total is not None
+        self._total = total
+
+    def schedule(
+        self,
+        page_url: Callable[[int, int], str],
+        offset: int,
+        page_size: int,
+    ) -> None:
+        if self._submit is None or self._total is None:
+            return
+        self._scheduled_until = max(self._scheduled_until, offset)
+        last_offset = min(self._total, offset + self._window * page_size)
+        while self._scheduled_until < last_offset:
+            url = page_url(self._scheduled_until, page_size)
+            self._pending[url] = self._submit(url)
+            self._scheduled_until += page_size
+
+    def get_json(self, url: str) -> object:
+        future = self._pending.pop(url, None)
+        if future is None:
+            return self._client.get_json(url)
+        return future.result()
+
+    def stop(self) -> None:
+        self.active = False
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._scheduled_until = 0
+
+
+def _stable_item_id(item: Mapping[str, object]) -> str:
+    raw_id = item.get("id")
+    if isinstance(raw_id, (str, int)) and not isinstance(raw_id, bool):
+        return str(raw_id).strip()
+    return ""
+
+
+def _paging_total(paging: Mapping[str, object]) -> int | None:
+    total = paging.get("totals")
+    if isinstance(total, int) and not isinstance(total, bool) and total >= 0:
+        return total
+    return None
+
 
-            offset += len(raw_data)
-            raw_next = raw_paging.get("next")
-            if raw_next is not None and not isinstance(raw_next, str):
-                raise InvalidZhihuPayloadError(f"{payload_label}的 paging.next 字段必须是链接。")
-            next_url = raw_next.strip() if isinstance(raw_next, str) else ""
-            if next_url:
-                current_url = _validate_next_url(next_url, endpoint)
+class CapturedCollectionSource:
+    """Replay collection pages captured from Zhihu's own page requests.
+
+    Serves the collection iterators of ``ZhihuSource`` from ``(url, payload)``
+    pairs the browser fallback recorded while scrolling. Only pages of the
+    requested endpoint count, and together they must cover the collection
+    from offset 0 through a page marked ``is_end``. Otherwise the iterator
+    raises ``InvalidZhihuPayloadError`` before yielding anything, so the
+    caller can page over HTTP instead of archiving part of a collection.
+
+    The first screen of a page comes from its initial state rather than an
+    API call, so its items can be passed as ``first_screen``. Without a
+    captured page at offset 0 they stand for the offsets before the first
+    captured page, and items repeated in the captured pages are skipped.
+    """
+
+    def __init__(
+        self,
+        pages: Iterable[tuple[str, object]],
+        *,
+        first_screen: Iterable[Mapping[str, object]] = (),
+    ) -> None:
+        self._pages = tuple(pages)
+        self._first_screen = tuple(first_screen)
+
+    def iter_question_answer_payloads(
+        self,
+        question: str | ZhihuTarget,
+        *,
+        page_size: int = 20,
+    ) -> Iterator[Mapping[str, object]]:
+        question_id = _resolve_reference(question, TargetKind.QUESTION)
+        yield from self._items(f"/api/v4/questions/{question_id}/answers", "问题回答列表")
+
+    def iter_column_article_payloads(
+        self,
+        column: str | ZhihuTarget,
+        *,
+        page_size: int = 20,
+    ) -> Iterator[Mapping[str, object]]:
+        column_token = _resolve_reference(column, TargetKind.COLUMN)
+        yield from self._items(f"/api/v4/columns/{column_token}/items", "专栏文章列表")
+
+    def _items(self, endpoint: str, payload_label: str) -> tuple[Mapping[str, object], ...]:
+        pages: dict[int, Mapping[str, object]] = {}
+        for url, raw_page in self._pages:
+            parsed = urlsplit(url)
+            offsets = parse_qs(parsed.query).get("offset", ["0"])
+            if parsed.path != endpoint or not offsets[0].isdigit():
                 continue
+            pages.setdefault(int(offsets[0]), _require_mapping(raw_page, payload_label))
 
-            if not raw_data:
-                raise PaginationLoopError(
-                    f"{payload_label}返回空页但仍标记为未结束，无法继续分页。"
-                )
-            current_url = page_url(offset)
+        items: list[Mapping[str, object]] = []
+        seen_item_ids: set[str] = set()
+        covered = 0
+        if 0 not in pages:
+            for item in self._first_screen:
+                stable_id = _stable_item_id(item)
+                if stable_id in seen_item_ids:
+                    continue
+                if stable_id:
+                    seen_item_ids.add(stable_id)
+                items.append(dict(item))
+            covered = len(self._first_screen)
+        for offset in sorted(pages):
+            if offset > covered:
+                break
+            raw_data = pages[offset].get("data")
+            if not isinstance(raw_data, list) or not all(
+                isinstance(item, Mapping) for item in raw_data
+            ):
+                raise InvalidZhihuPayloadError(f"浏览器捕获的{payload_label}格式无效。")
+            for item in raw_data:
+                stable_id = _stable_item_id(item)
+                if stable_id in seen_item_ids:
+                    continue
+                if stable_id:
+                    seen_item_ids.add(stable_id)
+                items.append(dict(item))
+            covered = max(covered, offset + len(raw_data))
+            paging = pages[offset].get("paging")
+            if isinstance(paging, Mapping) and paging.get("is_end") is True:
+                return tuple(items)
+        raise InvalidZhihuPayloadError(f"浏览器捕获的{payload_label}不完整。")
 
 
 def extract_article_payload(
@@ -235,39 +608,45 @@ def extract_entity_payload(
 
     if not isinstance(document, str):
         raise InvalidZhihuPayloadError("知乎页面 HTML 必须是文本。")
-    if collection not in {"articles", "answers", "questions", "columns", "zvideos"}:
+    if collection not in _ENTITY_COLLECTIONS:
         raise ValueError("unsupported initial-state entity collection")
     normalized_id = str(entity_id)
-    candidates: list[str] = []
-
-    parser = _InitialDataScriptParser()
-    try:
-        parser.feed(document)
-        parser.close()
-    except Exception:
-        # The assignment scanner below may still recover the JSON from malformed
-        # surrounding HTML, so parsing failure is not immediately fatal.
-        pass
-    candidates.extend(parser.documents)
-    candidates.extend(_window_initial_state_documents(document))
 
-    for candidate in candidates:
-        serialized_candidates = [candidate]
-        decoded_candidate = unescape(candidate)
-        if decoded_candidate != candidate:
-            serialized_candidates.append(decoded_candidate)
-        for serialized in serialized_candidates:
-            try:
-                state = json.loads(serialized)
-            except (json.JSONDecodeError, TypeError):
-                continue
-            entity = _find_entity(state, collection, normalized_id)
-            if entity is not None:
-                return entity
+    for state in _initial_states(document):
+        entity = _find_entity(state, collection, normalized_id)
+        if entity is not None:
+            return entity
 
     raise InvalidZhihuPayloadError(f"知乎页面初始状态中未找到 {collection}:{normalized_id}。")
 
 
+def harvest_entities(
+    document: str,
+    collections: Iterable[str],
+) -> dict[str, dict[str, Mapping[str, object]]]:
+    """Collect every entity of the given collections from one initial state.
+
+    The result maps each requested collection to its entities keyed by ID.
+    When an ID appears more than once, the first occurrence wins, as in
+    ``extract_entity_payload``.
+    """
+
+    if not isinstance(document, str):
+        raise InvalidZhihuPayloadError("知乎页面 HTML 必须是文本。")
+    harvested: dict[str, dict[str, Mapping[str, object]]] = {}
+    for collection in collections:
+        if collection not in _ENTITY_COLLECTIONS:
+            raise ValueError("unsupported initial-state entity collection")
+        harvested[collection] = {}
+
+    for state in _initial_states(document):
+        _harvest_collections(state, harvested)
+    return harvested
+
+
+_ENTITY_COLLECTIONS = frozenset({"articles", "answers", "questions", "columns", "zvideos"})
+
+
 def _resolve_reference(
     reference: str | ZhihuTarget,
     expected_kind: TargetKind,
@@ -355,6 +734,107 @@ def _validate_next_url(next_url: str, endpoint: str) -> str:
     return next_url
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Decoded states of the last few pages. Keys are the document's hash and
+# length, so the multi-megabyte HTML itself is not kept alive.
+_INITIAL_STATE_CACHE_SIZE = 4
+_initial_state_cache: OrderedDict[tuple[int, int], tuple[object, ...]] = OrderedDict()
+_initial_state_lock = threading.Lock()
+
+
+def forget_initial_states() -> None:
+    """Drop the decoded page states kept for repeated lookups."""
+
+    with _initial_state_lock:
+        _initial_state_cache.clear()
+
+
+def _initial_states(document: str) -> tuple[object, ...]:
+    """Decode every initial state of one page once, however often it is searched.
+
+    Callers only read the cached states; ``_entity_from_collection`` and
+    ``_entities_in_collection`` copy the entities they return.
+    """
+
+    key = (hash(document), len(document))
+    with _initial_state_lock:
+        cached = _initial_state_cache.get(key)
+        if cached is not None:
+            _initial_state_cache.move_to_end(key)
+            return cached
+    states = _fast_initial_states(document) or _legacy_initial_states(document)
+    with _initial_state_lock:
+        _initial_state_cache[key] = states
+        while len(_initial_state_cache) > _INITIAL_STATE_CACHE_SIZE:
+            _initial_state_cache.popitem(last=False)
+    return states
+
+
+def _fast_initial_states(document: str) -> tuple[object, ...]:
+    """Decode initial states in place, without tokenizing the surrounding HTML.
+
+    Zhihu embeds the state as raw JSON, so each payload is found with plain
+    substring searches and decoded with ``raw_decode`` at its first brace.
+    """
+
+    starts: list[int] = []
+    marker = document.find("js-initialData")
+    while marker >= 0:
+        tag_start = document.rfind("<", 0, marker)
+        tag_end = document.find(">", marker)
+        if (
+            tag_start >= 0
+            and tag_end >= 0
+            and document[tag_start + 1 : tag_start + 7].casefold() == "script"
+        ):
+            starts.append(tag_end + 1)
+        marker = document.find("js-initialData", marker + 1)
+    for assignment in _INITIAL_STATE_ASSIGNMENT.finditer(document):
+        starts.append(assignment.end())
+
+    states: list[object] = []
+    for start in starts:
+        brace = document.find("{", start)
+        if brace < 0 or document[start:brace].strip():
+            continue
+        try:
+            state, _end = _JSON_DECODER.raw_decode(document, brace)
+        except json.JSONDecodeError:
+            continue
+        states.append(state)
+    return tuple(states)
+
+
+def _legacy_initial_states(document: str) -> tuple[object, ...]:
+    """Tolerant fallback for entity-escaped or unusually wrapped states."""
+
+    candidates: list[str] = []
+    parser = _InitialDataScriptParser()
+    try:
+        parser.feed(document)
+        parser.close()
+    except Exception:
+        # The assignment scanner below may still recover the JSON from malformed
+        # surrounding HTML, so parsing failure is not immediately fatal.
+        pass
+    candidates.extend(parser.documents)
+    candidates.extend(_window_initial_state_documents(document))
+
+    states: list[object] = []
+    for candidate in candidates:
+        serialized_candidates = [candidate]
+        decoded_candidate = unescape(candidate)
+        if decoded_candidate != candidate:
+            serialized_candidates.append(decoded_candidate)
+        for serialized in serialized_candidates:
+            try:
+                states.append(json.loads(serialized))
+            except (json.JSONDecodeError, TypeError):
+                continue
+    return tuple(states)
+
+
 class _InitialDataScriptParser(HTMLParser):
     def __init__(self) -> None:
         super().__init__(convert_charrefs=False)
@@ -451,6 +931,34 @@ def _find_entity(
     return None
 
 
+def _harvest_collections(
+    value: object,
+    harvested: dict[str, dict[str, Mapping[str, object]]],
+) -> None:
+    if isinstance(value, Mapping):
+        for collection_name, entities in harvested.items():
+            for entity_id, entity in _entities_in_collection(value.get(collection_name)):
+                entities.setdefault(entity_id, entity)
+        for nested in value.values():
+            _harvest_collections(nested, harvested)
+    elif isinstance(value, list):
+        for nested in value:
+            _harvest_collections(nested, harvested)
+
+
+def _entities_in_collection(
+    collection: object,
+) -> Iterator[tuple[str, Mapping[str, object]]]:
+    if isinstance(collection, Mapping):
+        for key, candidate in collection.items():
+            if isinstance(candidate, Mapping):
+                yield str(key), dict(candidate)
+    elif isinstance(collection, list):
+        for candidate in collection:
+            if isinstance(candidate, Mapping) and candidate.get("id") is not None:
+                yield str(candidate["id"]), dict(candidate)
+
+
 def _entity_from_collection(
     collection: object,
     entity_id: str,